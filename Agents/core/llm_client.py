@@ -2,19 +2,119 @@ import os
 import openai
 import logging
 import time
-import yaml
-from openai import OpenAI, AzureOpenAI, RateLimitError, APIError
+from openai import OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI, RateLimitError, APIError
 from openai.types.chat import ChatCompletionMessageParam
-import anthropic
-from cryptography.fernet import Fernet
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
+import json
+import random
+import re
+import importlib.util
+import itertools
 import threading
+from enum import Enum
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
+
+from agents.core.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
-from enum import Enum
-from typing import Optional, Dict, Any, List, Tuple
+# yaml, cryptography and anthropic are imported lazily: each is only needed
+# for a config file, an encrypted key or the Anthropic provider respectively
+_YamlLoader = None
+_anthropic = None
+
+# ${VAR} or ${VAR:default} inside YAML string values, as in global_config.yaml
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+
+def _get_yaml_loader():
+    """libyaml's C parser when available, pure-Python SafeLoader otherwise"""
+    global _YamlLoader
+    if _YamlLoader is None:
+        import yaml
+        _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return _YamlLoader
+
+def _references_env(value: Any) -> bool:
+    """Whether any string in value contains a ${...} placeholder"""
+    if isinstance(value, str):
+        return '${' in value
+    if isinstance(value, dict):
+        return any(_references_env(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_references_env(v) for v in value)
+    return False
+
+def _interpolate_env(value: Any) -> Any:
+    """Expand ${VAR} / ${VAR:default} in string values, rebuilding containers"""
+    if isinstance(value, str):
+        return _ENV_VAR_PATTERN.sub(lambda m: os.getenv(m.group(1), m.group(2) or ''), value)
+    if isinstance(value, dict):
+        return {k: _interpolate_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_interpolate_env(v) for v in value]
+    return value
+
+@functools.lru_cache(maxsize=16)
+def _read_config_cached(config_path: str, mtime: float) -> Tuple[Dict[str, Any], bool]:
+    """Parsed llm section of a config file and whether it references env vars.
+
+    Keyed on mtime so an edited file is re-read; env vars are expanded by the
+    caller so changes to the environment are never served stale.
+    """
+    import yaml
+    with open(config_path, 'r') as f:
+        config_data = yaml.load(f, Loader=_get_yaml_loader()) or {}
+    llm_config = config_data.get('globals', {}).get('llm', {})
+    # Placeholders elsewhere in the file (e.g. the database section) do not
+    # concern the llm section
+    return llm_config, _references_env(llm_config)
+
+@functools.lru_cache(maxsize=4)
+def _make_fernet(encryption_key: str):
+    """Fernet instance per encryption key, built once per process"""
+    from cryptography.fernet import Fernet
+    return Fernet(encryption_key.encode())
+
+def _get_anthropic():
+    global _anthropic
+    if _anthropic is None:
+        import anthropic
+        _anthropic = anthropic
+    return _anthropic
+
+# HTTP/2 needs the optional 'h2' package; httpx raises at client construction without it
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Row-marshaled batching: several prompts share one request, answers come back
+# split on a sentinel. Gains flatten out past ~10-20 items per request.
+_BATCH_SEPARATOR = "<<<SEP>>>"
+_MAX_BATCH_SIZE = 20
+
+# Per-token (input, output) USD rates per provider, derived from per-1M-token
+# list prices as of 2024-05-15: gpt-4o for OpenAI/Azure, Claude 3 Opus for Anthropic.
+# This should be updated as models and pricing change.
+_PRICING: Dict[str, Tuple[float, float]] = {
+    provider: (input_per_million / 1_000_000, output_per_million / 1_000_000)
+    for provider, (input_per_million, output_per_million) in {
+        'openai': (5.00, 15.00),
+        'azure_openai': (5.00, 15.00),
+        'anthropic': (15.00, 75.00),
+    }.items()
+}
+# Anthropic prompt-cache reads bill at 10% of the input rate, cache writes at 125%
+_CACHE_READ_MULTIPLIER = 0.10
+_CACHE_WRITE_MULTIPLIER = 1.25
+
+# Provider batch APIs (OpenAI /v1/batches, Anthropic Message Batches) bill at half price
+_OFFLINE_BATCH_DISCOUNT = 0.5
+# Earliest Azure OpenAI API version that accepts stream_options (usage on the final chunk)
+_AZURE_STREAM_USAGE_MIN_VERSION = '2024-09-01'
+_OPENAI_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 class LLMProvider(Enum):
     OPENAI = "openai"
@@ -22,35 +122,128 @@ class LLMProvider(Enum):
     AZURE_OPENAI = "azure_openai"
     MOCK = "mock"
 
+def _make_cache_key(model: str, system_message: Optional[str], prompt: str, temperature: float,
+                    max_tokens: int, stop_sequences: Optional[List[str]]) -> bytes:
+    """Digest of every request parameter that can change the completion"""
+    raw = "\x1f".join((
+        model, system_message or "", prompt, repr(temperature), str(max_tokens),
+        "\x1e".join(stop_sequences or ())
+    ))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).digest()
+
+class _SemanticCacheIndex:
+    """Nearest-neighbour lookup of cached responses by prompt embedding.
+
+    Entries are partitioned by a context key (model, system message and
+    generation parameters) so only prompts asked under identical settings can
+    match. Embeddings are L2-normalised, so a dot product is cosine similarity.
+    """
+
+    def __init__(self, threshold: float = 0.98, maxsize: int = 1000):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._partitions: Dict[bytes, Tuple[Any, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(embedding: List[float]) -> Any:
+        import numpy as np
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, context_key: bytes, vector: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            partition = self._partitions.get(context_key)
+            if partition is None:
+                return None
+            matrix, results = partition
+            similarities = matrix @ vector
+            best = int(similarities.argmax())
+            return results[best] if similarities[best] >= self.threshold else None
+
+    def add(self, context_key: bytes, vector: Any, result: Dict[str, Any]) -> None:
+        import numpy as np
+        with self._lock:
+            partition = self._partitions.get(context_key)
+            if partition is None:
+                matrix, results = vector[np.newaxis, :], [result]
+            else:
+                matrix, results = partition
+                matrix = np.vstack((matrix, vector))
+                results = results + [result]
+                if len(results) > self.maxsize:
+                    matrix, results = matrix[1:], results[1:]
+            self._partitions[context_key] = (matrix, results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+
 class LLMClient:
     """Production-ready LLM client with security, retry logic, and synchronous calls"""
     
     def __init__(self, config: Optional[Dict[str, Any]] = None, config_path: Optional[str] = None):
         self.config = config if config is not None else self._load_config(config_path)
         self.provider = LLMProvider(self.config.get('provider', 'openai'))
-        self.api_key = self._get_secure_api_key()
+        # LLM_API_KEYS (comma-separated) shards calls across several keys/accounts
+        self.api_keys = self._get_secure_api_keys()
+        self.api_key = self.api_keys[0]
         self.model = self.config.get('model', 'gpt-4')
         self.temperature = self.config.get('temperature', 0.1)
         self.max_tokens = self.config.get('max_tokens', 4096)
         self.timeout = self.config.get('timeout', 60)
         self.retry_attempts = self.config.get('retry_attempts', 3)
         self.retry_delay = self.config.get('retry_delay', 1)
+        self.seed = self.config.get('seed')
+        self._input_per_token, self._output_per_token = _PRICING.get(self.provider.value, (0.0, 0.0))
+
+        # Response cache; only deterministic (temperature == 0) calls are served from it
+        self.cache_enabled = self.config.get('cache_enabled', True)
+        self._cache = TTLCache(
+            maxsize=self.config.get('cache_max_size', 10000),
+            ttl=self.config.get('cache_ttl_seconds', 3600)
+        )
+        # Optional semantic layer behind the exact cache: paraphrased prompts whose
+        # embedding is close enough to a cached one reuse its response. Needs an
+        # embeddings endpoint, so it only applies to OpenAI/Azure providers.
+        self.semantic_cache_enabled = self.config.get('semantic_cache', False) and \
+            self.provider in (LLMProvider.OPENAI, LLMProvider.AZURE_OPENAI)
+        self.embedding_model = self.config.get('embedding_model', 'text-embedding-3-small')
+        self._semantic_cache = _SemanticCacheIndex(
+            threshold=self.config.get('semantic_cache_threshold', 0.98),
+            maxsize=self.config.get('semantic_cache_max_size', 1000)
+        )
+        # Anthropic server-side prompt caching for long system messages
+        # (~4 chars/token; the provider ignores prefixes under ~1024 tokens)
+        self.cache_system = self.config.get('cache_system', True)
+        self.cache_system_min_chars = self.config.get('cache_system_min_chars', 4096)
         
-        # Thread pool for sync calls
-        self._executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="llm_client")
-        self._lock = threading.Lock()
+        # Bound in-flight requests rather than the whole retry loop. To saturate
+        # a rate limit without tripping it, size this near rpm_limit / 60 *
+        # avg_latency_seconds (e.g. 500 RPM at ~6s per call ~= 50 concurrent)
+        self.max_concurrent_requests = self.config.get('max_concurrent_requests', min(64, 4 * (os.cpu_count() or 1)))
+        rpm_limit = self.config.get('rpm_limit')
+        if rpm_limit:
+            sustainable = rpm_limit / 60 * self.config.get('avg_latency_seconds', 6)
+            if self.max_concurrent_requests > sustainable:
+                logger.warning("max_concurrent_requests=%d exceeds the ~%.0f concurrent calls %d RPM sustains; expect 429s",
+                               self.max_concurrent_requests, sustainable, rpm_limit)
+        self._inflight_sem = threading.BoundedSemaphore(self.max_concurrent_requests)
+        self._async_inflight_sem: Optional[asyncio.Semaphore] = None
+        self._async_inflight_loop = None
         
         # Initialize provider client
         self._init_provider_client()
         
-        logger.info(f"LLMClient initialized with provider: {self.provider.value}, model: {self.model}")
+        logger.info("LLMClient initialized with provider: %s, model: %s", self.provider.value, self.model)
 
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load configuration from YAML file or environment variables"""
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-                return config_data.get('globals', {}).get('llm', {})
+            llm_config, uses_env = _read_config_cached(config_path, os.path.getmtime(config_path))
+            # Copy even without interpolation: the cached dict is shared
+            return _interpolate_env(llm_config) if uses_env else copy.deepcopy(llm_config)
         
         # Fallback to environment variables
         provider_str = os.getenv('LLM_PROVIDER', 'openai').lower()
@@ -68,159 +261,703 @@ class LLMClient:
             'retry_delay': int(os.getenv('LLM_RETRY_DELAY', '1'))
         }
 
-    def _get_secure_api_key(self) -> str:
-        """Securely retrieve API key with encryption support"""
-        api_key = os.getenv('LLM_API_KEY')
-        if not api_key:
+    def _get_secure_api_keys(self) -> List[str]:
+        """Securely retrieve API keys with encryption support.
+
+        LLM_API_KEYS holds a comma-separated list of keys to shard requests
+        across; otherwise the single LLM_API_KEY is used.
+        """
+        raw_keys = [key.strip() for key in os.getenv('LLM_API_KEYS', '').split(',') if key.strip()]
+        if not raw_keys and os.getenv('LLM_API_KEY'):
+            raw_keys = [os.getenv('LLM_API_KEY')]
+        if self.provider == LLMProvider.MOCK:
+            return raw_keys or [""]  # Mock client doesn't need external API key
+        if not raw_keys:
             raise ValueError(f"LLM_API_KEY environment variable not set for provider {self.provider.value}")
-        
+        return [self._decrypt_api_key(api_key) for api_key in raw_keys]
+
+    def _decrypt_api_key(self, api_key: str) -> str:
         # Check if key is encrypted
         encryption_key = os.getenv('LLM_KEY_ENCRYPTION_KEY')
-        if encryption_key and api_key.startswith('gAAAAAA'):  # Fernet token prefix
+        if encryption_key and api_key.startswith('gAAAAA'):  # Fernet token prefix (version byte + timestamp)
             try:
-                fernet = Fernet(encryption_key.encode())
+                fernet = _make_fernet(encryption_key)
                 api_key = fernet.decrypt(api_key.encode()).decode()
                 logger.debug("API key decrypted successfully")
             except Exception as e:
-                logger.error(f"Failed to decrypt API key: {e}")
+                logger.error("Failed to decrypt API key: %s", e)
                 raise ValueError("Invalid encrypted API key")
         
         return api_key
 
     def _init_provider_client(self):
-        """Initialize the appropriate provider client"""
+        """Initialize the provider clients (sync and native async), one pair per API key"""
+        self.async_client = None
+        self._http_clients = []
+        self._async_http_clients = []
+        self.azure_api_version = os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-01')
+        self._client_pool: List[Tuple[Any, Any]] = []
+        self._retryable_errors = (openai.RateLimitError, openai.APIError)
+        if self.provider == LLMProvider.MOCK:
+            self.client = MockLLMClient(model=self.model)
+            return
+        if self.provider not in (LLMProvider.OPENAI, LLMProvider.AZURE_OPENAI, LLMProvider.ANTHROPIC):
+            raise ValueError(f"Unsupported provider: {self.provider.value}")
+        if self.provider == LLMProvider.ANTHROPIC:
+            self._retryable_errors += (_get_anthropic().APIError,)
+
+        # Optional per-key Azure endpoints (AZURE_OPENAI_ENDPOINTS, comma-separated)
+        endpoints = [e.strip() for e in os.getenv('AZURE_OPENAI_ENDPOINTS', '').split(',') if e.strip()]
+        self._client_pool = [
+            self._create_provider_clients(api_key, endpoints[i % len(endpoints)] if endpoints else os.getenv('AZURE_OPENAI_ENDPOINT'))
+            for i, api_key in enumerate(self.api_keys)
+        ]
+        self.client, self.async_client = self._client_pool[0]
+        # Round-robin cursor and per-key rate-limit cooldown deadlines (time.monotonic)
+        self._client_rr = itertools.count()
+        self._client_cooldown_until = [0.0] * len(self._client_pool)
+
+    def _create_provider_clients(self, api_key: str, azure_endpoint: Optional[str]) -> Tuple[Any, Any]:
+        """Sync and async SDK clients for one API key"""
         if self.provider == LLMProvider.OPENAI:
-            self.client = openai.OpenAI(
-                api_key=self.api_key,
-                timeout=self.timeout
+            return (
+                openai.OpenAI(api_key=api_key, timeout=self.timeout, http_client=self._build_http_client(openai)),
+                AsyncOpenAI(api_key=api_key, timeout=self.timeout, http_client=self._build_async_http_client(openai))
             )
-        elif self.provider == LLMProvider.AZURE_OPENAI:
-            self.client = AzureOpenAI(
-                api_key=self.api_key,
-                azure_endpoint=os.getenv('AZURE_OPENAI_ENDPOINT'),
-                api_version=os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-01'),
-                timeout=self.timeout
+        if self.provider == LLMProvider.AZURE_OPENAI:
+            api_version = self.azure_api_version
+            return (
+                AzureOpenAI(
+                    api_key=api_key,
+                    azure_endpoint=azure_endpoint,
+                    api_version=api_version,
+                    timeout=self.timeout,
+                    http_client=self._build_http_client(openai)
+                ),
+                AsyncAzureOpenAI(
+                    api_key=api_key,
+                    azure_endpoint=azure_endpoint,
+                    api_version=api_version,
+                    timeout=self.timeout,
+                    http_client=self._build_async_http_client(openai)
+                )
             )
+        anthropic = _get_anthropic()
+        return (
+            anthropic.Anthropic(api_key=api_key, timeout=self.timeout, http_client=self._build_http_client(anthropic)),
+            anthropic.AsyncAnthropic(api_key=api_key, timeout=self.timeout, http_client=self._build_async_http_client(anthropic))
+        )
+
+    def _pick_client_index(self) -> Optional[int]:
+        """Round-robin over the key pool, skipping keys still cooling down after a 429.
+
+        Returns None with a single key, in which case self.client/self.async_client are used.
+        """
+        pool_size = len(self._client_pool)
+        if pool_size <= 1:
+            return None
+        now = time.monotonic()
+        start = next(self._client_rr)
+        for offset in range(pool_size):
+            index = (start + offset) % pool_size
+            if self._client_cooldown_until[index] <= now:
+                return index
+        # Every key is throttled: use the one that recovers first
+        return min(range(pool_size), key=self._client_cooldown_until.__getitem__)
+
+    def _pooled_clients(self, index: Optional[int]) -> Tuple[Any, Any]:
+        if index is None:
+            return self.client, self.async_client
+        return self._client_pool[index]
+
+    def _mark_throttled(self, index: Optional[int], error: Exception, wait_time: float) -> bool:
+        """Put a rate-limited key on cooldown; True when another key can be tried right away"""
+        if index is None or getattr(error, 'status_code', None) != 429:
+            return False
+        now = time.monotonic()
+        self._client_cooldown_until[index] = now + wait_time
+        return any(until <= now for until in self._client_cooldown_until)
+
+    def _build_http_client(self, sdk):
+        """Keep-alive connection pool so sequential calls skip the TCP+TLS handshake.
+
+        Built through the SDK's own DefaultHttpxClient so the pool matches the
+        httpx flavour that SDK version expects.
+        """
+        limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+        http_client = sdk.DefaultHttpxClient(
+            timeout=self.timeout,
+            http2=self.config.get('http2', True) and _HTTP2_AVAILABLE,
+            limits=limits_cls(
+                max_keepalive_connections=self.config.get('max_keepalive_connections', 32),
+                max_connections=self.config.get('max_connections', 64),
+                keepalive_expiry=self.config.get('keepalive_expiry', 300.0)
+            )
+        )
+        self._http_clients.append(http_client)
+        return http_client
+
+    def _build_async_http_client(self, sdk):
+        """Shared async connection pool so concurrent coroutines reuse connections"""
+        limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+        http_client = sdk.DefaultAsyncHttpxClient(
+            timeout=self.timeout,
+            http2=self.config.get('http2', True) and _HTTP2_AVAILABLE,
+            limits=limits_cls(
+                max_connections=self.config.get('async_max_connections', 200),
+                max_keepalive_connections=self.config.get('async_max_keepalive_connections', 100),
+                keepalive_expiry=self.config.get('keepalive_expiry', 300.0)
+            )
+        )
+        self._async_http_clients.append(http_client)
+        return http_client
+
+    def generate_text_sync(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                           stream: bool = False, temperature: Optional[float] = None,
+                           max_tokens: Optional[int] = None) -> Union[Dict[str, Any], Iterator[str]]:
+        """Synchronous text generation with retry logic.
+
+        temperature and max_tokens override the configured values for this call.
+        With stream=True, returns the iterator from generate_text_stream instead
+        of a result dict.
+        """
+        if stream:
+            return self.generate_text_stream(prompt, system_message=system_message, stop_sequences=stop_sequences,
+                                             temperature=temperature, max_tokens=max_tokens)
+
+        temperature = self.temperature if temperature is None else temperature
+        max_tokens = self.max_tokens if max_tokens is None else max_tokens
+        cache_key = self._response_cache_key(prompt, system_message, stop_sequences, temperature, max_tokens)
+        semantic_key = semantic_vector = None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return self._cached_response(cached)
+            if self.semantic_cache_enabled:
+                semantic_key = _make_cache_key(self.model, system_message, "", temperature, max_tokens, stop_sequences)
+                try:
+                    semantic_vector = self._embed_prompt(prompt)
+                except Exception as e:
+                    # The semantic cache is only an optimization; generate without it
+                    logger.warning("Prompt embedding failed (%s), bypassing the semantic cache", e)
+                else:
+                    cached = self._semantic_cache.lookup(semantic_key, semantic_vector)
+                    if cached is not None:
+                        return self._cached_response(cached)
+
+        for attempt in range(self.retry_attempts):
+            client_index = None
+            try:
+                start_time = time.time()
+                generated_text, tokens_used, cost_usd = "", 0, 0.0
+
+                client_index = self._pick_client_index()
+                client = self._pooled_clients(client_index)[0]
+                if self.provider == LLMProvider.OPENAI or self.provider == LLMProvider.AZURE_OPENAI:
+                    with self._inflight_sem:
+                        generated_text, tokens_used, cost_usd = self._generate_text_openai_internal(prompt, system_message, stop_sequences, temperature, max_tokens, client)
+                elif self.provider == LLMProvider.ANTHROPIC:
+                    with self._inflight_sem:
+                        generated_text, tokens_used, cost_usd = self._generate_text_anthropic_internal(prompt, system_message, stop_sequences, temperature, max_tokens, client)
+                elif self.provider == LLMProvider.MOCK:
+                    generated_text, tokens_used, cost_usd = self._generate_text_mock(prompt, system_message, stop_sequences)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider.value}")
+
+                execution_time = time.time() - start_time
+                logger.info("LLM call successful - Tokens: %d, Cost: $%.4f, Time: %.2fs", tokens_used, cost_usd, execution_time)
+
+                result = self._build_result(generated_text, tokens_used, cost_usd, execution_time)
+                if cache_key is not None:
+                    self._cache.set(cache_key, result)
+                if semantic_vector is not None:
+                    self._semantic_cache.add(semantic_key, semantic_vector, result)
+                return result
+
+            except self._retryable_errors as e:
+                wait_time = self._retry_wait_time(attempt, e)
+                if self._mark_throttled(client_index, e, wait_time):
+                    wait_time = 0.0  # another key has headroom, retry on it immediately
+                logger.warning("API error (%s) on attempt %d/%d, waiting %.2fs", type(e).__name__, attempt + 1, self.retry_attempts, wait_time)
+                if attempt < self.retry_attempts - 1:
+                    time.sleep(wait_time)
+                else:
+                    logger.error("API error (%s) after %d attempts", type(e).__name__, self.retry_attempts)
+                    raise
+            except Exception as e:
+                logger.error("Unexpected error on attempt %d: %s", attempt + 1, e)
+                if attempt < self.retry_attempts - 1:
+                    time.sleep(self.retry_delay)
+                else:
+                    raise
+
+    async def generate_text_async(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                                  temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Native asynchronous text generation with retry logic.
+
+        Awaits the provider's async client directly, so concurrent callers share
+        one connection pool instead of queueing on a thread pool and lock.
+        temperature and max_tokens override the configured values for this call.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        max_tokens = self.max_tokens if max_tokens is None else max_tokens
+        cache_key = self._response_cache_key(prompt, system_message, stop_sequences, temperature, max_tokens)
+        semantic_key = semantic_vector = None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return self._cached_response(cached)
+            if self.semantic_cache_enabled:
+                semantic_key = _make_cache_key(self.model, system_message, "", temperature, max_tokens, stop_sequences)
+                try:
+                    semantic_vector = await self._embed_prompt_async(prompt)
+                except Exception as e:
+                    # The semantic cache is only an optimization; generate without it
+                    logger.warning("Prompt embedding failed (%s), bypassing the semantic cache", e)
+                else:
+                    cached = self._semantic_cache.lookup(semantic_key, semantic_vector)
+                    if cached is not None:
+                        return self._cached_response(cached)
+
+        for attempt in range(self.retry_attempts):
+            client_index = None
+            try:
+                start_time = time.time()
+                generated_text, tokens_used, cost_usd = "", 0, 0.0
+
+                client_index = self._pick_client_index()
+                client = self._pooled_clients(client_index)[1]
+                if self.provider == LLMProvider.OPENAI or self.provider == LLMProvider.AZURE_OPENAI:
+                    async with self._async_semaphore():
+                        generated_text, tokens_used, cost_usd = await self._generate_text_openai_async(prompt, system_message, stop_sequences, temperature, max_tokens, client)
+                elif self.provider == LLMProvider.ANTHROPIC:
+                    async with self._async_semaphore():
+                        generated_text, tokens_used, cost_usd = await self._generate_text_anthropic_async(prompt, system_message, stop_sequences, temperature, max_tokens, client)
+                elif self.provider == LLMProvider.MOCK:
+                    generated_text, tokens_used, cost_usd = self._generate_text_mock(prompt, system_message, stop_sequences)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider.value}")
+
+                execution_time = time.time() - start_time
+                logger.info("LLM async call successful - Tokens: %d, Cost: $%.4f, Time: %.2fs", tokens_used, cost_usd, execution_time)
+
+                result = self._build_result(generated_text, tokens_used, cost_usd, execution_time)
+                if cache_key is not None:
+                    self._cache.set(cache_key, result)
+                if semantic_vector is not None:
+                    self._semantic_cache.add(semantic_key, semantic_vector, result)
+                return result
+
+            except self._retryable_errors as e:
+                wait_time = self._retry_wait_time(attempt, e)
+                if self._mark_throttled(client_index, e, wait_time):
+                    wait_time = 0.0  # another key has headroom, retry on it immediately
+                logger.warning("API error (%s) on attempt %d/%d, waiting %.2fs", type(e).__name__, attempt + 1, self.retry_attempts, wait_time)
+                if attempt < self.retry_attempts - 1:
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error("API error (%s) after %d attempts", type(e).__name__, self.retry_attempts)
+                    raise
+            except Exception as e:
+                logger.error("Unexpected error on attempt %d: %s", attempt + 1, e)
+                if attempt < self.retry_attempts - 1:
+                    await asyncio.sleep(self.retry_delay)
+                else:
+                    raise
+
+    def generate_text_stream(self, prompt: str, system_message: Optional[str] = None,
+                             stop_sequences: Optional[List[str]] = None, temperature: Optional[float] = None,
+                             max_tokens: Optional[int] = None) -> Iterator[str]:
+        """Yield the completion as text deltas while the provider generates it.
+
+        Callers can start consuming after the first token instead of waiting for
+        the whole completion. Usage and cost are logged once the stream ends.
+        Streams are not retried and bypass the response cache.
+        """
+        start_time = time.time()
+        tokens_used, cost_usd = 0, 0.0
+
+        # The in-flight slot only covers opening the stream, so a caller that
+        # abandons the generator part-way does not keep holding it
+        if self.provider == LLMProvider.OPENAI or self.provider == LLMProvider.AZURE_OPENAI:
+            with self._inflight_sem:
+                client = self._pooled_clients(self._pick_client_index())[0]
+                response = client.chat.completions.create(
+                    **self._openai_request(prompt, system_message, stop_sequences, temperature, max_tokens),
+                    **self._stream_usage_options()
+                )
+            with contextlib.closing(response):
+                for chunk in response:
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            yield delta
+                    if chunk.usage is not None:
+                        tokens_used = chunk.usage.total_tokens
+                        cost_usd = self._calculate_openai_cost(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
         elif self.provider == LLMProvider.ANTHROPIC:
-            self.client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout)
+            with contextlib.ExitStack() as stack:
+                with self._inflight_sem:
+                    client = self._pooled_clients(self._pick_client_index())[0]
+                    response = stack.enter_context(client.messages.stream(
+                        **self._anthropic_request(prompt, system_message, stop_sequences, temperature, max_tokens)
+                    ))
+                for text in response.text_stream:
+                    yield text
+                tokens_used, cost_usd = self._anthropic_usage(response.get_final_message().usage)
         elif self.provider == LLMProvider.MOCK:
-            self.client = MockLLMClient(config_path=None) # Mock client doesn't need external API key
+            generated_text, tokens_used, cost_usd = self._generate_text_mock(prompt, system_message, stop_sequences)
+            yield generated_text
         else:
             raise ValueError(f"Unsupported provider: {self.provider.value}")
 
-    def generate_text_sync(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Synchronous text generation with retry logic"""
-        with self._lock:
-            for attempt in range(self.retry_attempts):
-                try:
-                    start_time = time.time()
-                    generated_text, tokens_used, cost_usd = "", 0, 0.0
-
-                    if self.provider == LLMProvider.OPENAI or self.provider == LLMProvider.AZURE_OPENAI:
-                        generated_text, tokens_used, cost_usd = self._generate_text_openai_internal(prompt, system_message, stop_sequences)
-                    elif self.provider == LLMProvider.ANTHROPIC:
-                        generated_text, tokens_used, cost_usd = self._generate_text_anthropic_internal(prompt, system_message, stop_sequences)
-                    elif self.provider == LLMProvider.MOCK:
-                        result = self.client.generate_text_sync(prompt, system_message=system_message, stop_sequences=stop_sequences)
-                        generated_text = result["text"]
-                        tokens_used = result["tokens_used"]
-                        cost_usd = result["cost_usd"]
-                    else:
-                        raise ValueError(f"Unsupported provider: {self.provider.value}")
-
-                    execution_time = time.time() - start_time
-                    logger.info(f"LLM call successful - Tokens: {tokens_used}, Cost: ${cost_usd:.4f}, Time: {execution_time:.2f}s")
-
-                    return {
-                        "text": generated_text,
-                        "tokens_used": tokens_used,
-                        "cost_usd": cost_usd,
-                        "execution_time_seconds": execution_time,
-                        "model": self.model,
-                        "provider": self.provider.value
+        execution_time = time.time() - start_time
+        logger.info("LLM stream complete - Tokens: %d, Cost: $%.4f, Time: %.2fs", tokens_used, cost_usd, execution_time)
+
+    def _stream_usage_options(self) -> Dict[str, Any]:
+        """Streaming kwargs for chat.completions.create, asking for usage where the API supports it"""
+        if self.provider == LLMProvider.AZURE_OPENAI and self.azure_api_version < _AZURE_STREAM_USAGE_MIN_VERSION:
+            return {"stream": True}
+        return {"stream": True, "stream_options": {"include_usage": True}}
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        """Per-event-loop counterpart of _inflight_sem for the native async path"""
+        loop = asyncio.get_running_loop()
+        if self._async_inflight_loop is not loop:
+            self._async_inflight_sem = asyncio.Semaphore(self.max_concurrent_requests)
+            self._async_inflight_loop = loop
+        return self._async_inflight_sem
+
+    def _retry_wait_time(self, attempt: int, error: Exception) -> float:
+        """Decorrelated-jitter backoff that never undercuts the server's Retry-After"""
+        retry_after = 0.0
+        response = getattr(error, 'response', None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('retry-after', 0))
+            except (TypeError, ValueError):
+                retry_after = 0.0  # HTTP-date form is not worth parsing here
+        jittered = random.uniform(self.retry_delay, self.retry_delay * 3 * (2 ** attempt))
+        return max(retry_after, jittered)
+
+    def _response_cache_key(self, prompt: str, system_message: Optional[str], stop_sequences: Optional[List[str]],
+                            temperature: float, max_tokens: int) -> Optional[bytes]:
+        """Cache key for this request, or None when the call must not be cached"""
+        if not self.cache_enabled or temperature != 0:
+            return None
+        return _make_cache_key(self.model, system_message, prompt, temperature, max_tokens, stop_sequences)
+
+    def _cached_response(self, cached: Dict[str, Any]) -> Dict[str, Any]:
+        """A cache hit costs nothing and consumes no tokens"""
+        return {
+            **cached,
+            "tokens_used": 0,
+            "cost_usd": 0.0,
+            "execution_time_seconds": 0.0,
+            "cached": True
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses"""
+        self._cache.clear()
+        self._semantic_cache.clear()
+
+    def _embed_prompt(self, prompt: str) -> Any:
+        response = self.client.embeddings.create(model=self.embedding_model, input=prompt)
+        return _SemanticCacheIndex.normalize(response.data[0].embedding)
+
+    async def _embed_prompt_async(self, prompt: str) -> Any:
+        response = await self.async_client.embeddings.create(model=self.embedding_model, input=prompt)
+        return _SemanticCacheIndex.normalize(response.data[0].embedding)
+
+    async def generate_text_batch(self, prompts: List[str], system_message: Optional[str] = None,
+                                  batch_size: int = 10, parallel: int = 8) -> List[Dict[str, Any]]:
+        """Generate answers for many prompts using few API calls.
+
+        Prompts are marshaled into groups of up to batch_size items per request
+        and up to parallel requests run concurrently. Tokens and cost of each
+        request are split evenly across its items. A group whose response does
+        not split into the expected number of answers is retried one prompt
+        per request.
+
+        Returns:
+            One result dict per prompt, in input order.
+        """
+        batch_size = max(1, min(batch_size, _MAX_BATCH_SIZE))
+        semaphore = asyncio.Semaphore(max(1, parallel))
+        groups = [prompts[i:i + batch_size] for i in range(0, len(prompts), batch_size)]
+
+        async def run_group(group: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                if len(group) == 1:
+                    return [await self.generate_text_async(group[0], system_message=system_message)]
+
+                response = await self.generate_text_async(self._marshal_prompts(group), system_message=system_message)
+                answers = [answer.strip() for answer in response["text"].split(_BATCH_SEPARATOR)]
+                if len(answers) != len(group):
+                    logger.warning("Batched response had %d answers for %d prompts, retrying individually", len(answers), len(group))
+                    return list(await asyncio.gather(
+                        *(self.generate_text_async(prompt, system_message=system_message) for prompt in group)
+                    ))
+
+                count = len(group)
+                return [
+                    {
+                        **response,
+                        "text": answer,
+                        "tokens_used": response["tokens_used"] // count,
+                        "cost_usd": response["cost_usd"] / count,
+                        "batched": True
                     }
+                    for answer in answers
+                ]
 
-                except (openai.RateLimitError, openai.APIError, anthropic.APIError) as e:
-                    wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"API error ({type(e).__name__}) on attempt {attempt + 1}/{self.retry_attempts}, waiting {wait_time}s")
-                    if attempt < self.retry_attempts - 1:
-                        time.sleep(wait_time)
-                    else:
-                        logger.error(f"API error ({type(e).__name__}) after {self.retry_attempts} attempts")
-                        raise
-                except Exception as e:
-                    logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
-                    if attempt < self.retry_attempts - 1:
-                        time.sleep(self.retry_delay)
-                    else:
-                        raise
-
-    async def generate_text_async(self, prompt: str, **kwargs) -> Dict[str, Any]:
-        """Asynchronous text generation wrapper"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor, 
-            self.generate_text_sync, 
-            prompt, 
-            **kwargs
+        grouped_results = await asyncio.gather(*(run_group(group) for group in groups))
+        return [result for group_results in grouped_results for result in group_results]
+
+    def generate_text_batch_offline(self, prompts: List[str], system_message: Optional[str] = None,
+                                    poll_interval: float = 10.0, max_poll_interval: float = 300.0,
+                                    timeout: float = 24 * 3600) -> List[Dict[str, Any]]:
+        """Run a bulk workload through the provider's asynchronous Batch API.
+
+        Trades latency (results can take up to 24h) for half-price tokens and
+        separate rate limits. Blocks while polling the batch with exponential
+        backoff between poll_interval and max_poll_interval seconds.
+
+        Returns:
+            One result dict per prompt, in input order. Items the provider
+            failed to process carry an "error" message and empty text.
+        """
+        if not prompts:
+            return []
+        if self.provider == LLMProvider.OPENAI or self.provider == LLMProvider.AZURE_OPENAI:
+            results = self._run_openai_offline_batch(prompts, system_message, poll_interval, max_poll_interval, timeout)
+        elif self.provider == LLMProvider.ANTHROPIC:
+            results = self._run_anthropic_offline_batch(prompts, system_message, poll_interval, max_poll_interval, timeout)
+        elif self.provider == LLMProvider.MOCK:
+            return [self.generate_text_sync(prompt, system_message=system_message) for prompt in prompts]
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider.value}")
+
+        return [
+            results.get(i) or self._offline_batch_result("", 0, 0.0, error="No result returned for request")
+            for i in range(len(prompts))
+        ]
+
+    def _run_openai_offline_batch(self, prompts: List[str], system_message: Optional[str],
+                                  poll_interval: float, max_poll_interval: float, timeout: float) -> Dict[int, Dict[str, Any]]:
+        lines = []
+        for i, prompt in enumerate(prompts):
+            body = {k: v for k, v in self._openai_request(prompt, system_message).items() if v is not None}
+            lines.append(json.dumps({"custom_id": f"request-{i}", "method": "POST", "url": "/v1/chat/completions", "body": body}))
+
+        input_file = self.client.files.create(file=("batch.jsonl", "\n".join(lines).encode('utf-8')), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted OpenAI batch %s with %d requests", batch.id, len(prompts))
+        batch = self._poll_offline_batch(
+            lambda: self.client.batches.retrieve(batch.id),
+            lambda b: b.status in _OPENAI_BATCH_TERMINAL_STATES,
+            poll_interval, max_poll_interval, timeout
         )
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
 
-    def _generate_text_openai_internal(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None) -> Tuple[str, int, float]:
+        results = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"].rsplit("-", 1)[1])
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                results[index] = self._offline_batch_result("", 0, 0.0, error=str(record.get("error") or response.get("body")))
+                continue
+            body = response["body"]
+            usage = body["usage"]
+            cost_usd = self._calculate_openai_cost(usage["prompt_tokens"], usage["completion_tokens"]) * _OFFLINE_BATCH_DISCOUNT
+            results[index] = self._offline_batch_result(
+                body["choices"][0]["message"]["content"].strip(), usage["total_tokens"], cost_usd
+            )
+        return results
+
+    def _run_anthropic_offline_batch(self, prompts: List[str], system_message: Optional[str],
+                                     poll_interval: float, max_poll_interval: float, timeout: float) -> Dict[int, Dict[str, Any]]:
+        requests = []
+        for i, prompt in enumerate(prompts):
+            requests.append({"custom_id": f"request-{i}", "params": self._anthropic_request(prompt, system_message)})
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info("Submitted Anthropic message batch %s with %d requests", batch.id, len(prompts))
+        batch = self._poll_offline_batch(
+            lambda: self.client.messages.batches.retrieve(batch.id),
+            lambda b: b.processing_status == "ended",
+            poll_interval, max_poll_interval, timeout
+        )
+
+        results = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            index = int(entry.custom_id.rsplit("-", 1)[1])
+            if entry.result.type != "succeeded":
+                results[index] = self._offline_batch_result("", 0, 0.0, error=f"Request {entry.result.type}")
+                continue
+            generated_text, tokens_used, cost_usd = self._parse_anthropic_response(entry.result.message)
+            results[index] = self._offline_batch_result(generated_text, tokens_used, cost_usd * _OFFLINE_BATCH_DISCOUNT)
+        return results
+
+    @staticmethod
+    def _poll_offline_batch(retrieve, is_done, poll_interval: float, max_poll_interval: float, timeout: float):
+        """Poll a provider batch with exponential backoff until is_done or timeout"""
+        deadline = time.monotonic() + timeout
+        delay = poll_interval
+        while True:
+            batch = retrieve()
+            if is_done(batch):
+                return batch
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Batch {batch.id} did not finish within {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    def _offline_batch_result(self, text: str, tokens_used: int, cost_usd: float, error: Optional[str] = None) -> Dict[str, Any]:
+        result = {
+            "text": text,
+            "tokens_used": tokens_used,
+            "cost_usd": cost_usd,
+            "model": self.model,
+            "provider": self.provider.value
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+
+    @staticmethod
+    def _marshal_prompts(prompts: List[str]) -> str:
+        """Pack several prompts into one request that asks for sentinel-separated answers"""
+        header = (
+            f"Answer each of the following {len(prompts)} items independently. "
+            f"Return exactly {len(prompts)} answers in the same order, separated by a line "
+            f"containing only {_BATCH_SEPARATOR}. Do not number the answers or repeat the items."
+        )
+        items = "\n\n".join(f"### Item {i}:\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        return f"{header}\n\n{items}"
+
+    def _openai_request(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                        temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Chat Completions keyword arguments shared by every OpenAI/Azure call path"""
         messages = []
         if system_message:
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature if temperature is None else temperature,
+            "max_tokens": self.max_tokens if max_tokens is None else max_tokens,
+            "seed": self.seed,
+            "stop": stop_sequences
+        }
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            seed=self.seed,
-            stop=stop_sequences
-        )
+    def _anthropic_request(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                           temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Messages API keyword arguments shared by every Anthropic call path"""
+        request = {
+            "model": self.model,
+            "max_tokens": self.max_tokens if max_tokens is None else max_tokens,
+            "temperature": self.temperature if temperature is None else temperature,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system_message:
+            request["system"] = self._anthropic_system_param(system_message)
+        if stop_sequences:
+            request["stop_sequences"] = stop_sequences
+        return request
+
+    def _parse_openai_response(self, response: Any) -> Tuple[str, int, float]:
         generated_text = response.choices[0].message.content.strip()
-        tokens_used = response.usage.total_tokens
         cost_usd = self._calculate_openai_cost(response.usage.prompt_tokens, response.usage.completion_tokens)
+        return generated_text, response.usage.total_tokens, cost_usd
+
+    def _parse_anthropic_response(self, response: Any) -> Tuple[str, int, float]:
+        generated_text = response.content[0].text.strip()
+        tokens_used, cost_usd = self._anthropic_usage(response.usage)
         return generated_text, tokens_used, cost_usd
 
-    def _generate_text_anthropic_internal(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None) -> Tuple[str, int, float]:
-        messages = []
-        if system_message:
-            messages.append({"role": "user", "content": system_message}) # Anthropic uses user role for system messages in some models
-        messages.append({"role": "user", "content": prompt})
+    def _generate_text_openai_internal(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                                       temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                                       client: Any = None) -> Tuple[str, int, float]:
+        response = (client or self.client).chat.completions.create(**self._openai_request(prompt, system_message, stop_sequences, temperature, max_tokens))
+        return self._parse_openai_response(response)
+
+    def _generate_text_anthropic_internal(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                                          temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                                          client: Any = None) -> Tuple[str, int, float]:
+        response = (client or self.client).messages.create(**self._anthropic_request(prompt, system_message, stop_sequences, temperature, max_tokens))
+        return self._parse_anthropic_response(response)
+
+    async def _generate_text_openai_async(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                                          temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                                          client: Any = None) -> Tuple[str, int, float]:
+        response = await (client or self.async_client).chat.completions.create(**self._openai_request(prompt, system_message, stop_sequences, temperature, max_tokens))
+        return self._parse_openai_response(response)
+
+    async def _generate_text_anthropic_async(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None,
+                                             temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                                             client: Any = None) -> Tuple[str, int, float]:
+        response = await (client or self.async_client).messages.create(**self._anthropic_request(prompt, system_message, stop_sequences, temperature, max_tokens))
+        return self._parse_anthropic_response(response)
+
+    def _generate_text_mock(self, prompt: str, system_message: Optional[str] = None, stop_sequences: Optional[List[str]] = None) -> Tuple[str, int, float]:
+        result = self.client.generate_text_sync(prompt, system_message=system_message, stop_sequences=stop_sequences)
+        return result["text"], result["tokens_used"], result["cost_usd"]
+
+    def _build_result(self, generated_text: str, tokens_used: int, cost_usd: float, execution_time: float) -> Dict[str, Any]:
+        return {
+            "text": generated_text,
+            "tokens_used": tokens_used,
+            "cost_usd": cost_usd,
+            "execution_time_seconds": execution_time,
+            "model": self.model,
+            "provider": self.provider.value
+        }
+
+    def _anthropic_system_param(self, system_message: str) -> Any:
+        """Top-level system prompt, marked for Anthropic prompt caching when long enough.
+
+        Prompts shorter than the provider's minimum cacheable prefix are sent as a
+        plain string, since the marker would only add request overhead.
+        """
+        if self.cache_system and len(system_message) >= self.cache_system_min_chars:
+            return [{"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}]
+        return system_message
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
-            messages=messages,
-            stop_sequences=stop_sequences
+    def _anthropic_usage(self, usage: Any) -> Tuple[int, float]:
+        """Total tokens and cost for an Anthropic response, including prompt-cache reads/writes"""
+        cache_read_tokens = getattr(usage, 'cache_read_input_tokens', 0) or 0
+        cache_creation_tokens = getattr(usage, 'cache_creation_input_tokens', 0) or 0
+        tokens_used = usage.input_tokens + usage.output_tokens + cache_read_tokens + cache_creation_tokens
+        cost_usd = self._calculate_anthropic_cost(
+            usage.input_tokens, usage.output_tokens, cache_read_tokens, cache_creation_tokens
         )
-        generated_text = response.content[0].text.strip()
-        tokens_used = response.usage.input_tokens + response.usage.output_tokens
-        cost_usd = self._calculate_anthropic_cost(response.usage.input_tokens, response.usage.output_tokens)
-        return generated_text, tokens_used, cost_usd
+        return tokens_used, cost_usd
 
     def _calculate_openai_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
-        # Pricing as of 2024-05-15, for gpt-4o. Prices are per 1M tokens.
-        # This should be updated as models and pricing change.
-        input_cost_per_million = 5.00
-        output_cost_per_million = 15.00
-
-        cost = (prompt_tokens / 1_000_000) * input_cost_per_million + \
-               (completion_tokens / 1_000_000) * output_cost_per_million
-        return cost
+        # Rates are resolved once per client in __init__ (see _PRICING)
+        return prompt_tokens * self._input_per_token + completion_tokens * self._output_per_token
 
-    def _calculate_anthropic_cost(self, input_tokens: int, output_tokens: int) -> float:
-        # Pricing for Claude 3 Opus as of 2024-05-15. Prices are per 1M tokens.
-        # This should be updated as models and pricing change.
-        input_cost_per_million = 15.00
-        output_cost_per_million = 75.00
+    def _calculate_anthropic_cost(self, input_tokens: int, output_tokens: int,
+                                  cache_read_tokens: int = 0, cache_creation_tokens: int = 0) -> float:
+        input_rate = self._input_per_token
+        return (input_tokens * input_rate + output_tokens * self._output_per_token +
+                cache_read_tokens * input_rate * _CACHE_READ_MULTIPLIER +
+                cache_creation_tokens * input_rate * _CACHE_WRITE_MULTIPLIER)
 
-        cost = (input_tokens / 1_000_000) * input_cost_per_million + \
-               (output_tokens / 1_000_000) * output_cost_per_million
-        return cost
+    async def generate_text(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Legacy async entry point; keyword arguments are forwarded to generate_text_async"""
+        return await self.generate_text_async(prompt, **kwargs)
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about current model configuration"""
@@ -248,7 +985,7 @@ class LLMClient:
                 "provider": self.provider.value
             }
         except Exception as e:
-            logger.error(f"LLM health check failed: {e}")
+            logger.error("LLM health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e),
@@ -260,17 +997,36 @@ class LLMClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._executor.shutdown(wait=True)
+        for http_client in self._http_clients:
+            http_client.close()
+
+    async def aclose(self):
+        """Close the async connection pools; they must be closed on a running event loop"""
+        for http_client in self._async_http_clients:
+            await http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+        await self.aclose()
 
 # Legacy support - maintains backward compatibility
-class MockLLMClient(LLMClient):
-    """Mock LLM client for testing and offline mode"""
-    def __init__(self, config_path: Optional[str] = None):
-        super().__init__(config_path)
+class MockLLMClient:
+    """Mock LLM client for testing and offline mode.
+
+    Standalone rather than an LLMClient subclass: LLMClient builds one of these
+    for the mock provider, so inheriting would recurse back into LLMClient.__init__.
+    """
+    def __init__(self, config_path: Optional[str] = None, model: str = "mock"):
+        self.model = model
+        self.provider = LLMProvider.MOCK
         logger.info("MockLLMClient initialized. Responses will be simulated.")
 
     def generate_text_sync(self, prompt: str, **kwargs) -> Dict[str, Any]:
-        logger.info(f"MockLLMClient received prompt: {prompt[:50]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MockLLMClient received prompt: %s...", prompt[:50])
         # Simulate a response
         simulated_text = f"Mock response for: {prompt}"
         tokens_used = len(simulated_text.split()) # Basic token count
@@ -296,17 +1052,46 @@ class MockLLMClient(LLMClient):
 
 
 class OpenAIClient(LLMClient):
-    """Legacy OpenAI client - redirects to new LLMClient"""
-    
+    """Legacy OpenAI client - redirects to new LLMClient.
+
+    Instances are shared per (api_key, model) for the life of the process, so
+    call sites that build one per request reuse the same connection pool.
+    """
+
+    _SINGLETONS: Dict[Tuple[bytes, str], 'OpenAIClient'] = {}
+    _singletons_lock = threading.Lock()
+
+    @staticmethod
+    def _singleton_key(api_key: Optional[str], model: str) -> Tuple[bytes, str]:
+        # Only a digest of the key is kept around, never the plaintext
+        raw_key = api_key or os.getenv('LLM_API_KEYS') or os.getenv('LLM_API_KEY') or ''
+        return hashlib.blake2b(raw_key.encode('utf-8'), digest_size=16).digest(), model
+
+    def __new__(cls, api_key: Optional[str] = None, model: str = "gpt-4"):
+        key = cls._singleton_key(api_key, model)
+        with cls._singletons_lock:
+            instance = cls._SINGLETONS.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._SINGLETONS[key] = instance
+        return instance
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
-        if api_key:
-            os.environ['LLM_API_KEY'] = api_key
-        config = {
-            'provider': 'openai',
-            'model': model
-        }
-        super().__init__()
-        
-    async def generate_text(self, prompt: str, **kwargs) -> Dict[str, Any]:
-        """Legacy async method"""
-        return await self.generate_text_async(prompt, **kwargs)
+        with self._singletons_lock:
+            if self._initialized:
+                return
+            # Handed to _get_secure_api_keys directly rather than through the
+            # process environment, so other clients are unaffected
+            self._explicit_api_key = api_key
+            config = {**self._load_config(), 'provider': 'openai', 'model': model}
+            super().__init__(config=config)
+            self._initialized = True
+        # Pooled HTTP clients stay open until the interpreter exits
+        atexit.register(self.__exit__, None, None, None)
+
+    def _get_secure_api_keys(self) -> List[str]:
+        """The key passed to the constructor, if any, ahead of LLM_API_KEYS / LLM_API_KEY"""
+        if self._explicit_api_key:
+            return [self._decrypt_api_key(self._explicit_api_key)]
+        return super()._get_secure_api_keys()
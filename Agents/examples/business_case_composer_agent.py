@@ -6,17 +6,163 @@ that orchestrates the assembly of a complete business case by integrating
 data from multiple sources and agents in the business case creation workflow.
 """
 
+import asyncio
 import logging
-import time
-from typing import Dict, Any, List, Optional
+from time import monotonic as _monotonic, time as _time
+from dataclasses import asdict, dataclass
 from decimal import Decimal
-import json
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Mapping, Optional, Tuple
+try:
+    import orjson
+except ImportError:
+    import json
+    class orjson:
+        OPT_NON_STR_KEYS = 0
+        @staticmethod
+        def dumps(v, default=None, option=None):
+            return json.dumps(v, default=default).encode("utf-8")
 
 from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
 from agents.core.mcp_client import MCPClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Bound once to skip the enum attribute lookup on every return
+_COMPLETED = AgentStatus.COMPLETED
+_FAILED = AgentStatus.FAILED
+
+# Value drivers this agent knows how to cost, in the order they are reported
+_VALID_DRIVERS = frozenset({"cost_reduction", "revenue_growth", "productivity_gains", "risk_mitigation"})
+_VALID_DRIVERS_STR = "cost_reduction, revenue_growth, productivity_gains, risk_mitigation"
+
+# Validation rules applied when the config does not define its own. Shared
+# read-only by every agent instance, so nested mappings are frozen as well.
+_DEFAULT_VALIDATION_CONFIG: Mapping[str, Any] = MappingProxyType({
+    # Fields that must be present
+    'required_fields': ('project_name', 'client_name', 'industry', 'value_drivers'),
+    
+    # Type checking for fields
+    'field_types': MappingProxyType({
+        'project_name': 'string',
+        'client_name': 'string',
+        'industry': 'string',
+        'value_drivers': 'array',
+        'stakeholder_persona': 'string',
+        'template_id': 'string',
+        'metrics_data': 'object',
+        'investment_amount': 'number'
+    }),
+    
+    # Constraints for fields
+    'field_constraints': MappingProxyType({
+        'project_name': MappingProxyType({
+            'min_length': 3,
+            'max_length': 100
+        }),
+        'client_name': MappingProxyType({
+            'min_length': 2,
+            'max_length': 100
+        }),
+        'value_drivers': MappingProxyType({
+            'min_items': 1,
+            'item_type': 'string'
+        })
+    })
+})
+
+def _json_default(obj: Any) -> Any:
+    """Encode the mappings, sets and decimals caller-supplied metrics_data may hold."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# ROI model assumptions
+_WEEKS_PER_YEAR = 52
+_DISCOUNT_RATE = 0.10  # annual
+_HORIZON_YEARS = 3
+# Present value of 1 per year over the horizon (~2.4869)
+_ANNUITY_FACTOR = sum(1 / (1 + _DISCOUNT_RATE) ** year for year in range(1, _HORIZON_YEARS + 1))
+
+def _cost_reduction_benefit(data: Dict[str, Any]) -> float:
+    get = data.get
+    return get("current_operational_cost", 0) * (get("expected_cost_reduction_percentage", 0) / 100)
+
+def _revenue_growth_benefit(data: Dict[str, Any]) -> float:
+    get = data.get
+    return get("current_annual_revenue", 0) * (get("expected_revenue_growth_percentage", 0) / 100)
+
+def _productivity_gains_benefit(data: Dict[str, Any]) -> float:
+    get = data.get
+    time_savings_pct = get("expected_time_savings_percentage", 0) / 100
+    annual_hours_saved = get("current_process_time", 0) * time_savings_pct * get("affected_employee_count", 0) * _WEEKS_PER_YEAR
+    return annual_hours_saved * get("average_hourly_rate", 0)
+
+def _risk_mitigation_benefit(data: Dict[str, Any]) -> float:
+    get = data.get
+    risk_probability = get("risk_probability_percentage", 0) / 100
+    risk_reduction = get("expected_risk_reduction_percentage", 0) / 100
+    return get("current_annual_risk_cost", 0) * risk_probability * risk_reduction
+
+# Annual benefit calculator per value driver
+_DRIVER_CALCULATORS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "cost_reduction": _cost_reduction_benefit,
+    "revenue_growth": _revenue_growth_benefit,
+    "productivity_gains": _productivity_gains_benefit,
+    "risk_mitigation": _risk_mitigation_benefit,
+}
+
+# Sections common to every business case template, in document order
+_BASE_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("executive_summary", "Executive Summary"),
+    ("problem_statement", "Problem Statement"),
+    ("proposed_solution", "Proposed Solution"),
+    ("value_analysis", "Value Analysis"),
+    ("roi_calculation", "ROI Calculation"),
+    ("implementation_plan", "Implementation Plan"),
+    ("conclusion", "Conclusion"),
+)
+
+# Full section list per template ID prefix; industry templates add one
+# section ahead of the implementation plan. "" is the general template.
+_SECTIONS_BY_INDUSTRY: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "": _BASE_SECTIONS,
+    "healthcare": _BASE_SECTIONS[:5] + (("regulatory_compliance", "Regulatory Compliance"),) + _BASE_SECTIONS[5:],
+    "finance": _BASE_SECTIONS[:5] + (("risk_assessment", "Risk Assessment"),) + _BASE_SECTIONS[5:],
+}
+_INDUSTRY_PREFIXES = tuple(prefix for prefix in _SECTIONS_BY_INDUSTRY if prefix)
+
+# Emphasized sections and tone per stakeholder persona
+_PERSONA_EMPHASIS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "financial_buyer": (("roi_calculation", "value_analysis"), "analytical"),
+    "technical_buyer": (("proposed_solution", "implementation_plan"), "technical"),
+    "executive": (("executive_summary", "conclusion"), "strategic"),
+}
+
+@dataclass(slots=True)
+class BusinessCase:
+    """A composed business case as handed to storage."""
+    metadata: Dict[str, Any]
+    structure: Dict[str, Any]
+    value_drivers: List[str]
+    roi_metrics: Dict[str, Any]
+    metrics_data: Dict[str, Any]
+    workflow_id: Optional[str]
+
+@dataclass(slots=True, frozen=True)
+class _ROISummary:
+    """Headline ROI figures reported in the agent result."""
+    total_annual_benefit: float
+    annual_roi_percentage: float
+    payback_period_months: Optional[float]
+
 class BusinessCaseComposerAgent(BaseAgent):
     """
     Agent that orchestrates the assembly of a complete business case.
@@ -26,6 +172,8 @@ class BusinessCaseComposerAgent(BaseAgent):
     business case document.
     """
 
+    __slots__ = ()
+
     def __init__(self, agent_id: str, mcp_client: Any, config: Dict[str, Any]):
         """
         Initialize the Business Case Composer Agent with validation rules.
@@ -36,39 +184,7 @@ class BusinessCaseComposerAgent(BaseAgent):
             config: Configuration dictionary
         """
         # Define validation rules in config
-        if 'input_validation' not in config:
-            config['input_validation'] = {
-                # Fields that must be present
-                'required_fields': ['project_name', 'client_name', 'industry', 'value_drivers'],
-                
-                # Type checking for fields
-                'field_types': {
-                    'project_name': 'string',
-                    'client_name': 'string',
-                    'industry': 'string',
-                    'value_drivers': 'array',
-                    'stakeholder_persona': 'string',
-                    'template_id': 'string',
-                    'metrics_data': 'object',
-                    'investment_amount': 'number'
-                },
-                
-                # Constraints for fields
-                'field_constraints': {
-                    'project_name': {
-                        'min_length': 3,
-                        'max_length': 100
-                    },
-                    'client_name': {
-                        'min_length': 2,
-                        'max_length': 100
-                    },
-                    'value_drivers': {
-                        'min_items': 1,
-                        'item_type': 'string'
-                    }
-                }
-            }
+        config.setdefault('input_validation', _DEFAULT_VALIDATION_CONFIG)
         
         super().__init__(agent_id, mcp_client, config)
     
@@ -84,36 +200,45 @@ class BusinessCaseComposerAgent(BaseAgent):
         """
         errors = []
         
-        # Validate value drivers
-        valid_drivers = ["cost_reduction", "revenue_growth", "productivity_gains", "risk_mitigation"]
-        value_drivers = inputs.get('value_drivers', [])
-        
+        # Validate value drivers. Type errors do not stop custom validations,
+        # so anything but a list is left to the framework's 'array' check.
+        value_drivers = inputs.get('value_drivers')
         if isinstance(value_drivers, list):
-            for driver in value_drivers:
-                if driver not in valid_drivers:
-                    errors.append(f"Unrecognized value driver: {driver}. Valid drivers are: {', '.join(valid_drivers)}")
-        
-        # Validate metrics data if provided
-        metrics_data = inputs.get('metrics_data', {})
-        if metrics_data:
-            # Check that metrics data contains entries for each selected value driver
-            for driver in value_drivers:
-                if driver not in metrics_data:
-                    errors.append(f"Missing metrics data for value driver: {driver}")
+            # Non-string items are reported too rather than failing the set lookup
+            invalid = [str(d) for d in value_drivers if not isinstance(d, str) or d not in _VALID_DRIVERS]
+            if invalid:
+                errors.append(f"Unrecognized value drivers: {', '.join(invalid)}. Valid drivers are: {_VALID_DRIVERS_STR}")
+            
+            # Validate metrics data if provided: each selected driver needs an entry
+            metrics_data = inputs.get('metrics_data')
+            if metrics_data:
+                missing = [str(d) for d in value_drivers if d not in metrics_data]
+                if missing:
+                    errors.append(f"Missing metrics data for value drivers: {', '.join(missing)}")
         
         # Convert investment amount to float if it's a string number
-        if 'investment_amount' in inputs and isinstance(inputs['investment_amount'], str):
-            try:
-                inputs['investment_amount'] = float(inputs['investment_amount'])
-            except (ValueError, TypeError):
-                errors.append(f"Invalid investment amount: '{inputs['investment_amount']}'. Must be a number.")
+        investment_amount = inputs.get('investment_amount')
+        if isinstance(investment_amount, str):
+            amount = investment_amount.strip()
+            # Plain decimals like "-1500.50" skip the exception path; anything
+            # else ("1e6", "+5", "nan") is left to float() to accept or reject
+            if amount.removeprefix('-').replace('.', '', 1).isdecimal():
+                inputs['investment_amount'] = float(amount)
+            else:
+                try:
+                    inputs['investment_amount'] = float(amount)
+                except ValueError:
+                    errors.append(f"Invalid investment amount: '{investment_amount}'. Must be a number.")
         
         return errors
     
-    async def _retrieve_workflow_context(self) -> Dict[str, Any]:
+    async def _retrieve_workflow_context(self, now: float) -> Dict[str, Any]:
         """
         Retrieve the current workflow context from MCP.
         
+        Args:
+            now: Current epoch timestamp, shared with the rest of the execution
+            
         Returns:
             Dictionary containing workflow context data
         """
@@ -123,10 +248,52 @@ class BusinessCaseComposerAgent(BaseAgent):
             "workflow_id": "sample_workflow_123",
             "user_id": "sample_user",
             "customer_id": "sample_customer",
-            "workflow_start_time": time.time() - 3600,  # 1 hour ago
+            "workflow_start_time": now - 3600,  # 1 hour ago
             "current_step": "review_and_generate"
         }
     
+    @classmethod
+    def _calculate_roi_metrics_batch(cls, cases: "np.ndarray") -> "np.ndarray":
+        """
+        Calculate ROI metrics for many business cases in one vectorized pass.
+        
+        Args:
+            cases: (N, 12) array, one row per case, with columns
+                [current_operational_cost, expected_cost_reduction_percentage,
+                 current_annual_revenue, expected_revenue_growth_percentage,
+                 current_process_time, expected_time_savings_percentage,
+                 affected_employee_count, average_hourly_rate,
+                 current_annual_risk_cost, risk_probability_percentage,
+                 expected_risk_reduction_percentage, investment_amount].
+                Columns of drivers a case does not use should be zero.
+            
+        Returns:
+            (N, 9) array with columns [cost_reduction, revenue_growth,
+            productivity_gains, risk_mitigation, total_annual_benefit,
+            annual_roi_percentage, three_year_roi_percentage,
+            payback_period_months, net_present_value]; payback is NaN for
+            cases with no benefit
+        """
+        import numpy as np
+        
+        cases = np.asarray(cases, dtype=np.float64)
+        pct = cases / 100
+        benefits = np.stack([
+            cases[:, 0] * pct[:, 1],
+            cases[:, 2] * pct[:, 3],
+            cases[:, 4] * pct[:, 5] * cases[:, 6] * cases[:, 7] * _WEEKS_PER_YEAR,
+            cases[:, 8] * pct[:, 9] * pct[:, 10],
+        ], axis=1)
+        total = benefits.sum(axis=1)
+        investment = cases[:, 11]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            annual_roi = np.where(investment > 0, total / investment * 100, 0.0)
+            payback = np.where(total > 0, investment / total * 12, np.nan)
+        npv = -investment + total * _ANNUITY_FACTOR
+        
+        return np.column_stack([benefits, total, annual_roi, annual_roi * _HORIZON_YEARS, payback, npv])
+    
     async def _calculate_roi_metrics(self, value_drivers: List[str], 
                                     metrics_data: Dict[str, Any],
                                     investment_amount: float) -> Dict[str, Any]:
@@ -149,50 +316,22 @@ class BusinessCaseComposerAgent(BaseAgent):
         
         # Calculate benefits for each value driver
         for driver in value_drivers:
-            driver_data = metrics_data.get(driver, {})
-            driver_benefit = 0.0
-            
-            if driver == "cost_reduction":
-                current_cost = driver_data.get("current_operational_cost", 0)
-                reduction_pct = driver_data.get("expected_cost_reduction_percentage", 0) / 100
-                driver_benefit = current_cost * reduction_pct
-                
-            elif driver == "revenue_growth":
-                current_revenue = driver_data.get("current_annual_revenue", 0)
-                growth_pct = driver_data.get("expected_revenue_growth_percentage", 0) / 100
-                driver_benefit = current_revenue * growth_pct
-                
-            elif driver == "productivity_gains":
-                process_time = driver_data.get("current_process_time", 0)
-                time_savings_pct = driver_data.get("expected_time_savings_percentage", 0) / 100
-                employee_count = driver_data.get("affected_employee_count", 0)
-                hourly_rate = driver_data.get("average_hourly_rate", 0)
-                
-                annual_hours_saved = process_time * time_savings_pct * employee_count * 52  # 52 weeks
-                driver_benefit = annual_hours_saved * hourly_rate
-                
-            elif driver == "risk_mitigation":
-                risk_cost = driver_data.get("current_annual_risk_cost", 0)
-                risk_probability = driver_data.get("risk_probability_percentage", 0) / 100
-                risk_reduction = driver_data.get("expected_risk_reduction_percentage", 0) / 100
-                
-                driver_benefit = risk_cost * risk_probability * risk_reduction
+            calculate = _DRIVER_CALCULATORS.get(driver)
+            driver_benefit = calculate(metrics_data.get(driver, {})) if calculate else 0.0
             
             benefits_by_driver[driver] = driver_benefit
             total_annual_benefit += driver_benefit
         
         # Calculate ROI metrics
         annual_roi_percentage = (total_annual_benefit / investment_amount) * 100 if investment_amount > 0 else 0
-        three_year_roi_percentage = annual_roi_percentage * 3
+        three_year_roi_percentage = annual_roi_percentage * _HORIZON_YEARS
         
         # Calculate payback period (in months)
-        payback_period_months = (investment_amount / total_annual_benefit) * 12 if total_annual_benefit > 0 else float('inf')
+        # None rather than inf when there is no benefit, so the result stays JSON-serializable
+        payback_period_months = (investment_amount / total_annual_benefit) * 12 if total_annual_benefit > 0 else None
         
-        # Calculate NPV (simplified)
-        discount_rate = 0.10  # 10% annual discount rate
-        npv = -investment_amount
-        for year in range(1, 4):  # 3 years
-            npv += total_annual_benefit / ((1 + discount_rate) ** year)
+        # Calculate NPV (simplified): the horizon's discounted benefits
+        npv = -investment_amount + total_annual_benefit * _ANNUITY_FACTOR
         
         return {
             "total_annual_benefit": total_annual_benefit,
@@ -217,104 +356,50 @@ class BusinessCaseComposerAgent(BaseAgent):
             Dictionary containing business case structure
         """
         # In a real implementation, this would retrieve the template from MCP
-        # For this example, we'll use a simplified structure
+        # For this example, templates are immutable module-level tables and
+        # section order is derived from position when the output is built
+        industry = next((prefix for prefix in _INDUSTRY_PREFIXES if template_id.startswith(prefix)), "")
         
-        # Base structure common to all templates
-        base_structure = {
+        structure: Dict[str, Any] = {
             "sections": [
-                {
-                    "id": "executive_summary",
-                    "title": "Executive Summary",
-                    "order": 1
-                },
-                {
-                    "id": "problem_statement",
-                    "title": "Problem Statement",
-                    "order": 2
-                },
-                {
-                    "id": "proposed_solution",
-                    "title": "Proposed Solution",
-                    "order": 3
-                },
-                {
-                    "id": "value_analysis",
-                    "title": "Value Analysis",
-                    "order": 4
-                },
-                {
-                    "id": "roi_calculation",
-                    "title": "ROI Calculation",
-                    "order": 5
-                },
-                {
-                    "id": "implementation_plan",
-                    "title": "Implementation Plan",
-                    "order": 6
-                },
-                {
-                    "id": "conclusion",
-                    "title": "Conclusion",
-                    "order": 7
-                }
+                {"id": section_id, "title": title, "order": order}
+                for order, (section_id, title) in enumerate(_SECTIONS_BY_INDUSTRY[industry], start=1)
             ]
         }
         
-        # Customize based on template ID
-        if template_id.startswith("healthcare"):
-            base_structure["sections"].insert(5, {
-                "id": "regulatory_compliance",
-                "title": "Regulatory Compliance",
-                "order": 6
-            })
-            # Shift subsequent sections
-            for i in range(5, len(base_structure["sections"])):
-                base_structure["sections"][i]["order"] += 1
-                
-        elif template_id.startswith("finance"):
-            base_structure["sections"].insert(5, {
-                "id": "risk_assessment",
-                "title": "Risk Assessment",
-                "order": 6
-            })
-            # Shift subsequent sections
-            for i in range(5, len(base_structure["sections"])):
-                base_structure["sections"][i]["order"] += 1
-        
-        # Customize based on stakeholder persona
-        if stakeholder_persona.lower() == "financial_buyer":
-            # Emphasize financial sections
-            base_structure["emphasis"] = ["roi_calculation", "value_analysis"]
-            base_structure["tone"] = "analytical"
-            
-        elif stakeholder_persona.lower() == "technical_buyer":
-            # Emphasize technical sections
-            base_structure["emphasis"] = ["proposed_solution", "implementation_plan"]
-            base_structure["tone"] = "technical"
-            
-        elif stakeholder_persona.lower() == "executive":
-            # Emphasize executive summary and high-level value
-            base_structure["emphasis"] = ["executive_summary", "conclusion"]
-            base_structure["tone"] = "strategic"
+        persona = _PERSONA_EMPHASIS.get(stakeholder_persona.lower())
+        if persona is not None:
+            emphasis, tone = persona
+            structure["emphasis"] = list(emphasis)
+            structure["tone"] = tone
         
-        return base_structure
+        return structure
     
-    async def _store_business_case(self, business_case_data: Dict[str, Any]) -> str:
+    async def _store_business_case(self, business_case: BusinessCase) -> str:
         """
         Store the generated business case in MCP.
         
         Args:
-            business_case_data: Complete business case data
+            business_case: Complete business case
             
         Returns:
             String ID of the stored business case
         """
         # In a real implementation, this would use the MCP client to store the business case
-        # For this example, we'll simulate storage
-        logger.info("Storing business case in MCP")
+        # For this example, we'll simulate storage of the serialized payload
+        # Shallow field view: asdict() would deep-copy metrics_data and the
+        # rest of the case just to serialize it
+        # metrics_data is caller-supplied, so non-string keys and values JSON
+        # has no type for are encoded rather than rejected
+        payload = orjson.dumps(
+            {name: getattr(business_case, name) for name in BusinessCase.__slots__},
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+        logger.info("Storing business case in MCP (%d bytes)", len(payload))
         
         # Simulate storage
-        business_case_id = f"bc_{int(time.time())}"
+        business_case_id = f"bc_{int(business_case.metadata['created_at'])}"
         
         return business_case_id
     
@@ -328,15 +413,15 @@ class BusinessCaseComposerAgent(BaseAgent):
         Returns:
             AgentResult: Result of the agent execution with the composed business case
         """
-        start_time = time.monotonic()
+        start_time = _monotonic()
         
         # Use centralized validation
         validation_result = await self.validate_inputs(inputs)
         if not validation_result.is_valid:
             return AgentResult(
-                status=AgentStatus.FAILED, 
+                status=_FAILED, 
                 data={"error": validation_result.errors}, 
-                execution_time_ms=int((time.monotonic() - start_time) * 1000)
+                execution_time_ms=int((_monotonic() - start_time) * 1000)
             )
         
         # Extract validated inputs
@@ -349,36 +434,45 @@ class BusinessCaseComposerAgent(BaseAgent):
         metrics_data = inputs.get('metrics_data', {})
         investment_amount = inputs.get('investment_amount', 0.0)
         
-        # Retrieve workflow context
-        workflow_context = await self._retrieve_workflow_context()
-        
-        # Calculate ROI metrics
-        roi_metrics = await self._calculate_roi_metrics(
-            value_drivers, metrics_data, investment_amount
-        )
-        
-        # Generate business case structure
-        business_case_structure = await self._generate_business_case_structure(
-            template_id, stakeholder_persona
+        # One timestamp for the whole execution
+        now = _time()
+        
+        # Workflow context, ROI metrics and structure are independent, so
+        # they run concurrently; return_exceptions lets the others finish
+        # when one fails instead of leaving them running unobserved
+        subtask_results = await asyncio.gather(
+            self._retrieve_workflow_context(now),
+            self._calculate_roi_metrics(value_drivers, metrics_data, investment_amount),
+            self._generate_business_case_structure(template_id, stakeholder_persona),
+            return_exceptions=True
         )
+        error = next((result for result in subtask_results if isinstance(result, BaseException)), None)
+        if error is not None:
+            logger.error("Error composing business case: %s", error)
+            return AgentResult(
+                status=_FAILED,
+                data={"error": f"Failed to compose business case: {error}"},
+                execution_time_ms=int((_monotonic() - start_time) * 1000)
+            )
+        workflow_context, roi_metrics, business_case_structure = subtask_results
         
         # Assemble the complete business case
-        business_case = {
-            "metadata": {
+        business_case = BusinessCase(
+            metadata={
                 "project_name": project_name,
                 "client_name": client_name,
                 "industry": industry,
-                "created_at": time.time(),
+                "created_at": now,
                 "created_by": workflow_context.get("user_id"),
                 "template_id": template_id,
                 "stakeholder_persona": stakeholder_persona
             },
-            "structure": business_case_structure,
-            "value_drivers": value_drivers,
-            "roi_metrics": roi_metrics,
-            "metrics_data": metrics_data,
-            "workflow_id": workflow_context.get("workflow_id")
-        }
+            structure=business_case_structure,
+            value_drivers=value_drivers,
+            roi_metrics=roi_metrics,
+            metrics_data=metrics_data,
+            workflow_id=workflow_context.get("workflow_id")
+        )
         
         # Store the business case in MCP
         business_case_id = await self._store_business_case(business_case)
@@ -388,21 +482,22 @@ class BusinessCaseComposerAgent(BaseAgent):
             "business_case_id": business_case_id,
             "project_name": project_name,
             "client_name": client_name,
-            "roi_summary": {
-                "total_annual_benefit": roi_metrics["total_annual_benefit"],
-                "annual_roi_percentage": roi_metrics["annual_roi_percentage"],
-                "payback_period_months": roi_metrics["payback_period_months"]
-            },
+            # AgentResult.data is consumed as plain dicts
+            "roi_summary": asdict(_ROISummary(
+                total_annual_benefit=roi_metrics["total_annual_benefit"],
+                annual_roi_percentage=roi_metrics["annual_roi_percentage"],
+                payback_period_months=roi_metrics["payback_period_months"]
+            )),
             "section_count": len(business_case_structure["sections"]),
             "value_driver_count": len(value_drivers)
         }
         
         # Log success
-        logger.info(f"Successfully composed business case for {client_name}: {project_name}")
+        logger.info("Successfully composed business case for %s: %s", client_name, project_name)
         
         # Return successful result
         return AgentResult(
-            status=AgentStatus.COMPLETED,
+            status=_COMPLETED,
             data=result_data,
-            execution_time_ms=int((time.monotonic() - start_time) * 1000)
+            execution_time_ms=int((_monotonic() - start_time) * 1000)
         )
@@ -5,17 +5,216 @@ This module demonstrates how to implement a Narrative Generator Agent
 that creates compelling business case narratives tailored to specific stakeholder personas.
 """
 
+import functools
 import logging
 import time
 import asyncio
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Any, List, Mapping, Optional, Tuple
 import re
+import string
 
-from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
+from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus, ValidationResult, ValidationSpec
 from agents.core.mcp_client import MCPClient
+from agents.core.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Business case IDs are 'bc_' followed by digits; \Z also rejects a trailing newline
+_BC_ID_RE = re.compile(r'\Abc_\d+\Z')
+
+@functools.lru_cache(maxsize=1024)
+def _highlight_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Case-insensitive alternation over highlight keywords, compiled once per set.
+    
+    Longer keywords are tried first so a keyword is not split by a shorter
+    one it contains.
+    """
+    alternatives = sorted(map(re.escape, keywords), key=len, reverse=True)
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+def _highlight_and_clip(text: str, keywords: List[str], max_length: int) -> str:
+    """
+    Bold every case-insensitive occurrence of the keywords and cap the length.
+    
+    Matches are rendered with the keyword as given, and the first of
+    several keywords differing only in case wins. Highlighting runs in one
+    pass that stops once the output is known to exceed max_length, so the
+    rest of a long narrative is never copied; the result is the same as
+    highlighting everything and then truncating.
+    """
+    replacements: Dict[str, str] = {}
+    for keyword in keywords:
+        if keyword:
+            replacements.setdefault(keyword.lower(), f"**{keyword}**")
+    
+    if replacements:
+        pieces: List[str] = []
+        size = 0
+        position = 0
+        for match in _highlight_pattern(tuple(replacements)).finditer(text):
+            if size > max_length:
+                break
+            matched = match.group(0)
+            marked = replacements.get(matched.lower(), f"**{matched}**")
+            pieces.append(text[position:match.start()])
+            pieces.append(marked)
+            size += match.start() - position + len(marked)
+            position = match.end()
+        if size <= max_length:
+            pieces.append(text[position:position + max_length + 1 - size])
+        text = "".join(pieces)
+    
+    # Ensure narrative doesn't exceed max length
+    if len(text) > max_length:
+        text = text[:max_length-3] + "..."
+    return text
+
+def _word_count(text: str) -> int:
+    """
+    Number of whitespace-separated words, as len(text.split()) would count.
+    
+    Narratives are normally single-spaced printable text, where counting
+    spaces gives the answer without allocating a list of words.
+    isprintable() rules out every whitespace character except the ASCII
+    space, so anything else falls back to split().
+    """
+    if not text or text[0] == ' ' or text[-1] == ' ' or '  ' in text or not text.isprintable():
+        return len(text.split())
+    return text.count(' ') + 1
+
+# Extractors for the fields narrative templates may reference
+_CONTEXT_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "project_name": lambda data: data.get("metadata", {}).get("project_name", "the project"),
+    "client_name": lambda data: data.get("metadata", {}).get("client_name", "the client"),
+    "industry": lambda data: data.get("metadata", {}).get("industry", "the industry"),
+    "value_drivers": lambda data: ', '.join(data.get("value_drivers", [])),
+    "annual_roi": lambda data: data.get("roi_metrics", {}).get("annual_roi_percentage", 0),
+    "payback_period": lambda data: data.get("roi_metrics", {}).get("payback_period_months", 0),
+    "total_benefit": lambda data: data.get("roi_metrics", {}).get("total_annual_benefit", 0),
+    "investment_amount": lambda data: data.get("roi_metrics", {}).get("investment_amount", 0),
+    "three_year_roi": lambda data: data.get("roi_metrics", {}).get("three_year_roi_percentage", 0),
+    "npv": lambda data: data.get("roi_metrics", {}).get("net_present_value", 0)
+}
+
+def _template_builder(template: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Build a function rendering one narrative template from business case data.
+    
+    The template's field names are resolved once, so each render only
+    extracts the fields that template references.
+    """
+    extractors = tuple(
+        (field, _CONTEXT_FIELDS[field])
+        for field in dict.fromkeys(name for _, name, _, _ in string.Formatter().parse(template) if name)
+    )
+    
+    def build(business_case_data: Dict[str, Any]) -> str:
+        return template.format_map({field: extract(business_case_data) for field, extract in extractors})
+    
+    return build
+
+# Validation rules applied when the config does not define its own
+_VALIDATION_SPEC = ValidationSpec(
+    # Fields that must be present
+    required_fields=('business_case_id', 'section_id', 'stakeholder_persona'),
+    
+    # Type checking for fields
+    field_types=MappingProxyType({
+        'business_case_id': 'string',
+        'section_id': 'string',
+        'stakeholder_persona': 'string',
+        'tone': 'string',
+        'max_length': 'number',
+        'include_metrics': 'boolean',
+        'highlight_keywords': 'array'
+    }),
+    
+    # Constraints for fields
+    field_constraints=MappingProxyType({
+        'section_id': MappingProxyType({
+            'enum': (
+                'executive_summary', 
+                'problem_statement', 
+                'proposed_solution',
+                'value_analysis',
+                'roi_calculation',
+                'implementation_plan',
+                'conclusion',
+                'regulatory_compliance',
+                'risk_assessment'
+            )
+        }),
+        'stakeholder_persona': MappingProxyType({
+            'enum': (
+                'executive', 
+                'financial_buyer', 
+                'technical_buyer',
+                'end_user',
+                'procurement',
+                'general'
+            )
+        }),
+        'tone': MappingProxyType({
+            'enum': (
+                'formal',
+                'technical',
+                'persuasive',
+                'analytical',
+                'conversational'
+            )
+        }),
+        'max_length': MappingProxyType({
+            'min': 100,
+            'max': 5000
+        }),
+        'highlight_keywords': MappingProxyType({
+            'item_type': 'string'
+        })
+    })
+)
+
+# Stakeholder persona profiles, shared read-only by all agents
+_PERSONA_PROFILES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "executive": MappingProxyType({
+        "focus": "strategic impact and bottom-line results",
+        "metrics_emphasis": ("roi", "payback_period", "revenue_impact"),
+        "language_style": "concise, high-level, business-focused",
+        "default_tone": "persuasive"
+    }),
+    "financial_buyer": MappingProxyType({
+        "focus": "financial justification and risk assessment",
+        "metrics_emphasis": ("npv", "irr", "cost_savings", "tco"),
+        "language_style": "detailed, analytical, numbers-driven",
+        "default_tone": "analytical"
+    }),
+    "technical_buyer": MappingProxyType({
+        "focus": "technical implementation and integration",
+        "metrics_emphasis": ("efficiency_gains", "technical_specifications", "compatibility"),
+        "language_style": "precise, technical, solution-oriented",
+        "default_tone": "technical"
+    }),
+    "end_user": MappingProxyType({
+        "focus": "usability and day-to-day benefits",
+        "metrics_emphasis": ("time_savings", "ease_of_use", "productivity_gains"),
+        "language_style": "practical, benefit-focused, accessible",
+        "default_tone": "conversational"
+    }),
+    "procurement": MappingProxyType({
+        "focus": "vendor comparison and contractual terms",
+        "metrics_emphasis": ("cost_comparison", "vendor_reliability", "contract_terms"),
+        "language_style": "formal, comparative, detail-oriented",
+        "default_tone": "formal"
+    }),
+    "general": MappingProxyType({
+        "focus": "balanced view of benefits and implementation",
+        "metrics_emphasis": ("roi", "implementation_timeline", "key_benefits"),
+        "language_style": "balanced, comprehensive, clear",
+        "default_tone": "formal"
+    })
+})
+
 class NarrativeGeneratorAgent(BaseAgent):
     """
     Agent that creates compelling business case narratives tailored to specific stakeholder personas.
@@ -24,6 +223,38 @@ class NarrativeGeneratorAgent(BaseAgent):
     and generation of narrative content based on business case data and stakeholder persona.
     """
 
+    # Base templates for each section, formatted with str.format_map
+    SECTION_TEMPLATES: Dict[str, str] = {
+        "executive_summary": "This business case presents a compelling opportunity for {client_name} to implement {project_name}, which is expected to deliver significant value through {value_drivers}. With an annual ROI of {annual_roi:.1f}% and a payback period of {payback_period:.1f} months, this initiative aligns with our strategic objectives while addressing critical business challenges.",
+        
+        "problem_statement": "{client_name} is currently facing challenges related to {value_drivers}. These challenges are impacting operational efficiency, cost structure, and competitive positioning in the {industry} market.",
+        
+        "proposed_solution": "The proposed {project_name} solution will address these challenges through a comprehensive approach that leverages cutting-edge technology and industry best practices. This solution has been designed specifically for {client_name}'s unique requirements in the {industry} sector.",
+        
+        "value_analysis": "The implementation of {project_name} is expected to deliver value across multiple dimensions. Based on our analysis, the primary value drivers include {value_drivers}, with a total annual benefit of ${total_benefit:,.2f}.",
+        
+        "roi_calculation": "Our financial analysis indicates a compelling return on investment for {project_name}. With an initial investment of ${investment_amount:,.2f}, we project an annual ROI of {annual_roi:.1f}%, a three-year ROI of {three_year_roi:.1f}%, and a payback period of {payback_period:.1f} months.",
+        
+        "implementation_plan": "The implementation of {project_name} will follow a structured approach designed to minimize disruption while ensuring rapid value realization. The plan includes key phases for planning, deployment, testing, training, and ongoing optimization.",
+        
+        "conclusion": "In conclusion, the {project_name} initiative represents a strategic opportunity for {client_name} to address critical business challenges while delivering substantial financial returns. With an annual ROI of {annual_roi:.1f}% and alignment with key strategic objectives, we recommend proceeding with this investment.",
+        
+        "regulatory_compliance": "The {project_name} solution has been designed with full consideration of the regulatory requirements applicable to {client_name} in the {industry} industry. Our approach ensures compliance with all relevant standards while maintaining operational efficiency.",
+        
+        "risk_assessment": "We have conducted a comprehensive risk assessment for the {project_name} initiative. Key risks have been identified and mitigation strategies developed to ensure successful implementation and value realization."
+    }
+    
+    # Persona-specific closing sentences, keyed by lowercase persona
+    PERSONA_SUFFIX_TEMPLATES: Dict[str, str] = {
+        "executive": " From an executive perspective, this initiative will contribute directly to strategic objectives while delivering measurable bottom-line impact of ${total_benefit:,.2f} annually.",
+        "financial_buyer": " The financial analysis demonstrates a strong business case with an NPV of ${npv:,.2f} and a payback period of {payback_period:.1f} months, providing a sound financial justification for this investment.",
+        "technical_buyer": " The technical implementation has been carefully designed to integrate with existing systems while providing a scalable platform for future growth and innovation."
+    }
+    
+    # Key-metrics sentence, added for these sections when include_metrics is set
+    METRICS_TEMPLATE = " Key metrics include: Annual ROI: {annual_roi:.1f}%, Payback Period: {payback_period:.1f} months, Total Annual Benefit: ${total_benefit:,.2f}."
+    _METRICS_SECTIONS = frozenset({"value_analysis", "roi_calculation", "executive_summary"})
+
     def __init__(self, agent_id: str, mcp_client: Any, config: Dict[str, Any]):
         """
         Initialize the Narrative Generator Agent with validation rules.
@@ -34,107 +265,21 @@ class NarrativeGeneratorAgent(BaseAgent):
             config: Configuration dictionary
         """
         # Define validation rules in config
-        if 'input_validation' not in config:
-            config['input_validation'] = {
-                # Fields that must be present
-                'required_fields': ['business_case_id', 'section_id', 'stakeholder_persona'],
-                
-                # Type checking for fields
-                'field_types': {
-                    'business_case_id': 'string',
-                    'section_id': 'string',
-                    'stakeholder_persona': 'string',
-                    'tone': 'string',
-                    'max_length': 'number',
-                    'include_metrics': 'boolean',
-                    'highlight_keywords': 'array'
-                },
-                
-                # Constraints for fields
-                'field_constraints': {
-                    'section_id': {
-                        'enum': [
-                            'executive_summary', 
-                            'problem_statement', 
-                            'proposed_solution',
-                            'value_analysis',
-                            'roi_calculation',
-                            'implementation_plan',
-                            'conclusion',
-                            'regulatory_compliance',
-                            'risk_assessment'
-                        ]
-                    },
-                    'stakeholder_persona': {
-                        'enum': [
-                            'executive', 
-                            'financial_buyer', 
-                            'technical_buyer',
-                            'end_user',
-                            'procurement',
-                            'general'
-                        ]
-                    },
-                    'tone': {
-                        'enum': [
-                            'formal',
-                            'technical',
-                            'persuasive',
-                            'analytical',
-                            'conversational'
-                        ]
-                    },
-                    'max_length': {
-                        'min': 100,
-                        'max': 5000
-                    },
-                    'highlight_keywords': {
-                        'item_type': 'string'
-                    }
-                }
-            }
+        config.setdefault('input_validation', _VALIDATION_SPEC)
         
         super().__init__(agent_id, mcp_client, config)
         
-        # Initialize persona profiles
-        self.persona_profiles = {
-            "executive": {
-                "focus": "strategic impact and bottom-line results",
-                "metrics_emphasis": ["roi", "payback_period", "revenue_impact"],
-                "language_style": "concise, high-level, business-focused",
-                "default_tone": "persuasive"
-            },
-            "financial_buyer": {
-                "focus": "financial justification and risk assessment",
-                "metrics_emphasis": ["npv", "irr", "cost_savings", "tco"],
-                "language_style": "detailed, analytical, numbers-driven",
-                "default_tone": "analytical"
-            },
-            "technical_buyer": {
-                "focus": "technical implementation and integration",
-                "metrics_emphasis": ["efficiency_gains", "technical_specifications", "compatibility"],
-                "language_style": "precise, technical, solution-oriented",
-                "default_tone": "technical"
-            },
-            "end_user": {
-                "focus": "usability and day-to-day benefits",
-                "metrics_emphasis": ["time_savings", "ease_of_use", "productivity_gains"],
-                "language_style": "practical, benefit-focused, accessible",
-                "default_tone": "conversational"
-            },
-            "procurement": {
-                "focus": "vendor comparison and contractual terms",
-                "metrics_emphasis": ["cost_comparison", "vendor_reliability", "contract_terms"],
-                "language_style": "formal, comparative, detail-oriented",
-                "default_tone": "formal"
-            },
-            "general": {
-                "focus": "balanced view of benefits and implementation",
-                "metrics_emphasis": ["roi", "implementation_timeline", "key_benefits"],
-                "language_style": "balanced, comprehensive, clear",
-                "default_tone": "formal"
-            }
-        }
+        # Persona profiles are shared, read-only, across instances
+        self.persona_profiles = _PERSONA_PROFILES
+        
+        # Business cases are cached briefly so narratives for several sections
+        # or personas of one case cost a single retrieval
+        self._business_case_cache = TTLCache(maxsize=1024, ttl=config.get('business_case_cache_ttl', 60))
+        self._business_case_fetches: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        
+        # Narrative builders specialized per (section, persona, metrics) shape,
+        # compiled on first use
+        self._narrative_builders: Dict[Tuple[str, Optional[str], bool], Callable[[Dict[str, Any]], str]] = {}
     
     async def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
         """
@@ -150,7 +295,7 @@ class NarrativeGeneratorAgent(BaseAgent):
         
         # Validate that business_case_id follows expected format
         business_case_id = inputs.get('business_case_id', '')
-        if not re.match(r'^bc_\d+$', business_case_id):
+        if not _BC_ID_RE.match(business_case_id):
             errors.append(f"Invalid business case ID format: {business_case_id}. Expected format: 'bc_' followed by numbers.")
         
         # Validate that highlight_keywords doesn't contain too many items
@@ -161,6 +306,42 @@ class NarrativeGeneratorAgent(BaseAgent):
         return errors
     
     async def _retrieve_business_case_data(self, business_case_id: str) -> Dict[str, Any]:
+        """
+        Retrieve business case data, served from a TTL cache when possible.
+        
+        Concurrent misses for the same business case share one fetch.
+        
+        Args:
+            business_case_id: ID of the business case to retrieve
+            
+        Returns:
+            Dictionary containing business case data
+        """
+        cached = self._business_case_cache.get(business_case_id)
+        if cached is not None:
+            return cached
+        
+        pending = self._business_case_fetches.get(business_case_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_business_case_data(business_case_id))
+            self._business_case_fetches[business_case_id] = pending
+            pending.add_done_callback(lambda _: self._business_case_fetches.pop(business_case_id, None))
+        
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        business_case_data = await asyncio.shield(pending)
+        self._business_case_cache.set(business_case_id, business_case_data)
+        return business_case_data
+    
+    def invalidate_business_case(self, business_case_id: str) -> None:
+        """
+        Drop a cached business case, e.g. after it was updated in the MCP.
+        
+        Args:
+            business_case_id: ID of the business case that changed
+        """
+        self._business_case_cache.pop(business_case_id)
+    
+    async def _fetch_business_case_data(self, business_case_id: str) -> Dict[str, Any]:
         """
         Retrieve business case data from MCP.
         
@@ -210,6 +391,43 @@ class NarrativeGeneratorAgent(BaseAgent):
             }
         }
     
+    def _narrative_builder(self, section_id: str, persona_key: str,
+                           include_metrics: bool) -> Callable[[Dict[str, Any]], str]:
+        """
+        Return the narrative builder specialized for one request shape.
+        
+        The section template, persona suffix and metrics sentence are joined
+        into one template whose fields are resolved once, so later requests
+        of the same shape skip all per-part dispatch.
+        
+        Args:
+            section_id: ID of the section to generate narrative for
+            persona_key: Casefolded stakeholder persona
+            include_metrics: Whether metrics were requested
+            
+        Returns:
+            Function rendering the narrative from business case data
+        """
+        suffix_key = persona_key if persona_key in self.PERSONA_SUFFIX_TEMPLATES else None
+        with_metrics = bool(include_metrics) and section_id in self._METRICS_SECTIONS
+        key = (section_id, suffix_key, with_metrics)
+        builder = self._narrative_builders.get(key)
+        if builder is not None:
+            return builder
+        
+        section_template = self.SECTION_TEMPLATES.get(section_id)
+        if section_template is None:
+            # Unknown sections are rare and unbounded, so they are not cached
+            escaped = section_id.replace("{", "{{").replace("}", "}}")
+            section_template = f"Content for the {escaped} section of {{project_name}}."
+        template = section_template + self.PERSONA_SUFFIX_TEMPLATES.get(suffix_key, "")
+        if with_metrics:
+            template += self.METRICS_TEMPLATE
+        builder = _template_builder(template)
+        if section_id in self.SECTION_TEMPLATES:
+            self._narrative_builders[key] = builder
+        return builder
+    
     async def _generate_section_narrative(self, section_id: str, business_case_data: Dict[str, Any],
                                         stakeholder_persona: str, tone: str,
                                         max_length: int, include_metrics: bool,
@@ -232,69 +450,15 @@ class NarrativeGeneratorAgent(BaseAgent):
         # In a real implementation, this would use an LLM to generate the narrative
         # For this example, we'll return template-based narratives
         
-        persona_profile = self.persona_profiles.get(stakeholder_persona.lower(), self.persona_profiles["general"])
+        persona_key = stakeholder_persona.casefold()
+        persona_profile = self.persona_profiles.get(persona_key, self.persona_profiles["general"])
         
-        # Get basic business case info
-        project_name = business_case_data.get("metadata", {}).get("project_name", "the project")
-        client_name = business_case_data.get("metadata", {}).get("client_name", "the client")
-        industry = business_case_data.get("metadata", {}).get("industry", "the industry")
-        
-        # Get ROI metrics if needed
-        roi_metrics = business_case_data.get("roi_metrics", {})
-        annual_roi = roi_metrics.get("annual_roi_percentage", 0)
-        payback_period = roi_metrics.get("payback_period_months", 0)
-        total_benefit = roi_metrics.get("total_annual_benefit", 0)
-        
-        # Base templates for each section
-        templates = {
-            "executive_summary": f"This business case presents a compelling opportunity for {client_name} to implement {project_name}, which is expected to deliver significant value through {', '.join(business_case_data.get('value_drivers', []))}. With an annual ROI of {annual_roi:.1f}% and a payback period of {payback_period:.1f} months, this initiative aligns with our strategic objectives while addressing critical business challenges.",
-            
-            "problem_statement": f"{client_name} is currently facing challenges related to {', '.join(business_case_data.get('value_drivers', []))}. These challenges are impacting operational efficiency, cost structure, and competitive positioning in the {industry} market.",
-            
-            "proposed_solution": f"The proposed {project_name} solution will address these challenges through a comprehensive approach that leverages cutting-edge technology and industry best practices. This solution has been designed specifically for {client_name}'s unique requirements in the {industry} sector.",
-            
-            "value_analysis": f"The implementation of {project_name} is expected to deliver value across multiple dimensions. Based on our analysis, the primary value drivers include {', '.join(business_case_data.get('value_drivers', []))}, with a total annual benefit of ${total_benefit:,.2f}.",
-            
-            "roi_calculation": f"Our financial analysis indicates a compelling return on investment for {project_name}. With an initial investment of ${roi_metrics.get('investment_amount', 0):,.2f}, we project an annual ROI of {annual_roi:.1f}%, a three-year ROI of {roi_metrics.get('three_year_roi_percentage', 0):.1f}%, and a payback period of {payback_period:.1f} months.",
-            
-            "implementation_plan": f"The implementation of {project_name} will follow a structured approach designed to minimize disruption while ensuring rapid value realization. The plan includes key phases for planning, deployment, testing, training, and ongoing optimization.",
-            
-            "conclusion": f"In conclusion, the {project_name} initiative represents a strategic opportunity for {client_name} to address critical business challenges while delivering substantial financial returns. With an annual ROI of {annual_roi:.1f}% and alignment with key strategic objectives, we recommend proceeding with this investment.",
-            
-            "regulatory_compliance": f"The {project_name} solution has been designed with full consideration of the regulatory requirements applicable to {client_name} in the {industry} industry. Our approach ensures compliance with all relevant standards while maintaining operational efficiency.",
-            
-            "risk_assessment": f"We have conducted a comprehensive risk assessment for the {project_name} initiative. Key risks have been identified and mitigation strategies developed to ensure successful implementation and value realization."
-        }
+        # Build the section text, tailored to the persona and with metrics if
+        # requested, in a single format call
+        base_narrative = self._narrative_builder(section_id, persona_key, include_metrics)(business_case_data)
         
-        # Get base narrative for the requested section
-        base_narrative = templates.get(section_id, f"Content for the {section_id} section of {project_name}.")
-        
-        # Tailor the narrative based on persona
-        if stakeholder_persona.lower() == "executive":
-            base_narrative += f" From an executive perspective, this initiative will contribute directly to strategic objectives while delivering measurable bottom-line impact of ${total_benefit:,.2f} annually."
-        
-        elif stakeholder_persona.lower() == "financial_buyer":
-            base_narrative += f" The financial analysis demonstrates a strong business case with an NPV of ${roi_metrics.get('net_present_value', 0):,.2f} and a payback period of {payback_period:.1f} months, providing a sound financial justification for this investment."
-        
-        elif stakeholder_persona.lower() == "technical_buyer":
-            base_narrative += f" The technical implementation has been carefully designed to integrate with existing systems while providing a scalable platform for future growth and innovation."
-        
-        # Add metrics if requested
-        if include_metrics and section_id in ["value_analysis", "roi_calculation", "executive_summary"]:
-            metrics_narrative = f" Key metrics include: Annual ROI: {annual_roi:.1f}%, Payback Period: {payback_period:.1f} months, Total Annual Benefit: ${total_benefit:,.2f}."
-            base_narrative += metrics_narrative
-        
-        # Highlight keywords if provided
-        for keyword in highlight_keywords:
-            if keyword.lower() in base_narrative.lower():
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                base_narrative = pattern.sub(f"**{keyword}**", base_narrative)
-        
-        # Ensure narrative doesn't exceed max length
-        if len(base_narrative) > max_length:
-            base_narrative = base_narrative[:max_length-3] + "..."
-        
-        return base_narrative
+        # Highlight keywords if provided, capped at max length
+        return _highlight_and_clip(base_narrative, highlight_keywords, max_length)
     
     async def execute(self, inputs: Dict[str, Any]) -> AgentResult:
         """
@@ -317,18 +481,75 @@ class NarrativeGeneratorAgent(BaseAgent):
                 execution_time_ms=int((time.monotonic() - start_time) * 1000)
             )
         
+        # Retrieve business case data and generate the narrative
+        retrieval = self._retrieve_business_case_data(inputs['business_case_id'])
+        return await self._narrate(inputs, retrieval, start_time)
+    
+    async def execute_batch(self, batch: List[Dict[str, Any]]) -> List[AgentResult]:
+        """
+        Execute narrative generation for several requests at once.
+        
+        Each business case is retrieved once no matter how many sections or
+        personas request it, and all narratives are generated concurrently.
+        
+        Args:
+            batch: List of input dictionaries, each as accepted by execute()
+            
+        Returns:
+            List of AgentResults in the same order as the batch
+        """
+        start_time = time.monotonic()
+        
+        # Use centralized validation
+        validation_results = await asyncio.gather(*(self.validate_inputs(inputs) for inputs in batch))
+        
+        # One shared retrieval per distinct business case
+        retrievals: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        for inputs, validation_result in zip(batch, validation_results):
+            business_case_id = inputs['business_case_id'] if validation_result.is_valid else None
+            if business_case_id is not None and business_case_id not in retrievals:
+                retrievals[business_case_id] = asyncio.ensure_future(
+                    self._retrieve_business_case_data(business_case_id)
+                )
+        
+        async def run(inputs: Dict[str, Any], validation_result: ValidationResult) -> AgentResult:
+            if not validation_result.is_valid:
+                return AgentResult(
+                    status=AgentStatus.FAILED,
+                    data={"error": validation_result.errors},
+                    execution_time_ms=int((time.monotonic() - start_time) * 1000)
+                )
+            return await self._narrate(inputs, retrievals[inputs['business_case_id']], start_time)
+        
+        return list(await asyncio.gather(*(
+            run(inputs, validation_result) for inputs, validation_result in zip(batch, validation_results)
+        )))
+    
+    async def _narrate(self, inputs: Dict[str, Any], retrieval: Awaitable[Dict[str, Any]],
+                       start_time: float) -> AgentResult:
+        """
+        Generate the narrative for one validated request.
+        
+        Args:
+            inputs: Dictionary of validated input values
+            retrieval: Awaitable yielding the business case data
+            start_time: time.monotonic() at which execution started
+            
+        Returns:
+            AgentResult: Result with the generated narrative
+        """
         # Extract validated inputs
-        business_case_id = inputs['business_case_id']
         section_id = inputs['section_id']
         stakeholder_persona = inputs['stakeholder_persona']
-        tone = inputs.get('tone', self.persona_profiles.get(stakeholder_persona.lower(), {}).get('default_tone', 'formal'))
+        persona_key = stakeholder_persona.casefold()
+        tone = inputs.get('tone', self.persona_profiles.get(persona_key, {}).get('default_tone', 'formal'))
         max_length = inputs.get('max_length', 2000)
         include_metrics = inputs.get('include_metrics', True)
         highlight_keywords = inputs.get('highlight_keywords', [])
         
         try:
             # Retrieve business case data
-            business_case_data = await self._retrieve_business_case_data(business_case_id)
+            business_case_data = await retrieval
             
             # Generate narrative for the requested section
             narrative = await self._generate_section_narrative(
@@ -348,7 +569,7 @@ class NarrativeGeneratorAgent(BaseAgent):
                 "stakeholder_persona": stakeholder_persona,
                 "tone": tone,
                 "character_count": len(narrative),
-                "word_count": len(narrative.split())
+                "word_count": _word_count(narrative)
             }
             
             # Log success
@@ -6,16 +6,130 @@ that suggests relevant business case templates based on industry input
 as part of the business case creation workflow.
 """
 
+import functools
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Mapping, Optional, Set, Tuple
 import re
 
-from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
+from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus, ValidationSpec
 from agents.core.mcp_client import MCPClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+def _trigrams(text: str) -> Set[str]:
+    """All three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+@functools.lru_cache(maxsize=None)
+def _stable_argsort() -> Callable[["np.ndarray"], "np.ndarray"]:
+    """
+    Stable ascending argsort over section counts.
+    
+    JIT-compiled with numba when it is installed; plain NumPy otherwise.
+    """
+    import numpy as np
+    
+    def argsort(lengths: "np.ndarray") -> "np.ndarray":
+        return np.argsort(lengths, kind='mergesort')
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return argsort
+    return njit(cache=True)(argsort)
+
+# Validation rules applied when the config does not define its own
+_VALIDATION_SPEC = ValidationSpec(
+    # Fields that must be present
+    required_fields=('industry',),
+    
+    # Type checking for fields
+    field_types=MappingProxyType({
+        'industry': 'string',
+        'company_size': 'string',
+        'project_name': 'string',
+        'client_name': 'string'
+    }),
+    
+    # Constraints for fields
+    field_constraints=MappingProxyType({
+        'industry': MappingProxyType({
+            'min_length': 2,
+            'max_length': 100
+        }),
+        'company_size': MappingProxyType({
+            'enum': ('small', 'medium', 'enterprise')
+        })
+    })
+)
+
+# Default template catalog, shared read-only by all agents. Industry entries
+# are tuples; the template dicts themselves are returned to callers and must
+# be treated as read-only.
+_DEFAULT_TEMPLATES: Mapping[str, Tuple[Dict[str, Any], ...]] = MappingProxyType({
+    "healthcare": (
+        {
+            "id": "healthcare_roi_template_001",
+            "name": "Healthcare Cost Reduction ROI Template",
+            "description": "Focuses on operational efficiency and cost reduction in healthcare settings",
+            "recommended_for": ["hospital", "clinic", "healthcare provider"],
+            "sections": ["Executive Summary", "Current State Analysis", "Solution Overview", 
+                        "Cost Reduction Analysis", "Implementation Timeline", "ROI Calculation"]
+        },
+        {
+            "id": "healthcare_patient_outcomes_002",
+            "name": "Patient Outcomes Improvement Template",
+            "description": "Emphasizes improvements in patient care quality and outcomes",
+            "recommended_for": ["hospital", "healthcare provider", "medical practice"],
+            "sections": ["Executive Summary", "Current Patient Metrics", "Solution Overview", 
+                        "Outcome Improvements", "Implementation Plan", "ROI and Value Analysis"]
+        },
+    ),
+    "manufacturing": (
+        {
+            "id": "manufacturing_efficiency_001",
+            "name": "Manufacturing Efficiency Template",
+            "description": "Focuses on production efficiency and waste reduction",
+            "recommended_for": ["manufacturer", "production facility"],
+            "sections": ["Executive Summary", "Current Production Analysis", "Solution Overview", 
+                        "Efficiency Gains", "Implementation Timeline", "ROI Calculation"]
+        },
+        {
+            "id": "manufacturing_quality_002",
+            "name": "Quality Improvement Template",
+            "description": "Emphasizes quality control and defect reduction",
+            "recommended_for": ["manufacturer", "production facility"],
+            "sections": ["Executive Summary", "Current Quality Metrics", "Solution Overview", 
+                        "Quality Improvements", "Implementation Plan", "ROI and Value Analysis"]
+        },
+    ),
+    "finance": (
+        {
+            "id": "finance_risk_001",
+            "name": "Financial Risk Mitigation Template",
+            "description": "Focuses on risk reduction and compliance",
+            "recommended_for": ["bank", "financial institution", "insurance"],
+            "sections": ["Executive Summary", "Risk Assessment", "Solution Overview", 
+                        "Risk Mitigation Strategy", "Implementation Timeline", "ROI Calculation"]
+        },
+    ),
+    "default": (
+        {
+            "id": "general_roi_001",
+            "name": "General ROI Analysis Template",
+            "description": "General purpose ROI analysis for any industry",
+            "recommended_for": ["any"],
+            "sections": ["Executive Summary", "Current State", "Solution Overview", 
+                        "Value Analysis", "Implementation Plan", "ROI Calculation"]
+        },
+    )
+})
+
 class TemplateSelectorAgent(BaseAgent):
     """
     Agent that suggests relevant business case templates based on industry input.
@@ -34,104 +148,131 @@ class TemplateSelectorAgent(BaseAgent):
             config: Configuration dictionary
         """
         # Define validation rules in config
-        if 'input_validation' not in config:
-            config['input_validation'] = {
-                # Fields that must be present
-                'required_fields': ['industry'],
-                
-                # Type checking for fields
-                'field_types': {
-                    'industry': 'string',
-                    'company_size': 'string',
-                    'project_name': 'string',
-                    'client_name': 'string'
-                },
-                
-                # Constraints for fields
-                'field_constraints': {
-                    'industry': {
-                        'min_length': 2,
-                        'max_length': 100
-                    },
-                    'company_size': {
-                        'enum': ['small', 'medium', 'enterprise']
-                    }
-                }
-            }
+        config.setdefault('input_validation', _VALIDATION_SPEC)
         
         super().__init__(agent_id, mcp_client, config)
         
         # Load template data from MCP or use defaults
         self._templates = self._load_templates()
+        
+        # Section counts per industry, precomputed for company-size ordering
+        import numpy as np
+        self._section_lens = {
+            industry: np.array([len(t.get('sections', [])) for t in templates], dtype=np.int32)
+            for industry, templates in self._templates.items()
+        }
+        self._build_industry_index()
+        self._build_size_orderings()
+        self._find_matching_templates_cached = functools.lru_cache(maxsize=512)(self._find_matching_templates_sync)
     
-    def _load_templates(self) -> Dict[str, Any]:
+    def _load_templates(self) -> Mapping[str, Any]:
         """
         Load template data from MCP or use defaults.
         
         In a real implementation, this would load from the MCP client.
         
         Returns:
-            Dict containing template definitions
+            Read-only mapping of industry to template definitions
         """
         # This is a simplified example - in production, templates would be loaded from MCP
-        return {
-            "healthcare": [
-                {
-                    "id": "healthcare_roi_template_001",
-                    "name": "Healthcare Cost Reduction ROI Template",
-                    "description": "Focuses on operational efficiency and cost reduction in healthcare settings",
-                    "recommended_for": ["hospital", "clinic", "healthcare provider"],
-                    "sections": ["Executive Summary", "Current State Analysis", "Solution Overview", 
-                                "Cost Reduction Analysis", "Implementation Timeline", "ROI Calculation"]
-                },
-                {
-                    "id": "healthcare_patient_outcomes_002",
-                    "name": "Patient Outcomes Improvement Template",
-                    "description": "Emphasizes improvements in patient care quality and outcomes",
-                    "recommended_for": ["hospital", "healthcare provider", "medical practice"],
-                    "sections": ["Executive Summary", "Current Patient Metrics", "Solution Overview", 
-                                "Outcome Improvements", "Implementation Plan", "ROI and Value Analysis"]
-                }
-            ],
-            "manufacturing": [
-                {
-                    "id": "manufacturing_efficiency_001",
-                    "name": "Manufacturing Efficiency Template",
-                    "description": "Focuses on production efficiency and waste reduction",
-                    "recommended_for": ["manufacturer", "production facility"],
-                    "sections": ["Executive Summary", "Current Production Analysis", "Solution Overview", 
-                                "Efficiency Gains", "Implementation Timeline", "ROI Calculation"]
-                },
-                {
-                    "id": "manufacturing_quality_002",
-                    "name": "Quality Improvement Template",
-                    "description": "Emphasizes quality control and defect reduction",
-                    "recommended_for": ["manufacturer", "production facility"],
-                    "sections": ["Executive Summary", "Current Quality Metrics", "Solution Overview", 
-                                "Quality Improvements", "Implementation Plan", "ROI and Value Analysis"]
-                }
-            ],
-            "finance": [
-                {
-                    "id": "finance_risk_001",
-                    "name": "Financial Risk Mitigation Template",
-                    "description": "Focuses on risk reduction and compliance",
-                    "recommended_for": ["bank", "financial institution", "insurance"],
-                    "sections": ["Executive Summary", "Risk Assessment", "Solution Overview", 
-                                "Risk Mitigation Strategy", "Implementation Timeline", "ROI Calculation"]
-                }
-            ],
-            "default": [
-                {
-                    "id": "general_roi_001",
-                    "name": "General ROI Analysis Template",
-                    "description": "General purpose ROI analysis for any industry",
-                    "recommended_for": ["any"],
-                    "sections": ["Executive Summary", "Current State", "Solution Overview", 
-                                "Value Analysis", "Implementation Plan", "ROI Calculation"]
-                }
-            ]
-        }
+        return _DEFAULT_TEMPLATES
+    
+    def _build_industry_index(self) -> None:
+        """
+        Index industry keys by trigram for partial-match lookups.
+        
+        A query can only be a substring of keys containing all of its
+        trigrams, and a key of three or more characters can only be a
+        substring of a query containing the key's leading trigram, so
+        partial matching only has to check those candidates.
+        """
+        self._industry_rank: Dict[str, int] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._leading_trigram_index: Dict[str, Set[str]] = {}
+        self._short_industries: Set[str] = set()
+        
+        for industry in self._templates:
+            if industry == 'default':
+                continue
+            self._industry_rank[industry] = len(self._industry_rank)
+            if len(industry) < 3:
+                self._short_industries.add(industry)
+                continue
+            for trigram in _trigrams(industry):
+                self._trigram_index.setdefault(trigram, set()).add(industry)
+            self._leading_trigram_index.setdefault(industry[:3], set()).add(industry)
+    
+    def _build_size_orderings(self) -> None:
+        """
+        Precompute each industry's templates in every company-size order.
+        
+        Exact industry matches then resolve to a ready-made tuple instead of
+        being ordered per query.
+        """
+        self._templates_by_size: Dict[Tuple[str, Optional[str]], Tuple[Dict[str, Any], ...]] = {}
+        
+        for industry, templates in self._templates.items():
+            if not templates:
+                continue
+            templates = tuple(templates)
+            for company_size in (None, 'small', 'medium', 'enterprise'):
+                self._templates_by_size[(industry, company_size)] = self._order_for_size(
+                    templates, self._section_lens[industry], company_size
+                )
+    
+    @staticmethod
+    def _order_for_size(templates: Tuple[Dict[str, Any], ...], lens: "np.ndarray",
+                        company_size: Optional[str]) -> Tuple[Dict[str, Any], ...]:
+        """
+        Order templates for a company size.
+        
+        Args:
+            templates: Matching templates in catalog order
+            lens: Section count of each template
+            company_size: Optional company size to prioritize templates for
+            
+        Returns:
+            Tuple of templates in priority order
+        """
+        # This is a simplified example - in production, we would have more sophisticated matching logic
+        # For now, we'll just prioritize templates that might be more relevant for the company size.
+        # A stable sort over equal counts would keep catalog order
+        if company_size not in ('enterprise', 'small') or len(templates) < 2 or lens.min() == lens.max():
+            return templates
+        
+        if company_size == 'enterprise':
+            # Move more comprehensive templates to the front
+            order = _stable_argsort()(-lens)
+        else:
+            # Move simpler templates to the front
+            order = _stable_argsort()(lens)
+        return tuple(templates[i] for i in order)
+    
+    def _partial_industry_matches(self, industry_lower: str) -> List[str]:
+        """
+        Industries that contain, or are contained in, the normalized query.
+        
+        Args:
+            industry_lower: Lowercased industry query
+            
+        Returns:
+            Matching industry keys with templates, in catalog order
+        """
+        if len(industry_lower) < 3:
+            candidates = self._industry_rank.keys()
+        else:
+            query_trigrams = _trigrams(industry_lower)
+            containing = set.intersection(*(self._trigram_index.get(t, set()) for t in query_trigrams))
+            contained = self._short_industries.union(
+                *(self._leading_trigram_index.get(t, ()) for t in query_trigrams)
+            )
+            candidates = containing | contained
+        
+        return sorted(
+            (ind for ind in candidates
+             if self._templates[ind] and (ind in industry_lower or industry_lower in ind)),
+            key=self._industry_rank.__getitem__
+        )
     
     async def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
         """
@@ -164,7 +305,8 @@ class TemplateSelectorAgent(BaseAgent):
         
         return errors
     
-    async def _find_matching_templates(self, industry: str, company_size: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def _find_matching_templates(self, industry: str,
+                                       company_size: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
         """
         Find templates that match the given industry and company size.
         
@@ -173,34 +315,50 @@ class TemplateSelectorAgent(BaseAgent):
             company_size: Optional company size to further filter templates
             
         Returns:
-            List of matching template dictionaries
+            Read-only tuple of matching template dictionaries
         """
-        # Normalize industry name for matching
+        # Normalize industry name for matching; exact matches are precomputed
+        # and, as the catalog is fixed after loading, other queries are
+        # answered from the cache on repeat
         industry_lower = industry.lower()
+        precomputed = self._templates_by_size.get((industry_lower, company_size))
+        if precomputed is not None:
+            return precomputed
+        return self._find_matching_templates_cached(industry_lower, company_size)
+    
+    def _find_matching_templates_sync(self, industry_lower: str,
+                                      company_size: Optional[str]) -> Tuple[Dict[str, Any], ...]:
+        """
+        Match templates for a normalized industry and company size.
         
+        Args:
+            industry_lower: Lowercased industry name to match
+            company_size: Optional company size to further filter templates
+            
+        Returns:
+            Tuple of matching template dictionaries
+        """
         # Find exact industry match first
-        matching_templates = self._templates.get(industry_lower, [])
+        matched_industries = [industry_lower] if self._templates.get(industry_lower) else []
         
         # If no exact match, try to find partial matches
-        if not matching_templates:
-            for ind, templates in self._templates.items():
-                if ind != 'default' and (ind in industry_lower or industry_lower in ind):
-                    matching_templates.extend(templates)
+        if not matched_industries:
+            matched_industries = self._partial_industry_matches(industry_lower)
         
         # If still no matches, use default templates
-        if not matching_templates:
-            matching_templates = self._templates.get('default', [])
+        if not matched_industries and 'default' in self._templates:
+            matched_industries = ['default']
+        
+        matching_templates = tuple(t for ind in matched_industries for t in self._templates[ind])
         
         # Filter by company size if provided
-        if company_size and matching_templates:
-            # This is a simplified example - in production, we would have more sophisticated matching logic
-            # For now, we'll just prioritize templates that might be more relevant for the company size
-            if company_size == 'enterprise':
-                # Move more comprehensive templates to the front
-                matching_templates.sort(key=lambda t: len(t.get('sections', [])), reverse=True)
-            elif company_size == 'small':
-                # Move simpler templates to the front
-                matching_templates.sort(key=lambda t: len(t.get('sections', [])))
+        if company_size in ('enterprise', 'small') and len(matching_templates) > 1:
+            # Ordering uses the precomputed section counts and leaves the
+            # catalog itself untouched
+            import numpy as np
+            lens = self._section_lens[matched_industries[0]] if len(matched_industries) == 1 else \
+                np.concatenate([self._section_lens[ind] for ind in matched_industries])
+            matching_templates = self._order_for_size(matching_templates, lens, company_size)
         
         return matching_templates
     
@@ -233,16 +391,17 @@ class TemplateSelectorAgent(BaseAgent):
         
         # Find matching templates
         matching_templates = await self._find_matching_templates(industry, company_size)
+        match_count = len(matching_templates)
         
         # Log the result
-        logger.info(f"Found {len(matching_templates)} matching templates for industry '{industry}'")
+        logger.info("Found %d matching templates for industry '%s'", match_count, industry)
         
         # Prepare result data
         result_data = {
             "suggested_templates": matching_templates,
             "industry": industry,
             "company_size": company_size,
-            "match_count": len(matching_templates),
+            "match_count": match_count,
             "project_name": project_name,
             "client_name": client_name
         }
@@ -6,14 +6,36 @@ centralized input validation features.
 """
 
 import logging
+import math
+import re
 from typing import Dict, Any, List
 import time
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
 
 logger = logging.getLogger(__name__)
 
+# Customer IDs look like CUST-123456
+_CUSTOMER_ID_RE = re.compile(r'^CUST-\d{6}$')
+
+# Lowest price accepted for premium products
+_MIN_PREMIUM_PRICE = Decimal(100)
+
+def _is_finite(price: Any) -> bool:
+    """Whether a price is anything other than a NaN or infinite float or Decimal."""
+    if isinstance(price, Decimal):
+        return price.is_finite()
+    if isinstance(price, float):
+        return math.isfinite(price)
+    return True
+
+# Status fields shared by every successful result; only ever copied
+_SUCCESS_TEMPLATE = {
+    "validation_status": "passed",
+    "processing_result": "success"
+}
+
 class ValidationExampleAgent(BaseAgent):
     """Example agent demonstrating centralized input validation."""
 
@@ -44,7 +66,7 @@ class ValidationExampleAgent(BaseAgent):
                 # Constraints for fields
                 'field_constraints': {
                     'customer_id': {
-                        'pattern': r'^CUST-\d{6}$'  # Must match pattern CUST-123456
+                        'pattern': _CUSTOMER_ID_RE  # Must match pattern CUST-123456
                     },
                     'age': {
                         'min': 18,
@@ -59,7 +81,7 @@ class ValidationExampleAgent(BaseAgent):
         
         super().__init__(agent_id, mcp_client, config)
     
-    async def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
+    def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
         """
         Perform agent-specific custom validations.
         
@@ -75,22 +97,28 @@ class ValidationExampleAgent(BaseAgent):
         product_data = inputs.get('product_data', {})
         
         # Check that product_data has required structure
-        if not product_data.get('category'):
+        category = product_data.get('category')
+        if not category:
             errors.append("Product data must include a category")
         
         if 'price' in product_data:
             price = product_data['price']
-            # Convert string price to decimal if needed
-            if isinstance(price, str):
-                try:
+            try:
+                # Convert string price to decimal if needed; Decimal signals
+                # unparseable strings with InvalidOperation
+                if isinstance(price, str):
                     price = Decimal(price)
-                    product_data['price'] = price  # Update with converted value
-                except (ValueError, TypeError):
-                    errors.append("Product price must be a valid number")
-            
-            # Business rule: premium products must have a minimum price
-            if product_data.get('category') == 'premium' and isinstance(price, (int, float, Decimal)) and price < 100:
-                errors.append("Premium products must have a price of at least 100")
+                # NaN and infinity cannot be ordered against the minimum price
+                if not _is_finite(price):
+                    raise InvalidOperation(price)
+            except InvalidOperation:
+                errors.append("Product price must be a valid number")
+            else:
+                product_data['price'] = price  # Update with converted value
+                
+                # Business rule: premium products must have a minimum price
+                if category == 'premium' and isinstance(price, (int, float, Decimal)) and price < _MIN_PREMIUM_PRICE:
+                    errors.append("Premium products must have a price of at least 100")
         
         return errors
     
@@ -104,33 +132,31 @@ class ValidationExampleAgent(BaseAgent):
         Returns:
             AgentResult: Result of the agent execution
         """
-        start_time = time.monotonic()
+        start_ns = time.monotonic_ns()
         
         # Use centralized validation
         validation_result = await self.validate_inputs(inputs)
         if not validation_result.is_valid:
-            return AgentResult(
-                status=AgentStatus.FAILED, 
-                data={"error": validation_result.errors}, 
-                execution_time_ms=int((time.monotonic() - start_time) * 1000)
-            )
-        
-        # If validation passes, proceed with agent logic
-        customer_id = inputs['customer_id']
-        product_data = inputs['product_data']
-        
-        # Example agent logic
-        result_data = {
-            "customer_id": customer_id,
-            "product_category": product_data.get('category'),
-            "validation_status": "passed",
-            "processing_result": "success"
-        }
-        
-        logger.info(f"Successfully processed data for customer {customer_id}")
+            status, data = AgentStatus.FAILED, {"error": validation_result.errors}
+        else:
+            # If validation passes, proceed with agent logic
+            customer_id = inputs['customer_id']
+            product_data = inputs['product_data']
+            
+            # Example agent logic
+            result_data = {
+                "customer_id": customer_id,
+                "product_category": product_data.get('category'),
+                **_SUCCESS_TEMPLATE
+            }
+            
+            logger.info(f"Successfully processed data for customer {customer_id}")
+            
+            status, data = AgentStatus.COMPLETED, result_data
         
+        # Single exit for success and failure
         return AgentResult(
-            status=AgentStatus.COMPLETED,
-            data=result_data,
-            execution_time_ms=int((time.monotonic() - start_time) * 1000)
+            status=status,
+            data=data,
+            execution_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000
         )
@@ -6,9 +6,11 @@ that suggests specific metrics based on selected value drivers
 as part of the business case creation workflow.
 """
 
+import functools
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from decimal import Decimal
 
 from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
@@ -16,6 +18,268 @@ from agents.core.mcp_client import MCPClient
 
 logger = logging.getLogger(__name__)
 
+# Default metric definitions by driver type
+_METRIC_SPECS = {
+    "cost_reduction": {
+        "base_metrics": [
+            {
+                "id": "current_operational_cost",
+                "name": "Current Operational Cost",
+                "description": "The current annual operational cost in the target area",
+                "type": "number",
+                "unit": "currency",
+                "required": True
+            },
+            {
+                "id": "expected_cost_reduction_percentage",
+                "name": "Expected Cost Reduction Percentage",
+                "description": "The expected percentage reduction in operational costs",
+                "type": "number",
+                "unit": "percentage",
+                "min": 0,
+                "max": 100,
+                "required": True
+            }
+        ],
+        "industry_specific": {
+            "healthcare": [
+                {
+                    "id": "current_readmission_rate",
+                    "name": "Current Readmission Rate",
+                    "description": "The current patient readmission rate",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                },
+                {
+                    "id": "expected_readmission_reduction",
+                    "name": "Expected Readmission Reduction",
+                    "description": "The expected reduction in readmission rate",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                }
+            ],
+            "manufacturing": [
+                {
+                    "id": "current_defect_rate",
+                    "name": "Current Defect Rate",
+                    "description": "The current manufacturing defect rate",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                },
+                {
+                    "id": "expected_defect_reduction",
+                    "name": "Expected Defect Reduction",
+                    "description": "The expected reduction in defect rate",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                }
+            ]
+        }
+    },
+    "revenue_growth": {
+        "base_metrics": [
+            {
+                "id": "current_annual_revenue",
+                "name": "Current Annual Revenue",
+                "description": "The current annual revenue in the target area",
+                "type": "number",
+                "unit": "currency",
+                "required": True
+            },
+            {
+                "id": "expected_revenue_growth_percentage",
+                "name": "Expected Revenue Growth Percentage",
+                "description": "The expected percentage increase in revenue",
+                "type": "number",
+                "unit": "percentage",
+                "min": 0,
+                "required": True
+            }
+        ],
+        "industry_specific": {
+            "retail": [
+                {
+                    "id": "current_customer_acquisition_cost",
+                    "name": "Current Customer Acquisition Cost",
+                    "description": "The current cost to acquire a new customer",
+                    "type": "number",
+                    "unit": "currency"
+                },
+                {
+                    "id": "expected_cac_reduction",
+                    "name": "Expected CAC Reduction",
+                    "description": "The expected reduction in customer acquisition cost",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                }
+            ]
+        }
+    },
+    "productivity_gains": {
+        "base_metrics": [
+            {
+                "id": "current_process_time",
+                "name": "Current Process Time",
+                "description": "The current time required to complete the process",
+                "type": "number",
+                "unit": "hours",
+                "required": True
+            },
+            {
+                "id": "expected_time_savings_percentage",
+                "name": "Expected Time Savings Percentage",
+                "description": "The expected percentage reduction in process time",
+                "type": "number",
+                "unit": "percentage",
+                "min": 0,
+                "max": 100,
+                "required": True
+            },
+            {
+                "id": "affected_employee_count",
+                "name": "Affected Employee Count",
+                "description": "The number of employees affected by the process",
+                "type": "integer",
+                "min": 1,
+                "required": True
+            },
+            {
+                "id": "average_hourly_rate",
+                "name": "Average Hourly Rate",
+                "description": "The average hourly rate of affected employees",
+                "type": "number",
+                "unit": "currency",
+                "min": 0,
+                "required": True
+            }
+        ]
+    },
+    "risk_mitigation": {
+        "base_metrics": [
+            {
+                "id": "current_annual_risk_cost",
+                "name": "Current Annual Risk Cost",
+                "description": "The current estimated annual cost of the risk",
+                "type": "number",
+                "unit": "currency",
+                "required": True
+            },
+            {
+                "id": "risk_probability_percentage",
+                "name": "Risk Probability Percentage",
+                "description": "The probability of the risk occurring",
+                "type": "number",
+                "unit": "percentage",
+                "min": 0,
+                "max": 100,
+                "required": True
+            },
+            {
+                "id": "expected_risk_reduction_percentage",
+                "name": "Expected Risk Reduction Percentage",
+                "description": "The expected percentage reduction in risk probability",
+                "type": "number",
+                "unit": "percentage",
+                "min": 0,
+                "max": 100,
+                "required": True
+            }
+        ],
+        "industry_specific": {
+            "finance": [
+                {
+                    "id": "current_compliance_violation_rate",
+                    "name": "Current Compliance Violation Rate",
+                    "description": "The current rate of compliance violations",
+                    "type": "number",
+                    "unit": "percentage",
+                    "min": 0,
+                    "max": 100
+                },
+                {
+                    "id": "average_violation_cost",
+                    "name": "Average Violation Cost",
+                    "description": "The average cost per compliance violation",
+                    "type": "number",
+                    "unit": "currency",
+                    "min": 0
+                }
+            ]
+        }
+    }
+}
+
+def _freeze_driver_metrics(spec: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Build the read-only form of a driver's metric definitions.
+    
+    Metric lists become tuples and every driver gets an industry map, so
+    lookups need no fallbacks. The metric dicts themselves are returned to
+    callers and must be treated as read-only.
+    """
+    return MappingProxyType({
+        "base_metrics": tuple(spec.get("base_metrics", ())),
+        "industry_specific": MappingProxyType({
+            industry: tuple(metrics) for industry, metrics in spec.get("industry_specific", {}).items()
+        })
+    })
+
+# Metric definitions by driver type, built once at import and shared by all agents
+_METRICS_BY_DRIVER: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    driver: _freeze_driver_metrics(spec) for driver, spec in _METRIC_SPECS.items()
+})
+
+def _flatten_metrics(
+    metrics_by_driver: Mapping[str, Mapping[str, Any]]
+) -> Mapping[Tuple[str, Optional[str]], Tuple[Dict[str, Any], ...]]:
+    """
+    Flatten metric definitions into a (driver, industry) lookup table.
+    
+    (driver, None) maps to the driver's base metrics and (driver, industry)
+    to the base metrics followed by that industry's, so a suggestion is a
+    single lookup per driver.
+    """
+    table = {}
+    for driver, definitions in metrics_by_driver.items():
+        base_metrics = tuple(definitions.get('base_metrics', ()))
+        table[(driver, None)] = base_metrics
+        for industry, metrics in definitions.get('industry_specific', {}).items():
+            table[(driver, industry)] = base_metrics + tuple(metrics)
+    return MappingProxyType(table)
+
+_METRICS_FLAT = _flatten_metrics(_METRICS_BY_DRIVER)
+
+def _single_driver_suggestions(
+    metrics_table: Mapping[Tuple[str, Optional[str]], Tuple[Dict[str, Any], ...]]
+) -> Mapping[str, Tuple[Mapping[str, Tuple[Dict[str, Any], ...]], int]]:
+    """
+    Precompute suggestions for a single driver without an industry.
+    
+    One driver at a time with no industry filter is the most common request,
+    so its (suggested metrics, total count) pair is built ahead of time.
+    """
+    return MappingProxyType({
+        driver: (MappingProxyType({driver: metrics}), len(metrics))
+        for (driver, industry), metrics in metrics_table.items() if industry is None
+    })
+
+_SINGLE_DRIVER_SUGGESTIONS = _single_driver_suggestions(_METRICS_FLAT)
+
+# Driver types accepted in selected_drivers
+_VALID_DRIVER_TYPES = ("cost_reduction", "revenue_growth", "productivity_gains", "risk_mitigation")
+_VALID_DRIVERS = frozenset(_VALID_DRIVER_TYPES)
+_VALID_DRIVERS_LIST = ', '.join(_VALID_DRIVER_TYPES)
+
 class ValueDriverAgent(BaseAgent):
     """
     Agent that suggests metrics based on selected value drivers.
@@ -59,218 +323,27 @@ class ValueDriverAgent(BaseAgent):
         
         # Load metric definitions from MCP or use defaults
         self._metrics_by_driver = self._load_metrics_by_driver()
+        if self._metrics_by_driver is _METRICS_BY_DRIVER:
+            self._metrics_table = _METRICS_FLAT
+            self._single_driver_suggestions = _SINGLE_DRIVER_SUGGESTIONS
+        else:
+            self._metrics_table = _flatten_metrics(self._metrics_by_driver)
+            self._single_driver_suggestions = _single_driver_suggestions(self._metrics_table)
+        self._suggested_metrics_cached = functools.lru_cache(maxsize=256)(self._compute_suggested_metrics)
     
-    def _load_metrics_by_driver(self) -> Dict[str, Any]:
+    def _load_metrics_by_driver(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Load metric definitions from MCP or use defaults.
         
         In a real implementation, this would load from the MCP client.
         
         Returns:
-            Dict containing metric definitions by driver type
+            Read-only mapping of driver type to metric definitions
         """
         # This is a simplified example - in production, metrics would be loaded from MCP
-        return {
-            "cost_reduction": {
-                "base_metrics": [
-                    {
-                        "id": "current_operational_cost",
-                        "name": "Current Operational Cost",
-                        "description": "The current annual operational cost in the target area",
-                        "type": "number",
-                        "unit": "currency",
-                        "required": True
-                    },
-                    {
-                        "id": "expected_cost_reduction_percentage",
-                        "name": "Expected Cost Reduction Percentage",
-                        "description": "The expected percentage reduction in operational costs",
-                        "type": "number",
-                        "unit": "percentage",
-                        "min": 0,
-                        "max": 100,
-                        "required": True
-                    }
-                ],
-                "industry_specific": {
-                    "healthcare": [
-                        {
-                            "id": "current_readmission_rate",
-                            "name": "Current Readmission Rate",
-                            "description": "The current patient readmission rate",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        },
-                        {
-                            "id": "expected_readmission_reduction",
-                            "name": "Expected Readmission Reduction",
-                            "description": "The expected reduction in readmission rate",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        }
-                    ],
-                    "manufacturing": [
-                        {
-                            "id": "current_defect_rate",
-                            "name": "Current Defect Rate",
-                            "description": "The current manufacturing defect rate",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        },
-                        {
-                            "id": "expected_defect_reduction",
-                            "name": "Expected Defect Reduction",
-                            "description": "The expected reduction in defect rate",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        }
-                    ]
-                }
-            },
-            "revenue_growth": {
-                "base_metrics": [
-                    {
-                        "id": "current_annual_revenue",
-                        "name": "Current Annual Revenue",
-                        "description": "The current annual revenue in the target area",
-                        "type": "number",
-                        "unit": "currency",
-                        "required": True
-                    },
-                    {
-                        "id": "expected_revenue_growth_percentage",
-                        "name": "Expected Revenue Growth Percentage",
-                        "description": "The expected percentage increase in revenue",
-                        "type": "number",
-                        "unit": "percentage",
-                        "min": 0,
-                        "required": True
-                    }
-                ],
-                "industry_specific": {
-                    "retail": [
-                        {
-                            "id": "current_customer_acquisition_cost",
-                            "name": "Current Customer Acquisition Cost",
-                            "description": "The current cost to acquire a new customer",
-                            "type": "number",
-                            "unit": "currency"
-                        },
-                        {
-                            "id": "expected_cac_reduction",
-                            "name": "Expected CAC Reduction",
-                            "description": "The expected reduction in customer acquisition cost",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        }
-                    ]
-                }
-            },
-            "productivity_gains": {
-                "base_metrics": [
-                    {
-                        "id": "current_process_time",
-                        "name": "Current Process Time",
-                        "description": "The current time required to complete the process",
-                        "type": "number",
-                        "unit": "hours",
-                        "required": True
-                    },
-                    {
-                        "id": "expected_time_savings_percentage",
-                        "name": "Expected Time Savings Percentage",
-                        "description": "The expected percentage reduction in process time",
-                        "type": "number",
-                        "unit": "percentage",
-                        "min": 0,
-                        "max": 100,
-                        "required": True
-                    },
-                    {
-                        "id": "affected_employee_count",
-                        "name": "Affected Employee Count",
-                        "description": "The number of employees affected by the process",
-                        "type": "integer",
-                        "min": 1,
-                        "required": True
-                    },
-                    {
-                        "id": "average_hourly_rate",
-                        "name": "Average Hourly Rate",
-                        "description": "The average hourly rate of affected employees",
-                        "type": "number",
-                        "unit": "currency",
-                        "min": 0,
-                        "required": True
-                    }
-                ]
-            },
-            "risk_mitigation": {
-                "base_metrics": [
-                    {
-                        "id": "current_annual_risk_cost",
-                        "name": "Current Annual Risk Cost",
-                        "description": "The current estimated annual cost of the risk",
-                        "type": "number",
-                        "unit": "currency",
-                        "required": True
-                    },
-                    {
-                        "id": "risk_probability_percentage",
-                        "name": "Risk Probability Percentage",
-                        "description": "The probability of the risk occurring",
-                        "type": "number",
-                        "unit": "percentage",
-                        "min": 0,
-                        "max": 100,
-                        "required": True
-                    },
-                    {
-                        "id": "expected_risk_reduction_percentage",
-                        "name": "Expected Risk Reduction Percentage",
-                        "description": "The expected percentage reduction in risk probability",
-                        "type": "number",
-                        "unit": "percentage",
-                        "min": 0,
-                        "max": 100,
-                        "required": True
-                    }
-                ],
-                "industry_specific": {
-                    "finance": [
-                        {
-                            "id": "current_compliance_violation_rate",
-                            "name": "Current Compliance Violation Rate",
-                            "description": "The current rate of compliance violations",
-                            "type": "number",
-                            "unit": "percentage",
-                            "min": 0,
-                            "max": 100
-                        },
-                        {
-                            "id": "average_violation_cost",
-                            "name": "Average Violation Cost",
-                            "description": "The average cost per compliance violation",
-                            "type": "number",
-                            "unit": "currency",
-                            "min": 0
-                        }
-                    ]
-                }
-            }
-        }
+        return _METRICS_BY_DRIVER
     
-    async def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
+    def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
         """
         Perform value driver-specific validations.
         
@@ -282,18 +355,21 @@ class ValueDriverAgent(BaseAgent):
         """
         errors = []
         
-        # Validate that selected drivers are recognized
-        valid_drivers = ["cost_reduction", "revenue_growth", "productivity_gains", "risk_mitigation"]
+        # Validate that selected drivers are recognized; non-string items are
+        # never valid and may not be hashable
         selected_drivers = inputs.get('selected_drivers', [])
         
         if isinstance(selected_drivers, list):
-            for driver in selected_drivers:
-                if driver not in valid_drivers:
-                    errors.append(f"Unrecognized driver type: {driver}. Valid types are: {', '.join(valid_drivers)}")
+            errors.extend(
+                f"Unrecognized driver type: {driver}. Valid types are: {_VALID_DRIVERS_LIST}"
+                for driver in selected_drivers
+                if not (isinstance(driver, str) and driver in _VALID_DRIVERS)
+            )
         
         return errors
     
-    async def _get_suggested_metrics(self, selected_drivers: List[str], industry: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    def _get_suggested_metrics(self, selected_drivers: List[str],
+                               industry: Optional[str] = None) -> Tuple[Dict[str, Tuple[Dict[str, Any], ...]], int]:
         """
         Get suggested metrics for the selected value drivers.
         
@@ -302,26 +378,57 @@ class ValueDriverAgent(BaseAgent):
             industry: Optional industry to get industry-specific metrics
             
         Returns:
-            Dictionary mapping driver types to lists of suggested metrics
+            Tuple of a dictionary mapping driver types to read-only tuples of
+            suggested metrics, and the total number of suggested metrics
+        """
+        # A single known driver without an industry is answered from the
+        # precomputed suggestions
+        if len(selected_drivers) == 1 and not industry:
+            single = self._single_driver_suggestions.get(selected_drivers[0])
+            if single is not None:
+                return dict(single[0]), single[1]
+        
+        # The metric catalog is fixed after loading, so repeat queries are
+        # answered from the cache
+        suggested_metrics, total_metric_count = self._suggested_metrics_cached(tuple(selected_drivers), industry)
+        return dict(suggested_metrics), total_metric_count
+    
+    def _compute_suggested_metrics(
+        self, selected_drivers: Tuple[str, ...], industry: Optional[str]
+    ) -> Tuple[Mapping[str, Tuple[Dict[str, Any], ...]], int]:
+        """
+        Collect suggested metrics for a tuple of value drivers.
+        
+        Args:
+            selected_drivers: Tuple of selected value driver types
+            industry: Optional industry to get industry-specific metrics
+            
+        Returns:
+            Tuple of a read-only mapping of driver types to tuples of suggested
+            metrics, and the total number of suggested metrics
         """
+        metrics_table = self._metrics_table
+        industry_key = industry.lower() if industry else None
         suggested_metrics = {}
+        total_metric_count = 0
         
         for driver in selected_drivers:
-            if driver in self._metrics_by_driver:
-                driver_metrics = []
-                
-                # Add base metrics for this driver
-                driver_metrics.extend(self._metrics_by_driver[driver].get('base_metrics', []))
-                
-                # Add industry-specific metrics if applicable
-                if industry and industry.lower() in self._metrics_by_driver[driver].get('industry_specific', {}):
-                    driver_metrics.extend(
-                        self._metrics_by_driver[driver]['industry_specific'][industry.lower()]
-                    )
-                
-                suggested_metrics[driver] = driver_metrics
+            # Repeated drivers are suggested, and counted, once
+            if driver in suggested_metrics:
+                continue
+            base_metrics = metrics_table.get((driver, None))
+            if base_metrics is None:
+                continue
+            if industry_key is None:
+                metrics = base_metrics
+            else:
+                # Base plus industry-specific metrics where the industry has
+                # any, base metrics otherwise
+                metrics = metrics_table.get((driver, industry_key), base_metrics)
+            suggested_metrics[driver] = metrics
+            total_metric_count += len(metrics)
         
-        return suggested_metrics
+        return MappingProxyType(suggested_metrics), total_metric_count
     
     async def execute(self, inputs: Dict[str, Any]) -> AgentResult:
         """
@@ -333,41 +440,36 @@ class ValueDriverAgent(BaseAgent):
         Returns:
             AgentResult: Result of the agent execution with suggested metrics
         """
-        start_time = time.monotonic()
+        start_ns = time.monotonic_ns()
         
         # Use centralized validation
         validation_result = await self.validate_inputs(inputs)
         if not validation_result.is_valid:
-            return AgentResult(
-                status=AgentStatus.FAILED, 
-                data={"error": validation_result.errors}, 
-                execution_time_ms=int((time.monotonic() - start_time) * 1000)
-            )
-        
-        # Extract validated inputs
-        selected_drivers = inputs['selected_drivers']
-        industry = inputs.get('industry')
-        
-        # Get suggested metrics for the selected drivers
-        suggested_metrics = await self._get_suggested_metrics(selected_drivers, industry)
-        
-        # Log the result
-        logger.info(f"Suggested metrics for {len(selected_drivers)} drivers")
-        
-        # Calculate total number of suggested metrics
-        total_metric_count = sum(len(metrics) for metrics in suggested_metrics.values())
-        
-        # Prepare result data
-        result_data = {
-            "suggested_metrics": suggested_metrics,
-            "selected_drivers": selected_drivers,
-            "industry": industry,
-            "total_metric_count": total_metric_count
-        }
+            status, data = AgentStatus.FAILED, {"error": validation_result.errors}
+        else:
+            # Extract validated inputs
+            selected_drivers = inputs['selected_drivers']
+            industry = inputs.get('industry')
+            
+            # Get suggested metrics, and their total number, for the selected drivers
+            suggested_metrics, total_metric_count = self._get_suggested_metrics(selected_drivers, industry)
+            
+            # Log the result
+            logger.info(f"Suggested metrics for {len(selected_drivers)} drivers")
+            
+            # Prepare result data
+            result_data = {
+                "suggested_metrics": suggested_metrics,
+                "selected_drivers": selected_drivers,
+                "industry": industry,
+                "total_metric_count": total_metric_count
+            }
+            
+            status, data = AgentStatus.COMPLETED, result_data
         
-        # Return successful result
+        # Single exit for success and failure
         return AgentResult(
-            status=AgentStatus.COMPLETED,
-            data=result_data,
-            execution_time_ms=int((time.monotonic() - start_time) * 1000)
+            status=status,
+            data=data,
+            execution_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000
         )
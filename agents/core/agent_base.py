@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union, Type, Callable, TypeVar, cast
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Union, Type, Callable, TypeVar, cast
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import asyncio
+import contextvars
+import functools
+import inspect
 import time
 import logging
 import re
@@ -55,12 +59,235 @@ class RetryPolicy:
                     raise e
                 await asyncio.sleep(self.backoff_factor ** attempt)
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of input validation with detailed error information."""
     is_valid: bool
     errors: List[str] = field(default_factory=list)
 
+@dataclass(frozen=True, slots=True)
+class ValidationSpec:
+    """Immutable input validation rules, built once and shared across agent instances.
+    
+    Carries the same schema as an ``input_validation`` config dict and can be
+    used in its place.
+    """
+    required_fields: Tuple[str, ...] = ()
+    field_types: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    field_constraints: Mapping[str, Mapping[str, Any]] = field(default_factory=lambda: MappingProxyType({}))
+
+# Simple email validation regex
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_TYPE_CHECKS: Mapping[str, Callable[[Any], bool]] = MappingProxyType({
+    'string': lambda value: isinstance(value, str),
+    'number': lambda value: isinstance(value, (int, float, Decimal)),
+    'integer': lambda value: isinstance(value, int),
+    'boolean': lambda value: isinstance(value, bool),
+    'array': lambda value: isinstance(value, list),
+    'object': lambda value: isinstance(value, dict),
+    'email': lambda value: isinstance(value, str) and _EMAIL_RE.match(value) is not None,
+})
+
+FieldCheck = Callable[[Any, List[str]], None]
+
+def _compile_constraints(field: str, constraints: Mapping[str, Any]) -> Tuple[FieldCheck, ...]:
+    """Build the checks for one field's constraints, in reporting order.
+    
+    Each check appends its error message, formatted here once, to the
+    error list when the value violates the constraint.
+    
+    Args:
+        field: Name of the field being validated
+        constraints: Dictionary of constraints to check against
+        
+    Returns:
+        Tuple of checks taking the field value and the error list
+    """
+    checks: List[FieldCheck] = []
+    
+    def add(applies: Callable[[Any], bool], fails: Callable[[Any], bool], message: str) -> None:
+        def check(value: Any, errors: List[str]) -> None:
+            if applies(value) and fails(value):
+                errors.append(message)
+        checks.append(check)
+    
+    is_number = _TYPE_CHECKS['number']
+    is_string = _TYPE_CHECKS['string']
+    is_array = _TYPE_CHECKS['array']
+    
+    # Numeric constraints
+    if 'min' in constraints:
+        minimum = constraints['min']
+        add(is_number, lambda value: value < minimum, f"Field '{field}' must be at least {minimum}")
+    if 'max' in constraints:
+        maximum = constraints['max']
+        add(is_number, lambda value: value > maximum, f"Field '{field}' must be at most {maximum}")
+    
+    # String constraints
+    if 'min_length' in constraints:
+        min_length = constraints['min_length']
+        add(is_string, lambda value: len(value) < min_length,
+            f"Field '{field}' must be at least {min_length} characters long")
+    if 'max_length' in constraints:
+        max_length = constraints['max_length']
+        add(is_string, lambda value: len(value) > max_length,
+            f"Field '{field}' must be at most {max_length} characters long")
+    if 'pattern' in constraints:
+        # Accepts a pattern string or a pre-compiled Pattern
+        pattern = re.compile(constraints['pattern'])
+        add(is_string, lambda value: not pattern.match(value),
+            f"Field '{field}' does not match required pattern")
+    
+    # Array constraints
+    if 'min_items' in constraints:
+        min_items = constraints['min_items']
+        add(is_array, lambda value: len(value) < min_items,
+            f"Field '{field}' must contain at least {min_items} items")
+    if 'max_items' in constraints:
+        max_items = constraints['max_items']
+        add(is_array, lambda value: len(value) > max_items,
+            f"Field '{field}' must contain at most {max_items} items")
+    
+    # Validate items in array if item_type is specified
+    if 'item_type' in constraints:
+        item_type = constraints['item_type']
+        is_item_type = _TYPE_CHECKS.get(item_type)
+        if is_item_type is not None:
+            def check_items(value: Any, errors: List[str]) -> None:
+                if is_array(value):
+                    errors.extend(
+                        f"Item {i} in field '{field}' must be of type {item_type}"
+                        for i, item in enumerate(value) if not is_item_type(item)
+                    )
+            checks.append(check_items)
+    
+    # Enum constraints
+    if 'enum' in constraints:
+        enum = constraints['enum']
+        enum_values = ', '.join(map(str, enum))
+        add(lambda value: True, lambda value: value not in enum,
+            f"Field '{field}' must be one of: {enum_values}")
+    
+    return tuple(checks)
+
+def _compile_validation_rules(
+    validation_rules: Union[ValidationSpec, Mapping[str, Any]]
+) -> Callable[[Mapping[str, Any]], List[str]]:
+    """Compile declarative validation rules into a single validator function.
+    
+    The rules are walked once here: type checks are resolved, error messages
+    formatted and rules that can never fail dropped, leaving the validator
+    only the per-field checks to run.
+    
+    Args:
+        validation_rules: An ``input_validation`` dict or ValidationSpec
+        
+    Returns:
+        Function mapping inputs to a list of error messages
+    """
+    if isinstance(validation_rules, ValidationSpec):
+        required_fields = validation_rules.required_fields
+        field_types = validation_rules.field_types
+        field_constraints = validation_rules.field_constraints
+    else:
+        required_fields = validation_rules.get('required_fields', [])
+        field_types = validation_rules.get('field_types', {})
+        field_constraints = validation_rules.get('field_constraints', {})
+    
+    required_checks = tuple(
+        (field, f"Required field '{field}' is missing or null") for field in required_fields
+    )
+    # Unknown types always pass
+    type_checks = tuple(
+        (field, _TYPE_CHECKS[expected_type], f"Field '{field}' must be of type {expected_type}")
+        for field, expected_type in field_types.items() if expected_type in _TYPE_CHECKS
+    )
+    constraint_checks = tuple(
+        (field, checks) for field, constraints in field_constraints.items()
+        if (checks := _compile_constraints(field, constraints))
+    )
+    
+    def validate(inputs: Mapping[str, Any]) -> List[str]:
+        errors: List[str] = []
+        
+        # Check required fields
+        for field, message in required_checks:
+            if inputs.get(field) is None:
+                errors.append(message)
+        
+        # Check field types
+        for field, is_type, message in type_checks:
+            value = inputs.get(field)
+            if value is not None and not is_type(value):
+                errors.append(message)
+        
+        # Check field constraints
+        for field, checks in constraint_checks:
+            value = inputs.get(field)
+            if value is not None:
+                for check in checks:
+                    check(value, errors)
+        
+        return errors
+    
+    return validate
+
+def _freeze_rule_value(value: Any) -> Any:
+    """Hashable equivalent of a constraint value; lists become tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_rule_value(item) for item in value)
+    return value
+
+def _freeze_validation_rules(validation_rules: Union[ValidationSpec, Mapping[str, Any]]) -> Tuple[Any, ...]:
+    """Hashable form of validation rules, keyed on content.
+    
+    Field order is kept rather than canonicalized, since it determines the
+    order errors are reported in.
+    """
+    if isinstance(validation_rules, ValidationSpec):
+        required_fields = validation_rules.required_fields
+        field_types = validation_rules.field_types
+        field_constraints = validation_rules.field_constraints
+    else:
+        required_fields = validation_rules.get('required_fields', [])
+        field_types = validation_rules.get('field_types', {})
+        field_constraints = validation_rules.get('field_constraints', {})
+    
+    return (
+        tuple(required_fields),
+        tuple(field_types.items()),
+        tuple(
+            (field, tuple((name, _freeze_rule_value(value)) for name, value in constraints.items()))
+            for field, constraints in field_constraints.items()
+        )
+    )
+
+@functools.lru_cache(maxsize=128)
+def _get_validator(frozen_rules: Tuple[Any, ...]) -> Callable[[Mapping[str, Any]], List[str]]:
+    """Compiled validator for frozen rules, shared by every agent using them."""
+    required_fields, field_types, field_constraints = frozen_rules
+    return _compile_validation_rules(ValidationSpec(
+        required_fields=required_fields,
+        field_types=dict(field_types),
+        field_constraints={field: dict(constraints) for field, constraints in field_constraints}
+    ))
+
+def _validator_for(
+    validation_rules: Union[ValidationSpec, Mapping[str, Any]]
+) -> Callable[[Mapping[str, Any]], List[str]]:
+    """Shared compiled validator for rules, compiling privately if they are unhashable."""
+    try:
+        return _get_validator(_freeze_validation_rules(validation_rules))
+    except TypeError:
+        return _compile_validation_rules(validation_rules)
+
+# Agent and execution context handed to its execute() by
+# execute_with_resilience, whose inputs have already passed validate_inputs
+_validated_inputs: contextvars.ContextVar[Optional[Tuple['BaseAgent', Dict[str, Any]]]] = contextvars.ContextVar(
+    '_validated_inputs', default=None
+)
+
 class AgentStatus(Enum):
     IDLE = "idle"
     RUNNING = "running"
@@ -69,7 +296,7 @@ class AgentStatus(Enum):
     FAILED = "failed"
     TIMEOUT = "timeout"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentResult:
     status: AgentStatus
     data: Dict[str, Any]
@@ -80,6 +307,11 @@ class AgentResult:
     error_details: Optional[str] = None
 
 class BaseAgent(ABC):
+    # Subclasses that add no attributes of their own can declare
+    # __slots__ = () to drop the per-instance __dict__
+    __slots__ = ('agent_id', 'mcp_client', 'config', 'circuit_breaker', 'retry_policy',
+                 '_compiled_validation')
+
     def __init__(self, agent_id: str, mcp_client: MCPClient, config: Dict[str, Any]):
         self.agent_id = agent_id
         self.mcp_client = mcp_client
@@ -92,6 +324,10 @@ class BaseAgent(ABC):
             max_attempts=config.get('max_retries', 3),
             backoff_factor=config.get('backoff_factor', 2)
         )
+        # Compile the input validation rules once rather than walking them
+        # on every call; agents with identical rules share one validator
+        validation_rules = config.get('input_validation', {})
+        self._compiled_validation = (validation_rules, _validator_for(validation_rules))
     async def validate_inputs(self, inputs: Dict[str, Any]) -> ValidationResult:
         """
         Performs generic input validation based on the agent's configuration.
@@ -204,6 +440,9 @@ class BaseAgent(ABC):
             "agent_id": self.agent_id,
             "execution_timestamp": time.time()
         }
+        # The inputs were validated before dispatch, so execute() implementations
+        # that validate again get an immediate result
+        token = _validated_inputs.set((self, execution_context))
         try:
             result = await asyncio.wait_for(
                 self.execute(execution_context),
@@ -217,6 +456,8 @@ class BaseAgent(ABC):
                 execution_time_ms=self.config.get('timeout_seconds', 300) * 1000,
                 error_details="Agent execution timeout"
             )
+        finally:
+            _validated_inputs.reset(token)
     async def get_context(self) -> Dict[str, Any]:
         return await self.mcp_client.get_context()
     async def update_context(self, data: Dict[str, Any]) -> None:
@@ -226,7 +467,11 @@ class BaseAgent(ABC):
         
         This method provides a common validation framework that all agent subclasses
         can use. It performs standard validations based on field requirements defined
-        in the agent's config and can be extended by subclasses for specific validations.
+        in the agent's config, either as an ``input_validation`` dict or a
+        ValidationSpec, and can be extended by subclasses for specific validations.
+        
+        Inputs that execute_with_resilience already validated before passing
+        them to execute() are accepted without being checked again.
         
         Args:
             inputs: Dictionary of input values to validate
@@ -234,33 +479,24 @@ class BaseAgent(ABC):
         Returns:
             ValidationResult: Object containing validation status and any error messages
         """
-        errors = []
+        validated = _validated_inputs.get()
+        if validated is not None and validated[0] is self and validated[1] is inputs:
+            return ValidationResult(is_valid=True)
         
-        # Get validation rules from config if available
+        # Get validation rules from config if available; they were compiled
+        # when the agent was created unless the config has been replaced since
         validation_rules = self.config.get('input_validation', {})
-        required_fields = validation_rules.get('required_fields', [])
-        field_types = validation_rules.get('field_types', {})
-        field_constraints = validation_rules.get('field_constraints', {})
+        compiled_rules, validator = self._compiled_validation
+        if validation_rules is not compiled_rules:
+            validator = _validator_for(validation_rules)
+            self._compiled_validation = (validation_rules, validator)
+        errors = validator(inputs)
         
-        # Check required fields
-        for field in required_fields:
-            if field not in inputs or inputs[field] is None:
-                errors.append(f"Required field '{field}' is missing or null")
-        
-        # Check field types
-        for field, expected_type in field_types.items():
-            if field in inputs and inputs[field] is not None:
-                if not self._validate_field_type(inputs[field], expected_type):
-                    errors.append(f"Field '{field}' must be of type {expected_type}")
-        
-        # Check field constraints
-        for field, constraints in field_constraints.items():
-            if field in inputs and inputs[field] is not None:
-                field_errors = self._validate_field_constraints(field, inputs[field], constraints)
-                errors.extend(field_errors)
-        
-        # Run agent-specific validations (to be implemented by subclasses)
-        custom_errors = await self._custom_validations(inputs)
+        # Run agent-specific validations (to be implemented by subclasses).
+        # Pure-CPU overrides may be plain functions; only await coroutines.
+        custom_errors = self._custom_validations(inputs)
+        if inspect.isawaitable(custom_errors):
+            custom_errors = await custom_errors
         errors.extend(custom_errors)
         
         return ValidationResult(is_valid=len(errors) == 0, errors=errors)
@@ -275,25 +511,8 @@ class BaseAgent(ABC):
         Returns:
             bool: True if value matches expected type, False otherwise
         """
-        if expected_type == 'string':
-            return isinstance(value, str)
-        elif expected_type == 'number':
-            return isinstance(value, (int, float, Decimal))
-        elif expected_type == 'integer':
-            return isinstance(value, int)
-        elif expected_type == 'boolean':
-            return isinstance(value, bool)
-        elif expected_type == 'array':
-            return isinstance(value, list)
-        elif expected_type == 'object':
-            return isinstance(value, dict)
-        elif expected_type == 'email':
-            if not isinstance(value, str):
-                return False
-            # Simple email validation regex
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(email_pattern, value))
-        return True  # Default to True for unknown types
+        is_type = _TYPE_CHECKS.get(expected_type)
+        return is_type is None or is_type(value)  # Default to True for unknown types
     
     def _validate_field_constraints(self, field: str, value: Any, constraints: Dict[str, Any]) -> List[str]:
         """Validate that a field value satisfies all constraints.
@@ -306,49 +525,17 @@ class BaseAgent(ABC):
         Returns:
             List[str]: List of error messages (empty if all constraints are satisfied)
         """
-        errors = []
-        
-        # Numeric constraints
-        if isinstance(value, (int, float, Decimal)):
-            if 'min' in constraints and value < constraints['min']:
-                errors.append(f"Field '{field}' must be at least {constraints['min']}")
-            if 'max' in constraints and value > constraints['max']:
-                errors.append(f"Field '{field}' must be at most {constraints['max']}")
-        
-        # String constraints
-        if isinstance(value, str):
-            if 'min_length' in constraints and len(value) < constraints['min_length']:
-                errors.append(f"Field '{field}' must be at least {constraints['min_length']} characters long")
-            if 'max_length' in constraints and len(value) > constraints['max_length']:
-                errors.append(f"Field '{field}' must be at most {constraints['max_length']} characters long")
-            if 'pattern' in constraints and not re.match(constraints['pattern'], value):
-                errors.append(f"Field '{field}' does not match required pattern")
-        
-        # Array constraints
-        if isinstance(value, list):
-            if 'min_items' in constraints and len(value) < constraints['min_items']:
-                errors.append(f"Field '{field}' must contain at least {constraints['min_items']} items")
-            if 'max_items' in constraints and len(value) > constraints['max_items']:
-                errors.append(f"Field '{field}' must contain at most {constraints['max_items']} items")
-            
-            # Validate items in array if item_type is specified
-            if 'item_type' in constraints and value:
-                for i, item in enumerate(value):
-                    if not self._validate_field_type(item, constraints['item_type']):
-                        errors.append(f"Item {i} in field '{field}' must be of type {constraints['item_type']}")
-        
-        # Enum constraints
-        if 'enum' in constraints and value not in constraints['enum']:
-            enum_values = ', '.join(map(str, constraints['enum']))
-            errors.append(f"Field '{field}' must be one of: {enum_values}")
-        
+        errors: List[str] = []
+        for check in _compile_constraints(field, constraints):
+            check(value, errors)
         return errors
     
     async def _custom_validations(self, inputs: Dict[str, Any]) -> List[str]:
         """Perform agent-specific custom validations.
         
         This method should be overridden by subclasses to implement
-        validations specific to that agent type.
+        validations specific to that agent type. Overrides that do no I/O
+        may be plain (non-async) methods.
         
         Args:
             inputs: Dictionary of input values to validate
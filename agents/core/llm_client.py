@@ -0,0 +1,21 @@
+"""
+Import path for the LLM client.
+
+The implementation lives in ``Agents/core/llm_client.py``, which is not inside
+an importable package. This module loads it under ``agents.core.llm_client``
+and installs it in ``sys.modules`` in place of itself, so imports and patches
+through either name reach the same module object.
+"""
+
+import importlib.util
+import os
+import sys
+
+_IMPLEMENTATION = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'Agents', 'core', 'llm_client.py'
+)
+
+_spec = importlib.util.spec_from_file_location(__name__, os.path.normpath(_IMPLEMENTATION))
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[__name__] = _module
+_spec.loader.exec_module(_module)
@@ -0,0 +1,31 @@
+"""
+Fixtures for the example agents under Agents/examples.
+
+The examples are standalone modules rather than a package, so they are
+loaded by path, once per test session.
+"""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir, 'Agents', 'examples'
+)
+
+
+@pytest.fixture(scope="session")
+def load_example():
+    """Provides a loader returning the example module with the given name."""
+    def load(name):
+        module_name = f"agents_examples_{name}"
+        if module_name not in sys.modules:
+            spec = importlib.util.spec_from_file_location(
+                module_name, os.path.normpath(os.path.join(_EXAMPLES_DIR, f"{name}.py"))
+            )
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        return sys.modules[module_name]
+    return load
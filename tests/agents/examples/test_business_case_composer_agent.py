@@ -0,0 +1,136 @@
+"""
+Unit tests for the BusinessCaseComposerAgent example.
+"""
+import asyncio
+import math
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+from unittest.mock import AsyncMock
+
+from agents.core.agent_base import AgentStatus
+
+
+@pytest.fixture
+def composer_module(load_example):
+    """Provides the business_case_composer_agent example module."""
+    return load_example("business_case_composer_agent")
+
+
+@pytest.fixture
+def composer_agent(composer_module):
+    """Provides a BusinessCaseComposerAgent with its default configuration."""
+    return composer_module.BusinessCaseComposerAgent("test_agent", mcp_client=None, config={})
+
+
+@pytest.fixture
+def valid_inputs():
+    """Provides inputs for a two-driver business case."""
+    return {
+        'project_name': 'CRM rollout',
+        'client_name': 'Acme',
+        'industry': 'healthcare',
+        'value_drivers': ['cost_reduction', 'productivity_gains'],
+        'investment_amount': 100000.0,
+        'metrics_data': {
+            'cost_reduction': {'current_operational_cost': 500000, 'expected_cost_reduction_percentage': 10},
+            'productivity_gains': {
+                'current_process_time': 2,
+                'expected_time_savings_percentage': 50,
+                'affected_employee_count': 10,
+                'average_hourly_rate': 40
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_subtask_fails_execution_after_siblings_finish(monkeypatch, composer_module, composer_agent,
+                                                                    valid_inputs):
+    """Tests that a failing subtask yields a FAILED result once the concurrent subtasks complete."""
+    finished = []
+
+    async def calculate(*args):
+        await asyncio.sleep(0.01)
+        finished.append("roi")
+        return {}
+
+    agent_class = composer_module.BusinessCaseComposerAgent
+    monkeypatch.setattr(agent_class, "_calculate_roi_metrics", AsyncMock(side_effect=calculate))
+    monkeypatch.setattr(agent_class, "_generate_business_case_structure",
+                        AsyncMock(side_effect=RuntimeError("template store unavailable")))
+
+    result = await composer_agent.execute(valid_inputs)
+
+    assert result.status == AgentStatus.FAILED
+    assert result.data['error'] == "Failed to compose business case: template store unavailable"
+    assert finished == ["roi"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("extra_metrics", [
+    {1: 'x'},
+    {'tags': {'priority', 'q3'}},
+    {'notes': MappingProxyType({'confidence': Decimal('0.85')})},
+])
+async def test_unusual_metrics_data_is_still_stored(composer_agent, valid_inputs, extra_metrics):
+    """Tests that non-string keys, sets, read-only mappings and decimals in metrics_data do not break storage."""
+    valid_inputs['metrics_data'] = {**valid_inputs['metrics_data'], **extra_metrics}
+
+    result = await composer_agent.execute(valid_inputs)
+
+    assert result.status == AgentStatus.COMPLETED
+    assert result.data['business_case_id'].startswith('bc_')
+
+
+_BATCH_COLUMNS = (
+    ('cost_reduction', 'current_operational_cost'), ('cost_reduction', 'expected_cost_reduction_percentage'),
+    ('revenue_growth', 'current_annual_revenue'), ('revenue_growth', 'expected_revenue_growth_percentage'),
+    ('productivity_gains', 'current_process_time'), ('productivity_gains', 'expected_time_savings_percentage'),
+    ('productivity_gains', 'affected_employee_count'), ('productivity_gains', 'average_hourly_rate'),
+    ('risk_mitigation', 'current_annual_risk_cost'), ('risk_mitigation', 'risk_probability_percentage'),
+    ('risk_mitigation', 'expected_risk_reduction_percentage'),
+)
+
+_ALL_DRIVERS_METRICS = {
+    'cost_reduction': {'current_operational_cost': 500000, 'expected_cost_reduction_percentage': 10},
+    'revenue_growth': {'current_annual_revenue': 2000000, 'expected_revenue_growth_percentage': 3.5},
+    'productivity_gains': {
+        'current_process_time': 2, 'expected_time_savings_percentage': 50,
+        'affected_employee_count': 10, 'average_hourly_rate': 40
+    },
+    'risk_mitigation': {
+        'current_annual_risk_cost': 800000, 'risk_probability_percentage': 25,
+        'expected_risk_reduction_percentage': 60
+    },
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value_drivers, metrics_data, investment_amount", [
+    (list(_ALL_DRIVERS_METRICS), _ALL_DRIVERS_METRICS, 250000.0),
+    (['cost_reduction', 'productivity_gains'], _ALL_DRIVERS_METRICS, 0.0),
+    ([], {}, 100000.0),
+])
+async def test_roi_batch_matches_scalar(composer_module, composer_agent, value_drivers, metrics_data, investment_amount):
+    """Tests that the vectorized ROI calculation agrees with the per-case one, including edge cases."""
+    row = [
+        metrics_data.get(driver, {}).get(name, 0) if driver in value_drivers else 0
+        for driver, name in _BATCH_COLUMNS
+    ] + [investment_amount]
+
+    batch = composer_module.BusinessCaseComposerAgent._calculate_roi_metrics_batch([row])[0]
+    scalar = await composer_agent._calculate_roi_metrics(value_drivers, metrics_data, investment_amount)
+
+    drivers = ('cost_reduction', 'revenue_growth', 'productivity_gains', 'risk_mitigation')
+    for column, driver in enumerate(drivers):
+        assert batch[column] == pytest.approx(scalar['benefits_by_driver'].get(driver, 0.0))
+    assert batch[4] == pytest.approx(scalar['total_annual_benefit'])
+    assert batch[5] == pytest.approx(scalar['annual_roi_percentage'])
+    assert batch[6] == pytest.approx(scalar['three_year_roi_percentage'])
+    if scalar['payback_period_months'] is None:
+        assert math.isnan(batch[7])
+    else:
+        assert batch[7] == pytest.approx(scalar['payback_period_months'])
+    assert batch[8] == pytest.approx(scalar['net_present_value'])
@@ -0,0 +1,212 @@
+"""
+Unit tests for the DataIntegrationAgent example.
+"""
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+
+def _counting_fetcher(calls, value, delay=0.0, in_flight=None):
+    """Async fetcher recording each call and, optionally, the peak concurrency."""
+    async def fetch(client, credentials, query_parameters):
+        calls.append((credentials.get('api_key'), dict(query_parameters)))
+        if in_flight is not None:
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        await asyncio.sleep(delay)
+        if in_flight is not None:
+            in_flight['now'] -= 1
+        return value
+    return fetch
+
+
+@pytest.fixture
+def data_module(load_example):
+    """Provides the data_integration_agent example module."""
+    return load_example("data_integration_agent")
+
+
+@pytest.fixture
+def fetch_calls():
+    """Provides the list the fake fetchers record their calls in."""
+    return []
+
+
+@pytest.fixture
+def integration_agent(data_module, fetch_calls):
+    """Provides a DataIntegrationAgent whose CRM fetchers count their calls."""
+    agent = data_module.DataIntegrationAgent("test_agent", mcp_client=None, config={'max_concurrent_requests': 2})
+    agent._metric_fetchers = {'crm': {
+        'conversion_rate': _counting_fetcher(fetch_calls, 0.24),
+        'lead_volume': _counting_fetcher(fetch_calls, 1200),
+    }}
+    return agent
+
+
+async def _retrieve(agent, api_key='enc:key-a', query_parameters=None, metrics=('conversion_rate', 'lead_volume')):
+    values, _ = await agent._retrieve_metrics(
+        'crm', 'salesforce', {'api_key': api_key, 'instance_url': 'https://crm.example.com'},
+        list(metrics), query_parameters or {'period': 'Q1'}
+    )
+    return values
+
+
+@pytest.mark.asyncio
+async def test_repeat_read_is_served_from_cache(integration_agent, fetch_calls):
+    """Tests that reading the same metrics again does not reach the fetchers."""
+    first = await _retrieve(integration_agent)
+    second = await _retrieve(integration_agent, query_parameters={'period': 'Q1'})
+
+    assert first == second == {'conversion_rate': 0.24, 'lead_volume': 1200}
+    assert len(fetch_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_other_credentials_or_query_miss_the_cache(integration_agent, fetch_calls):
+    """Tests that cached metrics are scoped to the credentials and query parameters."""
+    await _retrieve(integration_agent, metrics=('conversion_rate',))
+    await _retrieve(integration_agent, api_key='enc:key-b', metrics=('conversion_rate',))
+    await _retrieve(integration_agent, query_parameters={'period': 'Q2'}, metrics=('conversion_rate',))
+
+    assert fetch_calls == [
+        ('enc:key-a', {'period': 'Q1'}),
+        ('enc:key-b', {'period': 'Q1'}),
+        ('enc:key-a', {'period': 'Q2'}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_capped_at_max_concurrent_requests(integration_agent, fetch_calls):
+    """Tests that no more than max_concurrent_requests fetches run at once."""
+    in_flight = {'now': 0, 'peak': 0}
+    metrics = [f"metric_{i}" for i in range(6)]
+    integration_agent._metric_fetchers = {'crm': {
+        metric: _counting_fetcher(fetch_calls, i, delay=0.01, in_flight=in_flight)
+        for i, metric in enumerate(metrics)
+    }}
+
+    values = await _retrieve(integration_agent, metrics=metrics)
+
+    assert values == {metric: i for i, metric in enumerate(metrics)}
+    assert in_flight['peak'] == integration_agent.max_concurrent_requests == 2
+
+
+@pytest.fixture
+def slow_credential_store(monkeypatch, data_module):
+    """Makes credential storage outlast the rest of execute, recording cancellation."""
+    state = {'cancelled': False}
+
+    async def store(self, credentials):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state['cancelled'] = True
+            raise
+        return 'cred_token'
+
+    monkeypatch.setattr(data_module.DataIntegrationAgent, '_securely_store_credentials', store)
+    return state
+
+
+def _crm_inputs():
+    return {
+        'connection_type': 'crm',
+        'source_system': 'salesforce',
+        'connection_credentials': {'api_key': 'enc:key-a', 'instance_url': 'https://crm.example.com'},
+        'metrics_to_retrieve': ['conversion_rate'],
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_cancels_credential_storage(integration_agent, slow_credential_store):
+    """Tests that a failing fetcher yields FAILED and leaves no credential storage task behind."""
+    async def failing_fetch(client, credentials, query_parameters):
+        raise ConnectionError("CRM unavailable")
+
+    integration_agent._metric_fetchers = {'crm': {'conversion_rate': failing_fetch}}
+
+    result = await integration_agent.execute(_crm_inputs())
+
+    assert result.data['error'] == "Failed to retrieve metrics: CRM unavailable"
+    assert slow_credential_store['cancelled']
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_check_cancels_credential_storage(monkeypatch, data_module, integration_agent,
+                                                                 slow_credential_store):
+    """Tests that an exception from the connection check still cancels credential storage."""
+    async def failing_check(self, connection_type, source_system, credentials):
+        await asyncio.sleep(0)
+        raise ConnectionError("DNS failure")
+
+    monkeypatch.setattr(data_module.DataIntegrationAgent, '_validate_connection', failing_check)
+
+    with pytest.raises(ConnectionError):
+        await integration_agent.execute(_crm_inputs())
+
+    assert slow_credential_store['cancelled']
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_probes_and_fetchers_share_one_client(integration_agent):
+    """Tests that the connection check and every fetch run on the agent's pooled client."""
+    clients = []
+
+    async def probe(client, credentials):
+        clients.append(client)
+        return True, "ok"
+
+    async def fetch(client, credentials, query_parameters):
+        clients.append(client)
+        return 1
+
+    integration_agent._connection_probes = {'crm': probe}
+    integration_agent._metric_fetchers = {'crm': {'conversion_rate': fetch, 'lead_volume': fetch}}
+    inputs = {**_crm_inputs(), 'metrics_to_retrieve': ['conversion_rate', 'lead_volume']}
+
+    async with integration_agent:
+        result = await integration_agent.execute(inputs)
+        session = await integration_agent._get_session()
+
+    assert result.data['retrieved_metrics_count'] == 2
+    assert len(clients) == 3 and all(client is session for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_and_resets_client(integration_agent):
+    """Tests that aclose closes the pooled client and a later call builds a fresh one."""
+    session = await integration_agent._get_session()
+    assert await integration_agent._get_session() is session
+
+    await integration_agent.aclose()
+
+    assert session.is_closed
+    assert integration_agent._http_session is None
+    fresh = await integration_agent._get_session()
+    assert fresh is not session and not fresh.is_closed
+    await integration_agent.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_config_sizes_the_shared_client(monkeypatch, data_module):
+    """Tests that the pool config keys set the limits of the client probes and fetchers use."""
+    import httpx
+
+    built = []
+
+    def async_client(**kwargs):
+        built.append(kwargs)
+        return MagicMock(is_closed=False)
+
+    monkeypatch.setattr(httpx, "AsyncClient", async_client)
+    agent = data_module.DataIntegrationAgent(
+        "test_agent", mcp_client=None, config={'http_pool_size': 12, 'http_keepalive_connections': 4}
+    )
+
+    await agent._get_session()
+
+    limits = built[0]['limits']
+    assert (limits.max_connections, limits.max_keepalive_connections) == (12, 4)
@@ -0,0 +1,92 @@
+"""
+Unit tests for the NarrativeGeneratorAgent example.
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from agents.core.agent_base import AgentStatus
+
+
+@pytest.fixture
+def narrative_agent(load_example):
+    """Provides a NarrativeGeneratorAgent whose MCP retrieval is mocked."""
+    agent = load_example("narrative_generator_agent").NarrativeGeneratorAgent("test_agent", mcp_client=None, config={})
+
+    async def fetch(business_case_id):
+        await asyncio.sleep(0)
+        return {"metadata": {"project_name": f"Project {business_case_id}"}}
+
+    agent._fetch_business_case_data = AsyncMock(side_effect=fetch)
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_business_case_is_served_from_cache(narrative_agent):
+    """Tests that a repeat retrieval within the TTL does not reach the MCP."""
+    first = await narrative_agent._retrieve_business_case_data("bc_1")
+    second = await narrative_agent._retrieve_business_case_data("bc_1")
+
+    assert first == second == {"metadata": {"project_name": "Project bc_1"}}
+    narrative_agent._fetch_business_case_data.assert_awaited_once_with("bc_1")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(narrative_agent):
+    """Tests that simultaneous misses for one business case cost a single fetch."""
+    results = await asyncio.gather(*(narrative_agent._retrieve_business_case_data("bc_1") for _ in range(5)))
+
+    assert results == [{"metadata": {"project_name": "Project bc_1"}}] * 5
+    narrative_agent._fetch_business_case_data.assert_awaited_once_with("bc_1")
+    assert narrative_agent._business_case_fetches == {}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_business_case_forces_refetch(narrative_agent):
+    """Tests that an invalidated business case is retrieved again."""
+    await narrative_agent._retrieve_business_case_data("bc_1")
+    await narrative_agent._retrieve_business_case_data("bc_2")
+    narrative_agent.invalidate_business_case("bc_1")
+    await narrative_agent._retrieve_business_case_data("bc_1")
+    await narrative_agent._retrieve_business_case_data("bc_2")
+
+    assert [call.args[0] for call in narrative_agent._fetch_business_case_data.await_args_list] == ["bc_1", "bc_2", "bc_1"]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_keeps_order_and_fetches_each_case_once(narrative_agent):
+    """Tests that batch results follow input order and each business case is retrieved once."""
+    batch = [
+        {'business_case_id': 'bc_2', 'section_id': 'executive_summary', 'stakeholder_persona': 'executive'},
+        {'business_case_id': 'bc_1', 'section_id': 'value_analysis', 'stakeholder_persona': 'financial_buyer'},
+        {'business_case_id': 'bc_2', 'section_id': 'roi_calculation', 'stakeholder_persona': 'technical_buyer'},
+        {'business_case_id': 'bc_1', 'section_id': 'executive_summary', 'stakeholder_persona': 'executive'},
+    ]
+
+    results = await narrative_agent.execute_batch(batch)
+
+    assert [result.status for result in results] == [AgentStatus.COMPLETED] * 4
+    assert [(result.data['section_id'], result.data['stakeholder_persona']) for result in results] == [
+        (inputs['section_id'], inputs['stakeholder_persona']) for inputs in batch
+    ]
+    for inputs, result in zip(batch, results):
+        assert f"Project {inputs['business_case_id']}" in result.data['narrative']
+    assert sorted(call.args[0] for call in narrative_agent._fetch_business_case_data.await_args_list) == ["bc_1", "bc_2"]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_fails_invalid_entries_and_runs_the_rest(narrative_agent):
+    """Tests that invalid entries become FAILED results without blocking valid ones."""
+    batch = [
+        {'business_case_id': 'case-1', 'section_id': 'executive_summary', 'stakeholder_persona': 'executive'},
+        {'business_case_id': 'bc_1', 'section_id': 'executive_summary', 'stakeholder_persona': 'executive'},
+        {'business_case_id': 'bc_3', 'section_id': 'executive_summary'},
+    ]
+
+    results = await narrative_agent.execute_batch(batch)
+
+    assert [result.status for result in results] == [AgentStatus.FAILED, AgentStatus.COMPLETED, AgentStatus.FAILED]
+    assert "Invalid business case ID format" in results[0].data['error'][0]
+    assert results[2].data['error']
+    narrative_agent._fetch_business_case_data.assert_awaited_once_with("bc_1")
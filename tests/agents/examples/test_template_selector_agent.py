@@ -0,0 +1,106 @@
+"""
+Unit tests for the TemplateSelectorAgent example.
+"""
+import itertools
+from types import MappingProxyType
+
+import pytest
+
+
+def _template(template_id, section_count):
+    return {"id": template_id, "sections": [f"Section {i}" for i in range(section_count)]}
+
+
+# Short, overlapping and nested industry keys exercise every branch of the
+# trigram candidate lookup
+_CATALOG = MappingProxyType({
+    "it": (_template("it_1", 4), _template("it_2", 2)),
+    "ai": (_template("ai_1", 3),),
+    "x": (_template("x_1", 5),),
+    "tech": (_template("tech_1", 6), _template("tech_2", 3)),
+    "fintech": (_template("fintech_1", 2),),
+    "health": (_template("health_1", 5),),
+    "healthcare": (_template("healthcare_1", 4), _template("healthcare_2", 7)),
+    "care": (_template("care_1", 1),),
+    "bank": (_template("bank_1", 6),),
+    "banking": (_template("banking_1", 3), _template("banking_2", 8)),
+    "retail": (),
+    "default": (_template("default_1", 4), _template("default_2", 6)),
+})
+
+_QUERIES = (
+    "", "a", "i", "x", "it", "ai", "IT", "tec", "ech", "tech", "fintech", "FinTech", "fintech startup",
+    "health", "heal", "healthcare", "healthcare it", "digital healthcare", "care", "car", "are",
+    "bank", "banking", "banki", "investment banking", "retail", "retai", "xyz", "the bank of ai",
+)
+
+
+def _naive_matches(catalog, industry, company_size):
+    """Reference linear scan: exact key, else every substring match, else default."""
+    industry_lower = industry.lower()
+    matches = list(catalog.get(industry_lower, ()))
+    if not matches:
+        for key, templates in catalog.items():
+            if key != 'default' and (key in industry_lower or industry_lower in key):
+                matches.extend(templates)
+    if not matches:
+        matches = list(catalog.get('default', ()))
+    if company_size == 'enterprise':
+        matches.sort(key=lambda t: len(t.get('sections', [])), reverse=True)
+    elif company_size == 'small':
+        matches.sort(key=lambda t: len(t.get('sections', [])))
+    return [t["id"] for t in matches]
+
+
+@pytest.fixture
+def selector_module(load_example):
+    """Provides the template_selector_agent example module."""
+    return load_example("template_selector_agent")
+
+
+@pytest.fixture
+def catalog_agent(selector_module):
+    """Provides a TemplateSelectorAgent over the short and overlapping test catalog."""
+    class CatalogAgent(selector_module.TemplateSelectorAgent):
+        def _load_templates(self):
+            return _CATALOG
+
+    return CatalogAgent("test_agent", mcp_client=None, config={})
+
+
+@pytest.mark.asyncio
+async def test_indexed_matching_equals_linear_scan(catalog_agent):
+    """Tests that the trigram-indexed lookup returns exactly what a substring scan would."""
+    for industry, company_size in itertools.product(_QUERIES, (None, 'small', 'medium', 'enterprise')):
+        matches = await catalog_agent._find_matching_templates(industry, company_size)
+        assert [t["id"] for t in matches] == _naive_matches(_CATALOG, industry, company_size), (industry, company_size)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("industry", ["healthcare", "heal", "banking"])
+async def test_size_ordering_leaves_catalog_untouched(catalog_agent, industry):
+    """Tests that an enterprise query neither reorders the catalog nor changes later default-order results."""
+    catalog_order = {key: [t["id"] for t in templates] for key, templates in _CATALOG.items()}
+    default_order = [t["id"] for t in await catalog_agent._find_matching_templates(industry)]
+
+    enterprise = await catalog_agent._find_matching_templates(industry, 'enterprise')
+    again = await catalog_agent._find_matching_templates(industry)
+
+    assert [t["id"] for t in enterprise] != default_order
+    assert [t["id"] for t in again] == default_order
+    assert {key: [t["id"] for t in templates] for key, templates in _CATALOG.items()} == catalog_order
+
+
+@pytest.mark.asyncio
+async def test_returned_templates_are_immutable(selector_module):
+    """Tests that results are tuples, so callers cannot reorder the shared catalog through them."""
+    agent = selector_module.TemplateSelectorAgent("test_agent", mcp_client=None, config={})
+    catalog_ids = [t["id"] for t in selector_module._DEFAULT_TEMPLATES["healthcare"]]
+
+    for company_size in (None, 'small', 'enterprise'):
+        matches = await agent._find_matching_templates("Healthcare", company_size)
+        assert isinstance(matches, tuple)
+        with pytest.raises(AttributeError):
+            matches.sort()
+
+    assert [t["id"] for t in selector_module._DEFAULT_TEMPLATES["healthcare"]] == catalog_ids
@@ -0,0 +1,43 @@
+"""
+Unit tests for the ValidationExampleAgent example.
+"""
+from decimal import Decimal
+
+import pytest
+
+from agents.core.agent_base import AgentStatus
+
+
+@pytest.fixture
+def example_agent(load_example):
+    """Provides a ValidationExampleAgent with its default validation rules."""
+    return load_example("validation_example").ValidationExampleAgent("test_agent", mcp_client=None, config={})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("price", ['abc', 'NaN', 'sNaN', 'Infinity', float('nan'), float('inf'), Decimal('NaN')])
+async def test_invalid_price_is_reported(example_agent, price):
+    """Tests that unparseable and non-finite prices are reported rather than raised."""
+    result = await example_agent.execute({
+        'customer_id': 'CUST-123456',
+        'product_data': {'category': 'premium', 'price': price}
+    })
+
+    assert result.status == AgentStatus.FAILED
+    assert result.data['error'] == ["Product price must be a valid number"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("price, errors", [
+    ('150.5', []),
+    (99, ["Premium products must have a price of at least 100"]),
+    ('99.99', ["Premium products must have a price of at least 100"]),
+])
+async def test_premium_minimum_price(example_agent, price, errors):
+    """Tests the premium minimum price, converting string prices to Decimal."""
+    product_data = {'category': 'premium', 'price': price}
+    validation_result = await example_agent.validate_inputs({'customer_id': 'CUST-123456', 'product_data': product_data})
+
+    assert validation_result.errors == errors
+    if isinstance(price, str):
+        assert product_data['price'] == Decimal(price)
@@ -0,0 +1,37 @@
+"""
+Unit tests for the ValueDriverAgent example.
+"""
+import pytest
+
+
+@pytest.fixture
+def value_driver_module(load_example):
+    """Provides the value_driver_agent example module."""
+    return load_example("value_driver_agent")
+
+
+@pytest.fixture
+def value_driver_agent(value_driver_module):
+    """Provides a ValueDriverAgent with the default metric catalog."""
+    return value_driver_module.ValueDriverAgent("test_agent", mcp_client=None, config={})
+
+
+def test_single_driver_fast_path_matches_general_path(value_driver_module, value_driver_agent):
+    """Tests that the precomputed single-driver suggestions equal the general computation."""
+    for driver in value_driver_module._VALID_DRIVER_TYPES:
+        suggested_metrics, total_metric_count = value_driver_agent._get_suggested_metrics([driver])
+        expected_metrics, expected_count = value_driver_agent._compute_suggested_metrics((driver,), None)
+
+        assert suggested_metrics == dict(expected_metrics)
+        assert total_metric_count == expected_count
+        assert total_metric_count > 0
+
+
+def test_industry_bypasses_single_driver_fast_path(value_driver_agent):
+    """Tests that an industry-specific request is still computed with industry metrics."""
+    suggested_metrics, total_metric_count = value_driver_agent._get_suggested_metrics(['cost_reduction'], 'Healthcare')
+    expected_metrics, expected_count = value_driver_agent._compute_suggested_metrics(('cost_reduction',), 'Healthcare')
+
+    assert suggested_metrics == dict(expected_metrics)
+    assert total_metric_count == expected_count
+    assert total_metric_count > value_driver_agent._get_suggested_metrics(['cost_reduction'])[1]
@@ -1,4 +1,153 @@
+import dataclasses
+import re
+
 import pytest
-from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus
+from agents.core.agent_base import BaseAgent, AgentResult, AgentStatus, ValidationResult, ValidationSpec
+
+
+
+
+class _ValidatingAgent(BaseAgent):
+    """Minimal agent with one required field and a custom rule."""
+
+    async def execute(self, inputs):
+        return AgentResult(status=AgentStatus.COMPLETED, data={}, execution_time_ms=0)
+
+
+class _SyncValidatingAgent(_ValidatingAgent):
+    def _custom_validations(self, inputs):
+        return [] if inputs.get('name') != 'bad' else ["name must not be 'bad'"]
+
+
+class _AsyncValidatingAgent(_ValidatingAgent):
+    async def _custom_validations(self, inputs):
+        return [] if inputs.get('name') != 'bad' else ["name must not be 'bad'"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("agent_cls", [_SyncValidatingAgent, _AsyncValidatingAgent])
+async def test_validate_inputs_accepts_sync_and_async_custom_validations(agent_cls):
+    """Tests that custom validations run whether they are plain methods or coroutines."""
+    agent = agent_cls("test_agent", mcp_client=None, config={'input_validation': {'required_fields': ['name']}})
+
+    assert (await agent.validate_inputs({'name': 'good'})).is_valid
+    result = await agent.validate_inputs({'name': 'bad'})
+    assert not result.is_valid
+    assert result.errors == ["name must not be 'bad'"]
+
+
+@pytest.mark.asyncio
+async def test_validate_inputs_accepts_validation_spec():
+    """Tests that a ValidationSpec is applied like the equivalent config dict."""
+    rules = {
+        'required_fields': ['name'],
+        'field_types': {'size': 'number'},
+        'field_constraints': {'name': {'enum': ['good', 'bad']}}
+    }
+    spec = ValidationSpec(
+        required_fields=('name',),
+        field_types={'size': 'number'},
+        field_constraints={'name': {'enum': ('good', 'bad')}}
+    )
+    dict_agent = _SyncValidatingAgent("dict_agent", mcp_client=None, config={'input_validation': rules})
+    spec_agent = _SyncValidatingAgent("spec_agent", mcp_client=None, config={'input_validation': spec})
+
+    for inputs in ({'name': 'good', 'size': 3}, {'size': 'big'}, {'name': 'other'}, {'name': 'bad'}):
+        expected = await dict_agent.validate_inputs(inputs)
+        actual = await spec_agent.validate_inputs(inputs)
+        assert actual.is_valid == expected.is_valid
+        assert actual.errors == expected.errors
+
+
+@pytest.mark.asyncio
+async def test_validate_inputs_recompiles_replaced_rules():
+    """Tests that rules compiled at construction are rebuilt when the config's rules are replaced."""
+    agent = _SyncValidatingAgent("test_agent", mcp_client=None, config={
+        'input_validation': {'field_constraints': {'size': {'min': 1, 'max': 5}}}
+    })
+
+    assert (await agent.validate_inputs({'size': 9})).errors == ["Field 'size' must be at most 5"]
+
+    agent.config['input_validation'] = {'required_fields': ['name']}
+    assert (await agent.validate_inputs({'size': 9})).errors == ["Required field 'name' is missing or null"]
+
+
+def test_agents_with_equal_rules_share_compiled_validator():
+    """Tests that equal validation rules compile to one validator shared across agents."""
+    def rules():
+        return {'required_fields': ['name'], 'field_constraints': {'name': {'enum': ['good', 'bad']}}}
+
+    first = _SyncValidatingAgent("first", mcp_client=None, config={'input_validation': rules()})
+    second = _SyncValidatingAgent("second", mcp_client=None, config={'input_validation': rules()})
+    other = _SyncValidatingAgent("other", mcp_client=None, config={'input_validation': {'required_fields': ['id']}})
+
+    assert first._compiled_validation[1] is second._compiled_validation[1]
+    assert other._compiled_validation[1] is not first._compiled_validation[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pattern", [r'^CUST-\d{6}$', re.compile(r'^CUST-\d{6}$')])
+async def test_pattern_constraint_accepts_string_or_compiled_pattern(pattern):
+    """Tests that a pattern constraint works as a string or a pre-compiled Pattern."""
+    agent = _SyncValidatingAgent("test_agent", mcp_client=None, config={
+        'input_validation': {'field_constraints': {'customer_id': {'pattern': pattern}}}
+    })
+
+    assert (await agent.validate_inputs({'customer_id': 'CUST-123456'})).is_valid
+    result = await agent.validate_inputs({'customer_id': 'CUST-12'})
+    assert result.errors == ["Field 'customer_id' does not match required pattern"]
+
+
+class _ContextClient:
+    """MCP client stub serving an empty workflow context."""
+
+    async def get_context(self):
+        return {}
+
+    async def update_context(self, agent_id, data):
+        pass
+
+
+class _CountingAgent(BaseAgent):
+    """Agent whose execute() validates its inputs, counting custom validation runs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validation_runs = 0
+
+    def _custom_validations(self, inputs):
+        self.validation_runs += 1
+        return []
+
+    async def execute(self, inputs):
+        validation_result = await self.validate_inputs(inputs)
+        status = AgentStatus.COMPLETED if validation_result.is_valid else AgentStatus.FAILED
+        return AgentResult(status=status, data={'errors': validation_result.errors}, execution_time_ms=0)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_resilience_validates_inputs_once():
+    """Tests that execute() does not re-validate inputs already validated before dispatch."""
+    agent = _CountingAgent("test_agent", mcp_client=_ContextClient(), config={
+        'input_validation': {'required_fields': ['name']}
+    })
+
+    result = await agent.execute_with_resilience({'name': 'good'})
+    assert result.status == AgentStatus.COMPLETED
+    assert agent.validation_runs == 1
+
+    # Called directly, execute() still validates
+    result = await agent.execute({})
+    assert result.status == AgentStatus.FAILED
+    assert result.data['errors'] == ["Required field 'name' is missing or null"]
+    assert agent.validation_runs == 2
+
 
+def test_result_objects_are_slotted():
+    """Tests that per-call result objects carry no instance dict and results are immutable."""
+    result = AgentResult(status=AgentStatus.COMPLETED, data={}, execution_time_ms=0)
 
+    assert not hasattr(result, '__dict__')
+    assert not hasattr(ValidationResult(is_valid=True), '__dict__')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.status = AgentStatus.FAILED
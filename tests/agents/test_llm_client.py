@@ -0,0 +1,416 @@
+"""
+Unit tests for the provider-agnostic LLMClient.
+
+Provider SDK calls are mocked, so no network access or real API key is needed.
+"""
+import asyncio
+import json
+import os
+
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from agents.core.llm_client import LLMClient, OpenAIClient
+
+
+def _openai_response(text="OK", prompt_tokens=6, completion_tokens=4):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    response.usage.prompt_tokens = prompt_tokens
+    response.usage.completion_tokens = completion_tokens
+    response.usage.total_tokens = prompt_tokens + completion_tokens
+    return response
+
+@pytest.fixture
+def llm_client(monkeypatch):
+    """Provides an OpenAI-backed LLMClient with both SDK clients mocked."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'temperature': 0})
+    client.client = MagicMock()
+    client.client.chat.completions.create.return_value = _openai_response()
+    client.async_client = MagicMock()
+    client.async_client.chat.completions.create = AsyncMock(return_value=_openai_response())
+    return client
+
+def test_deterministic_calls_are_cached(llm_client):
+    """Tests that a repeated temperature-0 prompt is served from the cache."""
+    first = llm_client.generate_text_sync("What is ROI?")
+    second = llm_client.generate_text_sync("What is ROI?")
+
+    assert llm_client.client.chat.completions.create.call_count == 1
+    assert second["text"] == first["text"]
+    assert second["cached"] is True
+    assert second["tokens_used"] == 0
+    assert second["cost_usd"] == 0.0
+
+def test_cache_key_includes_system_message(llm_client):
+    """Tests that a different system message is not served a cached answer."""
+    llm_client.generate_text_sync("What is ROI?", system_message="Be brief.")
+    llm_client.generate_text_sync("What is ROI?", system_message="Be thorough.")
+    assert llm_client.client.chat.completions.create.call_count == 2
+
+def test_non_deterministic_calls_bypass_cache(llm_client):
+    """Tests that sampling with temperature > 0 always reaches the provider."""
+    llm_client.temperature = 0.7
+    llm_client.generate_text_sync("What is ROI?")
+    llm_client.generate_text_sync("What is ROI?")
+    assert llm_client.client.chat.completions.create.call_count == 2
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_cache(llm_client):
+    """Tests that the native async path reads and fills the same cache."""
+    await llm_client.generate_text_async("What is ROI?")
+    cached = llm_client.generate_text_sync("What is ROI?")
+
+    assert llm_client.async_client.chat.completions.create.await_count == 1
+    llm_client.client.chat.completions.create.assert_not_called()
+    assert cached["cached"] is True
+
+def test_anthropic_long_system_message_is_cache_marked(monkeypatch):
+    """Tests that a long system prompt is sent top-level with an ephemeral cache marker."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'anthropic', 'model': 'claude-3-opus-20240229'})
+    response = MagicMock()
+    response.content = [MagicMock(text="OK")]
+    response.usage.input_tokens = 10
+    response.usage.output_tokens = 5
+    response.usage.cache_read_input_tokens = 2000
+    response.usage.cache_creation_input_tokens = 0
+    client.client = MagicMock()
+    client.client.messages.create.return_value = response
+
+    result = client.generate_text_sync("Summarize.", system_message="x" * 5000)
+
+    kwargs = client.client.messages.create.call_args.kwargs
+    assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert kwargs["messages"] == [{"role": "user", "content": "Summarize."}]
+    assert result["tokens_used"] == 2015
+    assert result["cost_usd"] == pytest.approx(client._calculate_anthropic_cost(10, 5, 2000, 0))
+
+@pytest.mark.parametrize("provider, model", [
+    ('openai', 'gpt-4'), ('openai', 'gpt-4o-mini'), ('openai', 'gpt-4o-2024-08-06'),
+    ('anthropic', 'claude-3-haiku-20240307'), ('anthropic', 'claude-3-5-sonnet-20240620'), ('anthropic', 'gpt-4o'),
+])
+def test_cost_uses_provider_list_rates(monkeypatch, provider, model):
+    """Tests that cost is billed at the provider's gpt-4o or Claude 3 Opus rates whatever the model."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': provider, 'model': model})
+
+    if provider == 'openai':
+        assert client._calculate_openai_cost(1_000_000, 1_000_000) == pytest.approx(5.00 + 15.00)
+    else:
+        assert client._calculate_anthropic_cost(1_000_000, 1_000_000) == pytest.approx(15.00 + 75.00)
+        assert client._calculate_anthropic_cost(0, 0, 1_000_000, 1_000_000) == pytest.approx(15.00 * 0.10 + 15.00 * 1.25)
+
+@pytest.mark.asyncio
+async def test_generate_text_batch_splits_marshaled_response(llm_client):
+    """Tests that several prompts share one request and map back to answers in order."""
+    llm_client.async_client.chat.completions.create = AsyncMock(
+        return_value=_openai_response("first\n<<<SEP>>>\nsecond\n<<<SEP>>>\nthird", 30, 30)
+    )
+
+    results = await llm_client.generate_text_batch(["a", "b", "c"])
+
+    assert llm_client.async_client.chat.completions.create.await_count == 1
+    assert [r["text"] for r in results] == ["first", "second", "third"]
+    assert all(r["tokens_used"] == 20 for r in results)
+
+@pytest.mark.asyncio
+async def test_generate_text_batch_falls_back_on_mismatch(llm_client):
+    """Tests that a response with the wrong number of answers is retried per prompt."""
+    llm_client.async_client.chat.completions.create = AsyncMock(return_value=_openai_response("only one answer"))
+
+    results = await llm_client.generate_text_batch(["a", "b"])
+
+    assert llm_client.async_client.chat.completions.create.await_count == 3
+    assert len(results) == 2
+
+def test_generate_text_batch_offline_openai(llm_client):
+    """Tests that an OpenAI batch job is submitted, polled and mapped back in order."""
+    llm_client.client.files.create.return_value = MagicMock(id="file-in")
+    llm_client.client.batches.create.return_value = MagicMock(id="batch-1")
+    llm_client.client.batches.retrieve.side_effect = [
+        MagicMock(id="batch-1", status="in_progress"),
+        MagicMock(id="batch-1", status="completed", output_file_id="file-out"),
+    ]
+    output = [
+        {"custom_id": f"request-{i}", "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": text}}],
+            "usage": {"prompt_tokens": 6, "completion_tokens": 4, "total_tokens": 10}
+        }}}
+        for i, text in ((1, "second"), (0, "first"))
+    ]
+    llm_client.client.files.content.return_value = MagicMock(text="\n".join(json.dumps(line) for line in output))
+
+    results = llm_client.generate_text_batch_offline(["a", "b"], poll_interval=0)
+
+    assert [r["text"] for r in results] == ["first", "second"]
+    assert results[0]["cost_usd"] == pytest.approx(llm_client._calculate_openai_cost(6, 4) / 2)
+    assert llm_client.client.batches.create.call_args.kwargs["completion_window"] == "24h"
+
+def test_retry_wait_honors_retry_after(llm_client):
+    """Tests that backoff waits at least as long as the provider's Retry-After header."""
+    error = MagicMock()
+    error.response.headers = {'retry-after': '30'}
+    assert llm_client._retry_wait_time(0, error) == 30.0
+
+    error.response.headers = {}
+    for attempt in range(3):
+        wait = llm_client._retry_wait_time(attempt, error)
+        assert llm_client.retry_delay <= wait <= llm_client.retry_delay * 3 * (2 ** attempt)
+
+def test_generate_text_stream_yields_deltas(llm_client):
+    """Tests that streaming yields content deltas and skips the trailing usage chunk."""
+    chunks = []
+    for text in ("Hel", "lo", None):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text
+        chunk.usage = None
+        chunks.append(chunk)
+    usage_chunk = MagicMock(choices=[])
+    usage_chunk.usage.prompt_tokens, usage_chunk.usage.completion_tokens, usage_chunk.usage.total_tokens = 6, 2, 8
+    chunks.append(usage_chunk)
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(chunks)
+    llm_client.client.chat.completions.create.return_value = stream
+
+    assert "".join(llm_client.generate_text_sync("Greet me", stream=True)) == "Hello"
+    assert llm_client.client.chat.completions.create.call_args.kwargs["stream"] is True
+    assert llm_client.client.chat.completions.create.call_args.kwargs["stream_options"] == {"include_usage": True}
+    stream.close.assert_called_once()
+
+def test_generate_text_stream_releases_slot_once_opened(monkeypatch):
+    """Tests that an abandoned stream neither holds its in-flight slot nor leaks the response."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'max_concurrent_requests': 1})
+    client.client = MagicMock()
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = "Hel"
+    chunk.usage = None
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([chunk, chunk])
+    client.client.chat.completions.create.return_value = stream
+
+    deltas = client.generate_text_stream("Greet me")
+    assert next(deltas) == "Hel"
+    assert client._inflight_sem.acquire(blocking=False)
+    client._inflight_sem.release()
+
+    deltas.close()
+    stream.close.assert_called_once()
+
+@pytest.mark.parametrize("api_version, expects_usage", [("2024-02-01", False), ("2024-10-21", True)])
+def test_azure_stream_options_follow_api_version(monkeypatch, api_version, expects_usage):
+    """Tests that stream_options is only sent to Azure API versions that accept it."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    monkeypatch.setenv('AZURE_OPENAI_ENDPOINT', 'https://example.openai.azure.com')
+    monkeypatch.setenv('AZURE_OPENAI_API_VERSION', api_version)
+    client = LLMClient(config={'provider': 'azure_openai', 'model': 'gpt-4o'})
+    client.client = MagicMock()
+    client.client.chat.completions.create.return_value = MagicMock()
+
+    list(client.generate_text_stream("Greet me"))
+
+    kwargs = client.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert ("stream_options" in kwargs) is expects_usage
+
+def test_mock_provider_needs_no_api_key(monkeypatch):
+    """Tests that the mock provider works offline without LLM_API_KEY."""
+    monkeypatch.delenv('LLM_API_KEY', raising=False)
+    client = LLMClient(config={'provider': 'mock', 'model': 'mock-model'})
+
+    result = client.generate_text_sync("Hello")
+
+    assert result["text"] == "Mock response for: Hello"
+    assert result["provider"] == "mock"
+    assert result["cost_usd"] == 0.0
+
+@pytest.mark.asyncio
+async def test_generate_text_forwards_keyword_overrides(llm_client):
+    """Tests that the legacy generate_text entry point forwards per-call overrides."""
+    await llm_client.generate_text("What is ROI?", temperature=0.7, max_tokens=256)
+
+    kwargs = llm_client.async_client.chat.completions.create.call_args.kwargs
+    assert kwargs["temperature"] == 0.7
+    assert kwargs["max_tokens"] == 256
+
+def test_api_key_sharding_round_robins_and_skips_throttled_keys(monkeypatch):
+    """Tests that LLM_API_KEYS spreads calls across keys and fails over on a 429."""
+    monkeypatch.setenv('LLM_API_KEYS', 'sk-one,sk-two')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'retry_delay': 0})
+    assert client.api_keys == ['sk-one', 'sk-two']
+
+    first, second = MagicMock(), MagicMock()
+    first.chat.completions.create.return_value = _openai_response("from first")
+    second.chat.completions.create.return_value = _openai_response("from second")
+    client._client_pool = [(first, None), (second, None)]
+
+    texts = {client.generate_text_sync("ping")["text"] for _ in range(2)}
+    assert texts == {"from first", "from second"}
+
+    throttled = openai.RateLimitError(
+        "rate limited",
+        response=httpx.Response(429, headers={'retry-after': '60'}, request=httpx.Request('POST', 'https://api.openai.com')),
+        body=None
+    )
+    first.chat.completions.create.side_effect = throttled
+    results = [client.generate_text_sync("ping")["text"] for _ in range(3)]
+    assert results == ["from second"] * 3
+
+def test_load_config_interpolates_env_vars(tmp_path, monkeypatch):
+    """Tests that ${VAR} and ${VAR:default} in the YAML config resolve from the environment."""
+    monkeypatch.setenv('LLM_TEST_MODEL', 'gpt-4o-mini')
+    monkeypatch.delenv('LLM_TEST_REGION', raising=False)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "globals:\n"
+        "  llm:\n"
+        "    provider: mock\n"
+        "    model: ${LLM_TEST_MODEL}\n"
+        "    region: \"${LLM_TEST_REGION:us-east}\"\n"
+    )
+
+    config = LLMClient._load_config(None, str(config_file))
+
+    assert config == {'provider': 'mock', 'model': 'gpt-4o-mini', 'region': 'us-east'}
+
+def test_load_config_skips_interpolation_without_llm_placeholders(tmp_path, monkeypatch):
+    """Tests that placeholders outside the llm section do not route it through interpolation."""
+    from agents.core import llm_client as llm_client_module
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "globals:\n"
+        "  database:\n"
+        "    host: \"${DB_HOST:localhost}\"\n"
+        "  llm:\n"
+        "    provider: mock\n"
+        "    model: gpt-4o\n"
+    )
+    interpolate = MagicMock(side_effect=llm_client_module._interpolate_env)
+    monkeypatch.setattr(llm_client_module, '_interpolate_env', interpolate)
+
+    assert LLMClient._load_config(None, str(config_file)) == {'provider': 'mock', 'model': 'gpt-4o'}
+    interpolate.assert_not_called()
+
+def test_load_config_rereads_only_when_file_changes(tmp_path):
+    """Tests that the parsed config is reused until the file's mtime changes."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("globals:\n  llm:\n    provider: mock\n    model: first\n")
+
+    first = LLMClient._load_config(None, str(config_file))
+    first['model'] = 'mutated'
+    assert LLMClient._load_config(None, str(config_file))['model'] == 'first'
+
+    config_file.write_text("globals:\n  llm:\n    provider: mock\n    model: second\n")
+    stat = os.stat(config_file)
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 5))
+    assert LLMClient._load_config(None, str(config_file))['model'] == 'second'
+
+def test_semantic_cache_serves_paraphrased_prompts(monkeypatch):
+    """Tests that a near-identical prompt embedding reuses the cached response."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'temperature': 0, 'semantic_cache': True})
+    client.client = MagicMock()
+    client.client.chat.completions.create.return_value = _openai_response("ROI is return on investment.")
+    embeddings = {
+        "What is ROI?": [1.0, 0.0, 0.0],
+        "what's ROI?": [0.999, 0.01, 0.0],
+        "Define NPV.": [0.0, 1.0, 0.0],
+    }
+    client.client.embeddings.create.side_effect = lambda model, input: MagicMock(data=[MagicMock(embedding=embeddings[input])])
+
+    client.generate_text_sync("What is ROI?")
+    paraphrased = client.generate_text_sync("what's ROI?")
+    client.generate_text_sync("Define NPV.")
+
+    assert paraphrased["cached"] is True
+    assert paraphrased["text"] == "ROI is return on investment."
+    assert client.client.chat.completions.create.call_count == 2
+
+@pytest.mark.asyncio
+async def test_semantic_cache_embedding_failure_falls_back_to_provider(monkeypatch):
+    """Tests that an embeddings error bypasses the semantic cache instead of failing generation."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'temperature': 0, 'semantic_cache': True})
+    client.client = MagicMock()
+    client.client.chat.completions.create.return_value = _openai_response("sync answer")
+    client.client.embeddings.create.side_effect = httpx.ConnectError("embeddings down")
+    client.async_client = MagicMock()
+    client.async_client.chat.completions.create = AsyncMock(return_value=_openai_response("async answer"))
+    client.async_client.embeddings.create = AsyncMock(side_effect=httpx.ConnectError("embeddings down"))
+    client._client_pool = [(client.client, client.async_client)]
+
+    assert client.generate_text_sync("What is ROI?")["text"] == "sync answer"
+    assert (await client.generate_text_async("Define NPV."))["text"] == "async answer"
+    assert client._semantic_cache._partitions == {}
+
+@pytest.mark.asyncio
+async def test_async_calls_respect_concurrency_limit(monkeypatch):
+    """Tests that no more than max_concurrent_requests async calls are in flight at once."""
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    client = LLMClient(config={'provider': 'openai', 'model': 'gpt-4o', 'temperature': 0.7, 'max_concurrent_requests': 2})
+    in_flight, peak = 0, 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _openai_response()
+
+    client.async_client = MagicMock()
+    client.async_client.chat.completions.create = create
+    client._client_pool = [(client.client, client.async_client)]
+
+    await asyncio.gather(*(client.generate_text_async(f"prompt {i}") for i in range(6)))
+
+    assert peak == 2
+
+def test_legacy_openai_client_is_shared_per_key_and_model(monkeypatch):
+    """Tests that the legacy shim reuses one instance per (api_key, model)."""
+    monkeypatch.delenv('LLM_API_KEYS', raising=False)
+    monkeypatch.setenv('LLM_API_KEY', 'sk-test')
+    monkeypatch.setattr(OpenAIClient, '_SINGLETONS', {})
+
+    first = OpenAIClient(api_key='sk-shared', model='gpt-4o-mini')
+    second = OpenAIClient(api_key='sk-shared', model='gpt-4o-mini')
+    other = OpenAIClient(api_key='sk-shared', model='gpt-4o')
+
+    assert first is second
+    assert other is not first
+    assert first.model == 'gpt-4o-mini'
+    assert all(isinstance(key[0], bytes) for key in OpenAIClient._SINGLETONS)
+
+def test_openai_client_uses_explicit_key_without_touching_environment(monkeypatch):
+    """Tests that the legacy shim uses the key it is given over LLM_API_KEYS, leaving the environment alone."""
+    monkeypatch.setenv('LLM_API_KEYS', 'sk-env-a,sk-env-b')
+    monkeypatch.setenv('LLM_API_KEY', 'sk-env')
+    monkeypatch.setattr(OpenAIClient, '_SINGLETONS', {})
+
+    explicit = OpenAIClient(api_key='sk-explicit', model='gpt-4o-mini')
+    from_env = OpenAIClient(model='gpt-4o-mini')
+
+    assert explicit.api_keys == ['sk-explicit']
+    assert explicit.client.api_key == 'sk-explicit'
+    assert from_env.api_keys == ['sk-env-a', 'sk-env-b']
+    assert os.environ['LLM_API_KEY'] == 'sk-env'
+
+@pytest.mark.asyncio
+async def test_async_context_closes_sync_and_async_pools(monkeypatch):
+    """Tests that leaving an async with block closes every connection pool the client built."""
+    monkeypatch.setenv('LLM_API_KEYS', 'sk-a,sk-b')
+
+    async with LLMClient(config={'provider': 'openai', 'model': 'gpt-4o'}) as client:
+        assert len(client._async_http_clients) == 2
+        assert not any(http_client.is_closed for http_client in client._async_http_clients)
+
+    assert all(http_client.is_closed for http_client in client._http_clients)
+    assert all(http_client.is_closed for http_client in client._async_http_clients)
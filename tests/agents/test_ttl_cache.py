@@ -0,0 +1,58 @@
+"""
+Unit tests for the shared TTLCache.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from agents.core import ttl_cache
+from agents.core.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Provides a controllable monotonic clock for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_live_entry_is_served(clock):
+    """Tests that a value set within its TTL is returned."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("bc_1", {"id": "bc_1"})
+    clock[0] += 59
+    assert cache.get("bc_1") == {"id": "bc_1"}
+
+
+def test_expired_entry_is_dropped(clock):
+    """Tests that an entry past its TTL is a miss and is removed."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("bc_1", {"id": "bc_1"})
+    clock[0] += 61
+    assert cache.get("bc_1", "miss") == "miss"
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    """Tests that reads refresh recency and the oldest entry goes past maxsize."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear(clock):
+    """Tests that pop drops one key, tolerates a missing one, and clear drops all."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0